@@ -3,6 +3,8 @@
 Provides benchmark runners and reporters for measuring:
 - Indexing throughput (docs/sec)
 - Search latency (p50, p95, p99)
+- Rank fusion latency at large fetch limits
+- PDF text normalisation throughput (ms/MB)
 - Chat response time
 - Startup time
 """
@@ -11,7 +13,9 @@ from ragd.benchmark.runner import (
     BenchmarkResult,
     BenchmarkRunner,
     BenchmarkSuite,
+    FusionBenchmark,
     IndexingBenchmark,
+    NormalisationBenchmark,
     SearchBenchmark,
     StartupBenchmark,
 )
@@ -20,7 +24,9 @@ __all__ = [
     "BenchmarkResult",
     "BenchmarkRunner",
     "BenchmarkSuite",
+    "FusionBenchmark",
     "IndexingBenchmark",
+    "NormalisationBenchmark",
     "SearchBenchmark",
     "StartupBenchmark",
 ]
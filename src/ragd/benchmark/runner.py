@@ -9,6 +9,7 @@ import gc
 import json
 import logging
 import platform
+import random
 import statistics
 import subprocess
 import sys
@@ -160,16 +161,20 @@ class SearchBenchmark:
     iterations: int = 1
 
     def run(self) -> BenchmarkResult:
-        """Run search benchmark."""
+        """Run search benchmark.
+
+        Each iteration searches all queries in one batched call, so the
+        recorded times are mean per-query latencies for each batch.
+        """
         from ragd.config import load_config
-        from ragd.embedding import get_embedder
+        from ragd.search.hybrid import HybridSearcher, SearchMode
         from ragd.storage.chromadb import ChromaStore
 
         config = load_config()
 
         try:
             store = ChromaStore(config.chroma_path)
-            embedder = get_embedder(config.embedding.model)
+            searcher = HybridSearcher(config=config)
         except Exception as e:
             logger.warning("Cannot run search benchmark: %s", e)
             return BenchmarkResult(
@@ -181,7 +186,8 @@ class SearchBenchmark:
 
         # Check if store has data
         stats = store.get_stats()
-        if stats.get("total_chunks", 0) == 0:
+        if stats.get("chunk_count", 0) == 0:
+            searcher.close()
             return BenchmarkResult(
                 name=self.name,
                 iterations=0,
@@ -195,20 +201,22 @@ class SearchBenchmark:
             for i in range(self.query_count)
         ]
 
-        times_ms: list[float] = []
+        batch_times_ms: list[float] = []
 
-        for _ in range(self.iterations):
-            for query in queries:
+        try:
+            for _ in range(self.iterations):
                 gc.collect()
                 start = time.perf_counter()
 
-                query_vec = embedder.embed([query])[0]
-                _results = store.search(query_vec, limit=5)  # noqa: F841
+                searcher.search_many(queries, limit=5, mode=SearchMode.SEMANTIC)
 
-                elapsed_ms = (time.perf_counter() - start) * 1000
-                times_ms.append(elapsed_ms)
+                batch_times_ms.append((time.perf_counter() - start) * 1000)
+        finally:
+            searcher.close()
 
-        qps = len(times_ms) / (sum(times_ms) / 1000) if times_ms else 0
+        times_ms = [batch_ms / len(queries) for batch_ms in batch_times_ms] if queries else []
+        total_s = sum(batch_times_ms) / 1000
+        qps = len(queries) * len(batch_times_ms) / total_s if total_s else 0
 
         return BenchmarkResult(
             name=self.name,
@@ -217,6 +225,139 @@ class SearchBenchmark:
             metadata={
                 "query_count": self.query_count,
                 "qps": qps,
+                "batched": True,
+            },
+        )
+
+
+@dataclass
+class FusionBenchmark:
+    """Rank fusion benchmark over synthetic hybrid result lists."""
+
+    name: str = "fusion"
+    fetch_limit: int = 3000
+    overlap: float = 0.5
+    method: str = "rrf"
+    iterations: int = 20
+
+    def run(self) -> BenchmarkResult:
+        """Run fusion benchmark.
+
+        Fuses a semantic and a keyword ranking of ``fetch_limit`` results
+        each, sharing ``overlap`` of their chunk IDs.
+        """
+        from ragd.search.fusion import FusionMethod, fuse_rankings
+
+        shared = int(self.fetch_limit * self.overlap)
+        semantic = [
+            (f"chunk_{i}", 1.0 - i / self.fetch_limit) for i in range(self.fetch_limit)
+        ]
+        keyword = [
+            (f"chunk_{i + self.fetch_limit - shared}", float(self.fetch_limit - i))
+            for i in range(self.fetch_limit)
+        ]
+        method = FusionMethod(self.method)
+
+        times_ms: list[float] = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            fuse_rankings([semantic, keyword], weights=[0.7, 0.3], method=method)
+            times_ms.append((time.perf_counter() - start) * 1000)
+
+        return BenchmarkResult(
+            name=self.name,
+            iterations=self.iterations,
+            times_ms=times_ms,
+            metadata={
+                "fetch_limit": self.fetch_limit,
+                "overlap": self.overlap,
+                "method": self.method,
+            },
+        )
+
+
+# Extraction errors mixed into synthetic PDF text
+_PDF_ERRORS = [
+    "t h e",
+    "c o m p u t e r",
+    "abig",
+    "thecomputer",
+    "problemfor",
+    "tbe",
+    "Tlie",
+    "frorn",
+    "novv",
+    "rnore",
+    "iinal",
+    "deiinition",
+]
+
+
+def _synthetic_pdf_text(size: int, seed: int) -> str:
+    """Generate PDF-like text of about ``size`` characters.
+
+    Lines of dictionary words, some broken mid-sentence, with spaced
+    letters, merged words and OCR errors mixed in.
+    """
+    from ragd.text.wordlist import COMMON_WORDS
+
+    rng = random.Random(seed)
+    vocabulary = sorted(COMMON_WORDS)
+    lines: list[str] = []
+    length = 0
+    while length < size:
+        words = [
+            rng.choice(_PDF_ERRORS) if rng.random() < 0.05 else rng.choice(vocabulary)
+            for _ in range(rng.randint(6, 14))
+        ]
+        line = " ".join(words)
+        if rng.random() < 0.4:
+            line = line.capitalize() + "."
+        lines.append(line)
+        if rng.random() < 0.1:
+            lines.append("")
+        length += len(line) + 1
+    return "\n".join(lines)[:size]
+
+
+@dataclass
+class NormalisationBenchmark:
+    """PDF text normalisation throughput benchmark."""
+
+    name: str = "normalisation"
+    size_mb: float = 1.0
+    iterations: int = 3
+    seed: int = 42
+
+    def run(self) -> BenchmarkResult:
+        """Run normalisation benchmark.
+
+        Normalises ``size_mb`` of synthetic PDF text with every fix
+        enabled and reports the time per MB. Word-level results are
+        memoised, so iterations after the first run warm.
+        """
+        from ragd.text.normalise import SourceType, TextNormaliser
+
+        text = _synthetic_pdf_text(int(self.size_mb * 1_000_000), self.seed)
+        size_mb = len(text.encode()) / 1_000_000
+        normaliser = TextNormaliser()
+
+        times_ms: list[float] = []
+        for _ in range(self.iterations):
+            gc.collect()
+            start = time.perf_counter()
+            normaliser.normalise(text, SourceType.PDF)
+            times_ms.append((time.perf_counter() - start) * 1000)
+
+        ms_per_mb = statistics.mean(times_ms) / size_mb
+        return BenchmarkResult(
+            name=self.name,
+            iterations=self.iterations,
+            times_ms=times_ms,
+            metadata={
+                "size_mb": round(size_mb, 3),
+                "ms_per_mb": ms_per_mb,
+                "mb_per_sec": 1000 / ms_per_mb,
             },
         )
 
@@ -348,6 +489,8 @@ class BenchmarkRunner:
             StartupBenchmark(),
             IndexingBenchmark(),
             SearchBenchmark(),
+            FusionBenchmark(),
+            NormalisationBenchmark(),
         ]
 
         for bench in benchmarks:
@@ -381,6 +524,20 @@ class BenchmarkRunner:
         self.suite.add_result(result)
         return result
 
+    def run_fusion(self, fetch_limit: int = 3000, method: str = "rrf") -> BenchmarkResult:
+        """Run rank fusion benchmark only."""
+        bench = FusionBenchmark(fetch_limit=fetch_limit, method=method)
+        result = bench.run()
+        self.suite.add_result(result)
+        return result
+
+    def run_normalisation(self, size_mb: float = 1.0, iterations: int = 3) -> BenchmarkResult:
+        """Run text normalisation benchmark only."""
+        bench = NormalisationBenchmark(size_mb=size_mb, iterations=iterations)
+        result = bench.run()
+        self.suite.add_result(result)
+        return result
+
     def generate_report(self) -> str:
         """Generate markdown report."""
         lines = [
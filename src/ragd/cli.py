@@ -419,6 +419,12 @@ def search(
     tag: list[str] = typer.Option(
         [], "--tag", "-t", help="Filter by tag. Can be repeated for multiple tags."
     ),
+    collection: str = typer.Option(
+        None, "--collection", help="Restrict search to a smart collection."
+    ),
+    max_tier: str = typer.Option(
+        None, "--max-tier", help="Most sensitive data tier to include (e.g. personal)."
+    ),
 ) -> None:
     """Search indexed documents with natural language.
 
@@ -442,6 +448,7 @@ def search(
     Tag filtering:
       Use --tag to filter results to documents with specific tags.
       Multiple --tag options require ALL tags to match.
+      --collection and --max-tier narrow the search further.
     """
     search_command(
         query=query,
@@ -453,6 +460,8 @@ def search(
         output_format=output_format,  # type: ignore
         no_color=no_color,
         tags=tag if tag else None,
+        collection=collection,
+        max_tier=max_tier,
     )
 
 
@@ -2487,6 +2496,7 @@ def profile_benchmark(
     - CLI startup time
     - Indexing throughput (docs/sec)
     - Search latency (p50, p95, p99)
+    - PDF text normalisation throughput (ms/MB)
 
     Examples:
         ragd profile benchmark
@@ -50,7 +50,14 @@ class EmbeddingConfig(BaseModel):
     device: str | None = None
     late_chunking: bool = False  # Use late chunking for context-aware embeddings
     late_chunking_model: str = "jinaai/jina-embeddings-v2-small-en"
+    revision: str | None = None  # Model revision (branch, tag or commit)
     max_context_tokens: int = 8192  # Maximum tokens for late chunking context
+    # Sliding windows for documents longer than max_context_tokens (v1.1)
+    late_chunking_window_overlap: int = 512  # Tokens shared by adjacent windows
+    late_chunking_window_batch: int = 2  # Windows per forward pass
+    # Cross-document micro-batching during indexing (v1.1)
+    batch_max_chunks: int = 512  # Chunks per combined encode (0 = per document)
+    batch_max_tokens: int = 65536  # Estimated tokens per combined encode
 
 
 class LLMConfig(BaseModel):
@@ -107,6 +114,14 @@ class CacheConfig(BaseModel):
 
     enabled: bool = True
     max_size_mb: int = 100
+    # Persistent embedding cache (v1.1)
+    embedding_cache: bool = True  # Reuse vectors for unchanged chunk text
+    embedding_cache_mb: int = 512  # LRU eviction above this size
+    embedding_cache_dtype: Literal["float32", "float16"] = "float32"
+    # In-memory search caches (v1.1)
+    query_cache_size: int = 256  # Fused results per searcher (0 disables)
+    query_embedding_cache_size: int = 1024  # Query vectors per searcher
+    query_cache_persist: bool = False  # Also store query vectors on disk
 
 
 class MetadataConfig(BaseModel):
@@ -191,6 +206,24 @@ class IndexingConfig(BaseModel):
     # Verbose skip reporting
     report_all_skips: bool = True  # Include all skip reasons in results
 
+    # Skip files unchanged since they were last indexed (v1.1)
+    incremental: bool = Field(
+        default=True,
+        description="Skip unchanged files using the source file manifest",
+    )
+
+    # Staged parallel pipeline (v1.1)
+    workers: int = Field(
+        default=0,
+        ge=0,
+        description="Extraction worker processes (0 = auto, 1 = sequential)",
+    )
+    queue_size: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum documents buffered between pipeline stages",
+    )
+
 
 class MemoryConfig(BaseModel):
     """Memory optimisation configuration (F-124)."""
@@ -511,6 +544,36 @@ class SearchTuningConfig(BaseModel):
         description="Minimum score to consider a chunk relevant for precision",
     )
 
+    # Concurrent retrieval legs (v1.1)
+    parallel_retrieval: bool = Field(
+        default=True,
+        description="Run semantic and keyword retrieval concurrently in hybrid search",
+    )
+    semantic_timeout_ms: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Semantic leg timeout before falling back to keyword results (0 = none). "
+            "Timed-out legs finish in the background; while half the search threads "
+            "are held by them, searches skip the semantic leg"
+        ),
+    )
+    keyword_timeout_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Keyword leg timeout before falling back to semantic results (0 = none)",
+    )
+
+    # Rank fusion (v1.1)
+    fusion_method: Literal["rrf", "combsum", "combmnz"] = Field(
+        default="rrf",
+        description="How hybrid search combines rankings: weighted RRF, CombSUM or CombMNZ",
+    )
+    score_normalisation: Literal["minmax", "zscore", "none"] = Field(
+        default="minmax",
+        description="Per-leg score normalisation for CombSUM and CombMNZ",
+    )
+
 
 class ProcessingConfig(BaseModel):
     """Processing parameters for text handling.
@@ -1,5 +1,6 @@
 """Embedding generation for ragd."""
 
+from ragd.embedding.cache import EmbeddingCache, get_embedding_cache
 from ragd.embedding.embedder import (
     Embedder,
     SentenceTransformerEmbedder,
@@ -12,7 +13,9 @@ from ragd.embedding.late_chunking import (
     LateChunkingEmbedder,
     check_late_chunking_available,
     create_late_chunking_embedder,
+    get_late_chunking_embedder,
 )
+from ragd.embedding.registry import ModelRegistry, get_model_registry
 
 __all__ = [
     "Embedder",
@@ -24,4 +27,9 @@ __all__ = [
     "LateChunkingEmbedder",
     "check_late_chunking_available",
     "create_late_chunking_embedder",
+    "get_late_chunking_embedder",
+    "ModelRegistry",
+    "get_model_registry",
+    "EmbeddingCache",
+    "get_embedding_cache",
 ]
@@ -0,0 +1,118 @@
+"""Cross-document embedding micro-batching.
+
+Indexing many small documents otherwise produces one tiny ``embed`` call
+per document. The accumulator gathers chunk texts from many documents up
+to a count/token budget, encodes them length-sorted in a single call, and
+scatters the vectors back to the document that owns them.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from ragd.embedding.embedder import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingTexts:
+    """Texts queued for one document."""
+
+    key: Hashable
+    texts: list[str]
+    offset: int  # Position of the first text in the flat batch
+
+
+class EmbeddingAccumulator:
+    """Accumulate chunk texts across documents and embed them together.
+
+    Example:
+        >>> acc = EmbeddingAccumulator(embedder, max_texts=256)
+        >>> acc.add("doc_a", ["chunk one", "chunk two"])
+        >>> acc.add("doc_b", ["another chunk"])
+        >>> vectors = acc.flush()  # {"doc_a": [[...], [...]], "doc_b": [[...]]}
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        max_texts: int = 512,
+        max_tokens: int = 65536,
+        chars_per_token: int = 4,
+    ) -> None:
+        """Initialise the accumulator.
+
+        Args:
+            embedder: Embedder used for each flush
+            max_texts: Flush once this many texts are queued
+            max_tokens: Flush once this many (estimated) tokens are queued
+            chars_per_token: Characters per token for the token estimate
+        """
+        self.embedder = embedder
+        self.max_texts = max_texts
+        self.max_tokens = max_tokens
+        self.chars_per_token = chars_per_token
+        self._pending: list[_PendingTexts] = []
+        self._texts: list[str] = []
+        self._tokens = 0
+
+    def add(self, key: Hashable, texts: list[str]) -> None:
+        """Queue a document's texts for the next flush.
+
+        Args:
+            key: Identifier returned with the document's vectors on flush
+            texts: Texts to embed for this document
+        """
+        self._pending.append(_PendingTexts(key=key, texts=texts, offset=len(self._texts)))
+        self._texts.extend(texts)
+        self._tokens += sum(self._estimate_tokens(t) for t in texts)
+
+    def is_full(self) -> bool:
+        """Check whether the batch has reached its count or token budget."""
+        return len(self._texts) >= self.max_texts or self._tokens >= self.max_tokens
+
+    def __len__(self) -> int:
+        """Return the number of documents waiting to be embedded."""
+        return len(self._pending)
+
+    def flush(self) -> dict[Hashable, list[list[float]]]:
+        """Embed all queued texts in one call and return vectors per document.
+
+        Returns:
+            Mapping of document key to its embedding vectors, in the order
+            the texts were added
+        """
+        if not self._pending:
+            return {}
+
+        texts = self._texts
+        # Length-sort so each model sub-batch pads to similar lengths
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        sorted_vectors = self.embedder.embed([texts[i] for i in order]) if texts else []
+
+        vectors: list[list[float]] = [[] for _ in texts]
+        for position, original_index in enumerate(order):
+            vectors[original_index] = sorted_vectors[position]
+
+        logger.debug(
+            "Embedded %d texts from %d documents in one batch",
+            len(texts),
+            len(self._pending),
+        )
+
+        results = {
+            pending.key: vectors[pending.offset : pending.offset + len(pending.texts)]
+            for pending in self._pending
+        }
+
+        self._pending = []
+        self._texts = []
+        self._tokens = 0
+        return results
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the token count of a text from its length."""
+        return max(1, len(text) // max(1, self.chars_per_token))
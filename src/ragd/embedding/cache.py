@@ -0,0 +1,347 @@
+"""Persistent content-addressed embedding cache.
+
+Stores embedding vectors on disk keyed by (model name, model revision,
+normalised text hash) so that re-indexing unchanged chunks does not run
+the model again. Vectors are stored as compact float32 or float16 blobs
+in SQLite, with least-recently-used eviction once the cache exceeds its
+size budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ragd.config import RagdConfig
+
+logger = logging.getLogger(__name__)
+
+CacheDType = Literal["float32", "float16"]
+
+# Fraction of the size budget to shrink to when evicting
+_EVICT_TARGET = 0.9
+
+# SQLite limits bound parameters per statement; look keys up in slices
+_LOOKUP_BATCH = 500
+
+
+def normalise_cache_text(text: str) -> str:
+    """Normalise text so trivially different whitespace shares an entry.
+
+    Args:
+        text: Text to normalise
+
+    Returns:
+        NFC-normalised text with whitespace runs collapsed
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def text_hash(text: str) -> str:
+    """Hash normalised text for use as a cache key.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex SHA-256 digest of the normalised text
+    """
+    return hashlib.sha256(normalise_cache_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk embedding cache with LRU eviction.
+
+    Entries are namespaced by model so vectors from different models or
+    revisions never mix. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_size_mb: int = 512,
+        dtype: CacheDType = "float32",
+    ) -> None:
+        """Initialise the embedding cache.
+
+        Args:
+            db_path: Path to SQLite database file
+            max_size_mb: Maximum total size of stored vectors in MB
+            dtype: Storage precision for vectors
+        """
+        self.db_path = db_path
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.dtype = dtype
+        self._np_dtype = np.float16 if dtype == "float16" else np.float32
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()[0]
+
+    def _create_tables(self) -> None:
+        """Create cache table if not exists."""
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                namespace TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dtype TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (namespace, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def namespace(model_name: str, revision: str | None = None, variant: str = "") -> str:
+        """Build the namespace for a model's entries.
+
+        Args:
+            model_name: Embedding model name
+            revision: Model revision (None = default branch)
+            variant: Extra qualifier for embeddings that depend on more than
+                the model, e.g. late chunking context length
+
+        Returns:
+            Namespace string
+        """
+        parts = [model_name, revision or "main"]
+        if variant:
+            parts.append(variant)
+        return "|".join(parts)
+
+    def get_many(self, namespace: str, keys: list[str]) -> list[list[float] | None]:
+        """Look up cached vectors.
+
+        Args:
+            namespace: Model namespace from :meth:`namespace`
+            keys: Text hashes to look up
+
+        Returns:
+            Vector for each key, or None where the key is not cached
+        """
+        if not keys:
+            return []
+
+        found: dict[str, list[float]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._lock:
+            for i in range(0, len(unique_keys), _LOOKUP_BATCH):
+                batch = unique_keys[i : i + _LOOKUP_BATCH]
+                placeholders = ",".join("?" for _ in batch)
+                rows = self._conn.execute(
+                    f"""
+                    SELECT text_hash, dtype, vector FROM embeddings
+                    WHERE namespace = ? AND text_hash IN ({placeholders})
+                    """,
+                    (namespace, *batch),
+                ).fetchall()
+                for key, dtype, blob in rows:
+                    np_dtype = np.float16 if dtype == "float16" else np.float32
+                    found[key] = np.frombuffer(blob, dtype=np_dtype).astype(np.float32).tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE namespace = ? AND text_hash = ?",
+                    [(now, namespace, key) for key in found],
+                )
+                self._conn.commit()
+
+        return [found.get(key) for key in keys]
+
+    def put_many(
+        self,
+        namespace: str,
+        keys: list[str],
+        vectors: list[list[float]],
+    ) -> None:
+        """Store vectors, evicting least recently used entries if needed.
+
+        Args:
+            namespace: Model namespace from :meth:`namespace`
+            keys: Text hashes
+            vectors: Vector for each key
+        """
+        if not keys:
+            return
+
+        now = time.time()
+        rows = []
+        added_bytes = 0
+        for key, vector in zip(keys, vectors, strict=True):
+            blob = np.asarray(vector, dtype=self._np_dtype).tobytes()
+            added_bytes += len(blob)
+            rows.append((namespace, key, self.dtype, blob, now))
+
+        with self._lock:
+            # Replaced entries are counted twice until the next eviction
+            # recount, which errs on the side of evicting early
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings
+                    (namespace, text_hash, dtype, vector, last_used)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._conn.commit()
+            self._total_bytes += added_bytes
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under budget.
+
+        Caller must hold the lock.
+        """
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()[0]
+        target = int(self.max_bytes * _EVICT_TARGET)
+        if self._total_bytes <= target:
+            return
+
+        to_free = self._total_bytes - target
+        freed = 0
+        evict: list[tuple[str, str]] = []
+        cursor = self._conn.execute(
+            "SELECT namespace, text_hash, LENGTH(vector) FROM embeddings ORDER BY last_used"
+        )
+        for namespace, key, size in cursor:
+            evict.append((namespace, key))
+            freed += size
+            if freed >= to_free:
+                break
+
+        self._conn.executemany(
+            "DELETE FROM embeddings WHERE namespace = ? AND text_hash = ?",
+            evict,
+        )
+        self._conn.commit()
+        self._total_bytes -= freed
+        logger.debug("Evicted %d cached embeddings (%d bytes)", len(evict), freed)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size and budget
+        """
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            "entries": count,
+            "size_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "dtype": self.dtype,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> EmbeddingCache:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def embed_with_cache(
+    cache: EmbeddingCache,
+    namespace: str,
+    texts: list[str],
+    embed_fn: Callable[[list[str]], list[list[float]]],
+) -> list[list[float]]:
+    """Embed texts, running ``embed_fn`` only for cache misses.
+
+    Args:
+        cache: Embedding cache
+        namespace: Model namespace
+        texts: Texts to embed
+        embed_fn: Function that embeds a list of texts
+
+    Returns:
+        One vector per text, in input order
+    """
+    keys = [text_hash(t) for t in texts]
+    cached = cache.get_many(namespace, keys)
+    missing = [i for i, vector in enumerate(cached) if vector is None]
+
+    if missing:
+        # Embed each distinct missing text once
+        first_index: dict[str, int] = {}
+        for i in missing:
+            first_index.setdefault(keys[i], i)
+        to_embed = list(first_index.values())
+        new_vectors = embed_fn([texts[i] for i in to_embed])
+        cache.put_many(namespace, [keys[i] for i in to_embed], new_vectors)
+        by_key = {keys[i]: v for i, v in zip(to_embed, new_vectors, strict=True)}
+        for i in missing:
+            cached[i] = by_key[keys[i]]
+
+    logger.debug("Embedding cache: %d hits, %d misses", len(texts) - len(missing), len(missing))
+    return cached  # type: ignore[return-value]
+
+
+# Process-wide caches keyed by database path
+_caches: dict[Path, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(config: RagdConfig) -> EmbeddingCache | None:
+    """Get the shared embedding cache for a configuration.
+
+    Args:
+        config: Configuration
+
+    Returns:
+        EmbeddingCache, or None if the cache is disabled
+    """
+    if not (config.cache.enabled and config.cache.embedding_cache):
+        return None
+
+    db_path = config.storage.data_dir / "cache" / "embeddings.db"
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = EmbeddingCache(
+                db_path,
+                max_size_mb=config.cache.embedding_cache_mb,
+                dtype=config.cache.embedding_cache_dtype,  # type: ignore[arg-type]
+            )
+            _caches[db_path] = cache
+        return cache
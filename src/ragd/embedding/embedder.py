@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+    from ragd.embedding.cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +59,8 @@ class SentenceTransformerEmbedder:
         model_name: str = "all-MiniLM-L6-v2",
         device: str | None = None,
         batch_size: int = 32,
+        revision: str | None = None,
+        cache: EmbeddingCache | None = None,
     ) -> None:
         """Initialise sentence transformer embedder.
 
@@ -64,11 +68,17 @@ class SentenceTransformerEmbedder:
             model_name: Name of the sentence-transformers model
             device: Device to use (cuda, mps, cpu, or None for auto)
             batch_size: Batch size for embedding
+            revision: Model revision (branch, tag or commit; None = default)
+            cache: Optional persistent embedding cache
         """
         self._model_name = model_name
         self._batch_size = batch_size
         self._model: SentenceTransformer | None = None
         self._device = device
+        self._revision = revision
+        self._cache = cache
+        # Embedder whose model this one shares (see with_cache)
+        self._owner: SentenceTransformerEmbedder | None = None
 
     def _ensure_model(self) -> SentenceTransformer:
         """Lazy load the model.
@@ -76,18 +86,54 @@ class SentenceTransformerEmbedder:
         Returns:
             Loaded SentenceTransformer model
         """
+        if self._owner is not None:
+            return self._owner._ensure_model()
         if self._model is None:
             # Lazy import - sentence_transformers is heavy (~1-2 seconds first time)
             logger.info("Loading embedding model: %s...", self._model_name)
             from sentence_transformers import SentenceTransformer
 
-            self._model = SentenceTransformer(self._model_name, device=self._device)
+            self._model = SentenceTransformer(
+                self._model_name, device=self._device, revision=self._revision
+            )
             logger.info("Embedding model loaded")
         return self._model
 
+    def set_cache(self, cache: EmbeddingCache | None) -> None:
+        """Attach (or detach) a persistent embedding cache.
+
+        Args:
+            cache: Cache to consult before running the model, or None
+        """
+        self._cache = cache
+
+    def with_cache(self, cache: EmbeddingCache | None) -> SentenceTransformerEmbedder:
+        """Return an embedder that shares this one's model but has its own cache.
+
+        The cache applies only to calls made through the returned embedder,
+        so other users of this instance are unaffected.
+
+        Args:
+            cache: Cache for the returned embedder, or None
+
+        Returns:
+            Embedder sharing the (lazily loaded) model
+        """
+        view = SentenceTransformerEmbedder(
+            model_name=self._model_name,
+            device=self._device,
+            batch_size=self._batch_size,
+            revision=self._revision,
+            cache=cache,
+        )
+        view._owner = self._owner or self
+        return view
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for texts.
 
+        Texts already in the embedding cache (if attached) are not re-encoded.
+
         Args:
             texts: List of texts to embed
 
@@ -97,6 +143,23 @@ class SentenceTransformerEmbedder:
         if not texts:
             return []
 
+        if self._cache is not None:
+            from ragd.embedding.cache import EmbeddingCache, embed_with_cache
+
+            namespace = EmbeddingCache.namespace(self._model_name, self._revision)
+            return embed_with_cache(self._cache, namespace, texts, self._encode)
+
+        return self._encode(texts)
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        """Run the model over texts.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors as lists of floats
+        """
         model = self._ensure_model()
         embeddings = model.encode(
             texts,
@@ -133,12 +196,19 @@ class SentenceTransformerEmbedder:
         """Return model name."""
         return self._model_name
 
+    @property
+    def revision(self) -> str | None:
+        """Return model revision (None = default branch)."""
+        return self._revision
+
     def is_loaded(self) -> bool:
         """Check if model is loaded.
 
         Returns:
             True if model is loaded
         """
+        if self._owner is not None:
+            return self._owner.is_loaded()
         return self._model is not None
 
 
@@ -150,6 +220,8 @@ def get_embedder(
     model_name: str = "all-MiniLM-L6-v2",
     device: str | None = None,
     batch_size: int = 32,
+    revision: str | None = None,
+    cache: EmbeddingCache | None = None,
 ) -> SentenceTransformerEmbedder:
     """Get or create an embedder instance.
 
@@ -157,19 +229,30 @@ def get_embedder(
         model_name: Model name to use
         device: Device to use
         batch_size: Batch size
+        revision: Model revision (branch, tag or commit; None = default)
+        cache: Optional persistent embedding cache, used only by the
+            returned embedder (the shared instance never holds one)
 
     Returns:
         Embedder instance
     """
     global _embedder
 
-    if _embedder is None or _embedder.model_name != model_name:
+    if (
+        _embedder is None
+        or _embedder.model_name != model_name
+        or _embedder.revision != revision
+    ):
         _embedder = SentenceTransformerEmbedder(
             model_name=model_name,
             device=device,
             batch_size=batch_size,
+            revision=revision,
         )
 
+    if cache is not None:
+        return _embedder.with_cache(cache)
+
     return _embedder
 
 
@@ -4,13 +4,24 @@ Implements late chunking technique where the full document is encoded through
 the transformer, then embeddings are extracted at chunk boundaries. This gives
 each chunk access to bidirectional attention over the full document context.
 
+Documents longer than the model context are encoded as overlapping
+macro-windows; each chunk is pooled from the window that best contains it.
+
 Reference: https://jina.ai/news/late-chunking-in-long-context-embedding-models
 """
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ragd.embedding.cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -28,6 +39,105 @@ class ChunkBoundary:
     content: str
 
 
+def map_char_spans_to_tokens(
+    offset_mapping: list[tuple[int, int]],
+    char_starts: list[int],
+    char_ends: list[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map character spans to token spans by binary search.
+
+    A span starts at the first token ending after its start character and
+    ends after the last token starting before its end character. Tokens
+    with a (0, 0) offset are special tokens and are ignored. Spans with no
+    matching token fall back to the full sequence.
+
+    Args:
+        offset_mapping: (start_char, end_char) for each token, in order
+        char_starts: Start character offset of each span
+        char_ends: End character offset of each span
+
+    Returns:
+        Tuple of (start_token, end_token) arrays, one entry per span
+    """
+    num_tokens = len(offset_mapping)
+    offsets = np.asarray(offset_mapping, dtype=np.int64).reshape(-1, 2)
+    real = np.flatnonzero((offsets[:, 0] != 0) | (offsets[:, 1] != 0))
+    if len(real) == 0:
+        return (
+            np.zeros(len(char_starts), dtype=np.int64),
+            np.full(len(char_ends), num_tokens, dtype=np.int64),
+        )
+    tok_starts = offsets[real, 0]
+    tok_ends = offsets[real, 1]
+
+    starts = np.searchsorted(tok_ends, np.asarray(char_starts, dtype=np.int64), side="right")
+    ends = np.searchsorted(tok_starts, np.asarray(char_ends, dtype=np.int64), side="left")
+
+    # Translate positions among real tokens back to sequence indices
+    found_start = starts < len(real)
+    found_end = ends > 0
+    start_tokens = np.where(found_start, real[np.minimum(starts, len(real) - 1)], 0)
+    end_tokens = np.where(found_end, real[np.maximum(ends - 1, 0)] + 1, num_tokens)
+    return start_tokens, end_tokens
+
+
+def plan_windows(num_tokens: int, window_size: int, overlap: int) -> list[tuple[int, int]]:
+    """Split a token sequence into overlapping windows.
+
+    The final window is aligned to the end of the sequence so that it is
+    full length and gives trailing chunks as much context as possible.
+
+    Args:
+        num_tokens: Number of tokens in the document
+        window_size: Maximum tokens per window
+        overlap: Tokens shared by consecutive windows
+
+    Returns:
+        List of (start_token, end_token) windows covering the sequence
+    """
+    if num_tokens <= window_size:
+        return [(0, num_tokens)]
+
+    stride = max(1, window_size - overlap)
+    windows = []
+    start = 0
+    while start + window_size < num_tokens:
+        windows.append((start, start + window_size))
+        start += stride
+    windows.append((num_tokens - window_size, num_tokens))
+    return windows
+
+
+def assign_windows(
+    token_boundaries: list[tuple[int, int]],
+    windows: list[tuple[int, int]],
+) -> list[int]:
+    """Choose the window each chunk should be pooled from.
+
+    Prefers the window covering most of the chunk, then the one where the
+    chunk sits furthest from either edge (most surrounding context).
+
+    Args:
+        token_boundaries: (start_token, end_token) for each chunk
+        windows: Windows from :func:`plan_windows`
+
+    Returns:
+        Index into ``windows`` for each chunk
+    """
+    assignment = []
+    for start, end in token_boundaries:
+        best = 0
+        best_score = (-1, -1)
+        for i, (w_start, w_end) in enumerate(windows):
+            covered = min(end, w_end) - max(start, w_start)
+            margin = min(start - w_start, w_end - end)
+            score = (covered, margin)
+            if score > best_score:
+                best, best_score = i, score
+        assignment.append(best)
+    return assignment
+
+
 class LateChunkingEmbedder:
     """Embedder using late chunking for context-aware embeddings.
 
@@ -37,11 +147,19 @@ class LateChunkingEmbedder:
     3. Extracts embeddings by pooling over each chunk's token range
 
     This preserves full document context in each chunk's embedding.
+    Documents longer than ``max_context_tokens`` are encoded in overlapping
+    windows, batched through the model together.
     """
 
     # Default maximum tokens (can be overridden via config)
     DEFAULT_MAX_CONTEXT_TOKENS = 8192
 
+    # Default tokens shared by consecutive windows on long documents
+    DEFAULT_WINDOW_OVERLAP = 512
+
+    # Default number of windows per forward pass
+    DEFAULT_WINDOW_BATCH_SIZE = 2
+
     # Models known to support long contexts
     LONG_CONTEXT_MODELS = {
         "jinaai/jina-embeddings-v2-base-en": 8192,
@@ -56,6 +174,10 @@ class LateChunkingEmbedder:
         device: str | None = None,
         trust_remote_code: bool = True,
         max_context_tokens: int | None = None,
+        revision: str | None = None,
+        cache: EmbeddingCache | None = None,
+        window_overlap: int | None = None,
+        window_batch_size: int | None = None,
     ) -> None:
         """Initialise late chunking embedder.
 
@@ -63,17 +185,35 @@ class LateChunkingEmbedder:
             model_name: Hugging Face model name (should support long contexts)
             device: Device to use (cuda, mps, cpu, or None for auto)
             trust_remote_code: Whether to trust remote code for models
-            max_context_tokens: Maximum tokens to process (from config)
+            max_context_tokens: Maximum tokens per forward pass (from config)
+            revision: Model revision (branch, tag or commit; None = default)
+            cache: Optional persistent embedding cache
+            window_overlap: Tokens shared by consecutive windows on documents
+                longer than the context
+            window_batch_size: Windows encoded per forward pass
         """
         self._model_name = model_name
         self._device = device
         self._trust_remote_code = trust_remote_code
         self._max_context_tokens = max_context_tokens or self.DEFAULT_MAX_CONTEXT_TOKENS
+        self._window_overlap = (
+            self.DEFAULT_WINDOW_OVERLAP if window_overlap is None else window_overlap
+        )
+        self._window_batch_size = max(1, window_batch_size or self.DEFAULT_WINDOW_BATCH_SIZE)
+        self._revision = revision
+        self._cache = cache
         self._model: Any = None
         self._tokenizer: Any = None
+        # Embedder whose model this one shares (see with_cache)
+        self._owner: LateChunkingEmbedder | None = None
 
     def _ensure_model(self) -> None:
         """Lazy load the model and tokenizer."""
+        if self._owner is not None:
+            self._owner._ensure_model()
+            self._model = self._owner._model
+            self._tokenizer = self._owner._tokenizer
+            return
         if self._model is not None:
             return
 
@@ -84,11 +224,13 @@ class LateChunkingEmbedder:
             self._tokenizer = AutoTokenizer.from_pretrained(
                 self._model_name,
                 trust_remote_code=self._trust_remote_code,
+                revision=self._revision,
             )
 
             self._model = AutoModel.from_pretrained(
                 self._model_name,
                 trust_remote_code=self._trust_remote_code,
+                revision=self._revision,
             )
 
             # Move to device
@@ -107,61 +249,52 @@ class LateChunkingEmbedder:
                 "Install with: pip install transformers torch"
             ) from e
 
-    def _char_to_token_boundaries(
-        self,
-        text: str,
-        chunks: list[ChunkBoundary],
-    ) -> list[tuple[int, int]]:
-        """Map chunk character boundaries to token boundaries.
+    def _tokenise(self, text: str) -> tuple[list[int], list[tuple[int, int]]]:
+        """Tokenise a whole document without special tokens or truncation.
 
         Args:
             text: Full document text
-            chunks: List of chunk boundaries
 
         Returns:
-            List of (start_token, end_token) tuples for each chunk
+            Tuple of (token ids, character offset of each token)
         """
         self._ensure_model()
 
-        # Tokenise with offset mapping
         encoding = self._tokenizer(
             text,
-            return_tensors="pt",
+            add_special_tokens=False,
             return_offsets_mapping=True,
-            truncation=True,
-            max_length=self._max_context_tokens,
+            truncation=False,
+            verbose=False,
         )
+        return list(encoding["input_ids"]), [tuple(o) for o in encoding["offset_mapping"]]
 
-        offset_mapping = encoding["offset_mapping"][0].tolist()
-        token_boundaries = []
-
-        for chunk in chunks:
-            # Find first token that overlaps with chunk start
-            start_token = None
-            end_token = None
-
-            for i, (tok_start, tok_end) in enumerate(offset_mapping):
-                # Skip special tokens (offset 0,0)
-                if tok_start == tok_end == 0:
-                    continue
-
-                # Found start token
-                if start_token is None and tok_end > chunk.start:
-                    start_token = i
-
-                # Found end token
-                if tok_start < chunk.end:
-                    end_token = i + 1
+    def _char_to_token_boundaries(
+        self,
+        text: str,
+        chunks: list[ChunkBoundary],
+        offset_mapping: list[tuple[int, int]] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Map chunk character boundaries to token boundaries.
 
-            # Default to full sequence if boundaries not found
-            if start_token is None:
-                start_token = 0
-            if end_token is None:
-                end_token = len(offset_mapping)
+        Args:
+            text: Full document text
+            chunks: List of chunk boundaries
+            offset_mapping: Token offsets from :meth:`_tokenise` (computed if None)
 
-            token_boundaries.append((start_token, end_token))
+        Returns:
+            List of (start_token, end_token) tuples for each chunk, indexing
+            the document's tokens without special tokens
+        """
+        if offset_mapping is None:
+            _, offset_mapping = self._tokenise(text)
 
-        return token_boundaries
+        starts, ends = map_char_spans_to_tokens(
+            offset_mapping,
+            [chunk.start for chunk in chunks],
+            [chunk.end for chunk in chunks],
+        )
+        return list(zip(starts.tolist(), ends.tolist(), strict=True))
 
     def embed_document_chunks(
         self,
@@ -171,7 +304,8 @@ class LateChunkingEmbedder:
         """Generate embeddings for chunks using late chunking.
 
         Encodes the full document once, then extracts embeddings for each chunk
-        by pooling over the chunk's token range.
+        by pooling over the chunk's token range. If a cache is attached and
+        every chunk of this exact document is cached, the model is not run.
 
         Args:
             full_text: The complete document text
@@ -183,50 +317,133 @@ class LateChunkingEmbedder:
         if not chunks:
             return []
 
+        if self._cache is None:
+            return self._embed_document_chunks(full_text, chunks)
+
+        # Late chunk vectors depend on the whole document, not just the chunk
+        # text, so key them by document hash plus chunk span and content
+        from ragd.embedding.cache import text_hash
+
+        namespace = self._cache_namespace("late")
+        doc_hash = text_hash(full_text)
+        keys = [
+            text_hash(f"{doc_hash}:{chunk.start}:{chunk.end}:{chunk.content}")
+            for chunk in chunks
+        ]
+        cached = self._cache.get_many(namespace, keys)
+        if all(vector is not None for vector in cached):
+            return cached  # type: ignore[return-value]
+
+        embeddings = self._embed_document_chunks(full_text, chunks)
+        self._cache.put_many(namespace, keys, embeddings)
+        return embeddings
+
+    def _embed_document_chunks(
+        self,
+        full_text: str,
+        chunks: list[ChunkBoundary],
+    ) -> list[list[float]]:
+        """Run the model over a document and pool chunk embeddings.
+
+        Documents that fit the context are encoded in a single window.
+        Longer documents are split into overlapping windows, encoded in
+        batches of ``window_batch_size``.
+
+        Args:
+            full_text: The complete document text
+            chunks: List of chunk boundaries
+
+        Returns:
+            List of embedding vectors, one per chunk
+        """
         import torch
 
         self._ensure_model()
 
-        # Get token boundaries for each chunk
-        token_boundaries = self._char_to_token_boundaries(full_text, chunks)
-
-        # Encode full document
-        inputs = self._tokenizer(
-            full_text,
-            return_tensors="pt",
-            truncation=True,
-            max_length=self._max_context_tokens,
-            padding=True,
-        )
+        input_ids, offset_mapping = self._tokenise(full_text)
+        token_boundaries = self._char_to_token_boundaries(full_text, chunks, offset_mapping)
+
+        window_size = max(1, self._max_context_tokens - self._tokenizer.num_special_tokens_to_add())
+        windows = plan_windows(len(input_ids), window_size, self._window_overlap)
+        if len(windows) > 1:
+            logger.debug(
+                "Late chunking %d tokens in %d windows of %d",
+                len(input_ids),
+                len(windows),
+                window_size,
+            )
 
-        # Move to same device as model
-        device = next(self._model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        assignment = assign_windows(token_boundaries, windows)
+        chunks_by_window: dict[int, list[int]] = {}
+        for chunk_index, window_index in enumerate(assignment):
+            chunks_by_window.setdefault(window_index, []).append(chunk_index)
 
-        # Get hidden states from model
-        with torch.no_grad():
-            outputs = self._model(**inputs)
+        # Only windows that own at least one chunk need encoding
+        needed = sorted(chunks_by_window)
+        embeddings: list[list[float]] = [[] for _ in chunks]
 
-        # Extract last hidden state [batch, seq_len, hidden_dim]
-        hidden_states = outputs.last_hidden_state[0]  # Remove batch dimension
+        for batch_start in range(0, len(needed), self._window_batch_size):
+            batch = needed[batch_start : batch_start + self._window_batch_size]
+            hidden_states, prefixes = self._encode_windows(
+                [input_ids[start:end] for start, end in (windows[w] for w in batch)]
+            )
 
-        # Extract embeddings for each chunk by mean pooling
-        embeddings = []
-        for start_token, end_token in token_boundaries:
-            # Ensure valid boundaries
-            start_token = max(0, min(start_token, hidden_states.shape[0] - 1))
-            end_token = max(start_token + 1, min(end_token, hidden_states.shape[0]))
+            for row, window_index in enumerate(batch):
+                w_start, w_end = windows[window_index]
+                chunk_indices = chunks_by_window[window_index]
+                length = max(1, prefixes[row] + (w_end - w_start))
 
-            # Mean pool over chunk tokens
-            chunk_embedding = hidden_states[start_token:end_token].mean(dim=0)
+                # Clip to the window and shift past leading special tokens
+                spans = np.asarray([token_boundaries[i] for i in chunk_indices], dtype=np.int64)
+                starts = np.clip(spans[:, 0], w_start, w_end) - w_start + prefixes[row]
+                ends = np.clip(spans[:, 1], w_start, w_end) - w_start + prefixes[row]
+                starts = np.clip(starts, 0, length - 1)
+                ends = np.clip(ends, starts + 1, length)
 
-            # Normalise
-            chunk_embedding = torch.nn.functional.normalize(chunk_embedding, dim=0)
+                pooled = _segment_mean(hidden_states[row, :length], starts, ends)
+                pooled = torch.nn.functional.normalize(pooled, dim=1)
 
-            embeddings.append(chunk_embedding.cpu().numpy().tolist())
+                for chunk_index, vector in zip(
+                    chunk_indices, pooled.cpu().numpy().tolist(), strict=True
+                ):
+                    embeddings[chunk_index] = vector
 
         return embeddings
 
+    def _encode_windows(self, windows: list[list[int]]) -> tuple[Any, list[int]]:
+        """Encode token windows in one padded forward pass.
+
+        Args:
+            windows: Token ids for each window, without special tokens
+
+        Returns:
+            Tuple of (last hidden states [batch, seq_len, hidden_dim],
+            number of leading special tokens in each row)
+        """
+        import torch
+
+        features = []
+        prefixes = []
+        for ids in windows:
+            with_special = self._tokenizer.build_inputs_with_special_tokens(ids)
+            mask = self._tokenizer.get_special_tokens_mask(
+                with_special, already_has_special_tokens=True
+            )
+            prefix = next((i for i, special in enumerate(mask) if not special), 0)
+            features.append({"input_ids": with_special})
+            prefixes.append(prefix)
+
+        inputs = self._tokenizer.pad(features, padding=True, return_tensors="pt")
+
+        # Move to same device as model
+        device = next(self._model.parameters()).device
+        inputs = {k: v.to(device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            outputs = self._model(**inputs)
+
+        return outputs.last_hidden_state, prefixes
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for independent texts (fallback mode).
 
@@ -242,6 +459,24 @@ class LateChunkingEmbedder:
         if not texts:
             return []
 
+        if self._cache is not None:
+            from ragd.embedding.cache import embed_with_cache
+
+            return embed_with_cache(
+                self._cache, self._cache_namespace("text"), texts, self._embed_texts
+            )
+
+        return self._embed_texts(texts)
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Run the model over each text independently.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
         import torch
 
         self._ensure_model()
@@ -269,6 +504,69 @@ class LateChunkingEmbedder:
 
         return embeddings
 
+    def set_cache(self, cache: EmbeddingCache | None) -> None:
+        """Attach (or detach) a persistent embedding cache.
+
+        Args:
+            cache: Cache to consult before running the model, or None
+        """
+        self._cache = cache
+
+    def with_cache(self, cache: EmbeddingCache | None) -> LateChunkingEmbedder:
+        """Return an embedder that shares this one's model but has its own cache.
+
+        The cache applies only to calls made through the returned embedder,
+        so other users of this instance are unaffected.
+
+        Args:
+            cache: Cache for the returned embedder, or None
+
+        Returns:
+            Embedder sharing the (lazily loaded) model and tokenizer
+        """
+        view = LateChunkingEmbedder(
+            model_name=self._model_name,
+            device=self._device,
+            trust_remote_code=self._trust_remote_code,
+            max_context_tokens=self._max_context_tokens,
+            revision=self._revision,
+            cache=cache,
+            window_overlap=self._window_overlap,
+            window_batch_size=self._window_batch_size,
+        )
+        view._owner = self._owner or self
+        return view
+
+    def unload(self) -> None:
+        """Free the model and tokenizer; they reload on next use."""
+        if self._model is None:
+            return
+        from ragd.embedding.registry import release_torch_memory
+
+        self._model = None
+        self._tokenizer = None
+        release_torch_memory()
+
+    def is_loaded(self) -> bool:
+        """Check if model is loaded.
+
+        Returns:
+            True if model is loaded
+        """
+        if self._owner is not None:
+            return self._owner.is_loaded()
+        return self._model is not None
+
+    def _cache_namespace(self, mode: str) -> str:
+        """Build the cache namespace for this model and context length."""
+        from ragd.embedding.cache import EmbeddingCache
+
+        return EmbeddingCache.namespace(
+            self._model_name,
+            self._revision,
+            variant=f"{mode}:{self._max_context_tokens}:{self._window_overlap}",
+        )
+
     @property
     def dimension(self) -> int:
         """Return embedding dimension."""
@@ -295,6 +593,31 @@ class LateChunkingEmbedder:
             return False
 
 
+def _segment_mean(hidden_states: Any, starts: np.ndarray, ends: np.ndarray) -> Any:
+    """Mean-pool token ranges of one sequence in a single pass.
+
+    Uses a prefix sum so every range costs two lookups regardless of length.
+
+    Args:
+        hidden_states: Token embeddings [seq_len, hidden_dim] (torch tensor)
+        starts: Start token of each range
+        ends: End token (exclusive) of each range, greater than start
+
+    Returns:
+        Mean embedding of each range [num_ranges, hidden_dim]
+    """
+    import torch
+
+    device = hidden_states.device
+    states = hidden_states.float()
+    prefix = torch.cat([states.new_zeros(1, states.shape[1]), states.cumsum(dim=0)])
+    start_index = torch.as_tensor(starts, device=device)
+    end_index = torch.as_tensor(ends, device=device)
+    sums = prefix[end_index] - prefix[start_index]
+    counts = (end_index - start_index).unsqueeze(1).to(sums.dtype)
+    return sums / counts
+
+
 def check_late_chunking_available() -> tuple[bool, str]:
     """Check if late chunking dependencies are available.
 
@@ -314,12 +637,53 @@ def check_late_chunking_available() -> tuple[bool, str]:
 def create_late_chunking_embedder(
     model_name: str = "jinaai/jina-embeddings-v2-small-en",
     device: str | None = None,
+    revision: str | None = None,
+    cache: EmbeddingCache | None = None,
 ) -> LateChunkingEmbedder | None:
     """Create a late chunking embedder if dependencies available.
 
     Args:
         model_name: Model to use (should support long contexts)
         device: Device to use
+        revision: Model revision (branch, tag or commit; None = default)
+        cache: Optional persistent embedding cache
+
+    Returns:
+        LateChunkingEmbedder or None if dependencies missing
+    """
+    available, _ = check_late_chunking_available()
+    if not available:
+        return None
+
+    return LateChunkingEmbedder(
+        model_name=model_name, device=device, revision=revision, cache=cache
+    )
+
+
+def get_late_chunking_embedder(
+    model_name: str = "jinaai/jina-embeddings-v2-small-en",
+    device: str | None = None,
+    max_context_tokens: int | None = None,
+    revision: str | None = None,
+    cache: EmbeddingCache | None = None,
+    window_overlap: int | None = None,
+    window_batch_size: int | None = None,
+) -> LateChunkingEmbedder | None:
+    """Get a shared late chunking embedder from the model registry.
+
+    Unlike :func:`create_late_chunking_embedder`, repeated calls with the
+    same settings share one model, loaded once per process rather than
+    once per document. A caller passing a cache gets its own view of that
+    model, so the cache is never attached to the shared instance.
+
+    Args:
+        model_name: Model to use (should support long contexts)
+        device: Device to use
+        max_context_tokens: Maximum tokens per forward pass
+        revision: Model revision (branch, tag or commit; None = default)
+        cache: Optional persistent embedding cache for this caller
+        window_overlap: Tokens shared by consecutive windows
+        window_batch_size: Windows encoded per forward pass
 
     Returns:
         LateChunkingEmbedder or None if dependencies missing
@@ -328,4 +692,27 @@ def create_late_chunking_embedder(
     if not available:
         return None
 
-    return LateChunkingEmbedder(model_name=model_name, device=device)
+    from ragd.embedding.registry import get_model_registry
+
+    embedder = get_model_registry().get(
+        (
+            "late_chunking",
+            model_name,
+            device,
+            max_context_tokens,
+            revision,
+            window_overlap,
+            window_batch_size,
+        ),
+        lambda: LateChunkingEmbedder(
+            model_name=model_name,
+            device=device,
+            max_context_tokens=max_context_tokens,
+            revision=revision,
+            window_overlap=window_overlap,
+            window_batch_size=window_batch_size,
+        ),
+    )
+    if cache is not None:
+        return embedder.with_cache(cache)
+    return embedder
@@ -0,0 +1,236 @@
+"""Process-wide registry for heavyweight models.
+
+Late chunking, vision and cross-encoder models take seconds to load from
+disk. The registry keeps one instance per model configuration so repeated
+callers (e.g. one call per indexed document) share a loaded model, and
+unloads models that have been idle for longer than ``idle_timeout``.
+
+Callers that must keep a model resident for a long operation take a
+reference-counted lease; leased models are never unloaded.
+
+Example:
+    >>> registry = get_model_registry()
+    >>> embedder = registry.get(("late_chunking", name), lambda: make(name))
+    >>> with registry.lease(embedder):
+    ...     run_long_indexing_job(embedder)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a model may sit unused before it is unloaded
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+@dataclass
+class _Entry:
+    """A registered model instance."""
+
+    instance: Any
+    ref_count: int = 0
+    last_used: float = 0.0
+
+
+class ModelRegistry:
+    """Share loaded models across callers and unload them when idle."""
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        """Initialise the registry.
+
+        Args:
+            idle_timeout: Seconds before an unleased, unused model is
+                unloaded (0 disables idle unloading)
+        """
+        self.idle_timeout = idle_timeout
+        self._entries: dict[Hashable, _Entry] = {}
+        self._lock = threading.RLock()
+        self._reaper: threading.Thread | None = None
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Get the instance for a key, creating it on first use.
+
+        Args:
+            key: Hashable description of the model configuration
+            factory: Creates the instance if none is registered
+
+        Returns:
+            Shared instance for the key
+        """
+        self.unload_idle()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(instance=factory())
+                self._entries[key] = entry
+                logger.debug("Registered model: %s", key)
+                self._ensure_reaper()
+            entry.last_used = time.monotonic()
+            return entry.instance  # type: ignore[no-any-return]
+
+    def acquire(self, instance: Any) -> None:
+        """Take a reference on a registered instance.
+
+        Args:
+            instance: Instance previously returned by :meth:`get`
+        """
+        with self._lock:
+            entry = self._find(instance)
+            if entry is not None:
+                entry.ref_count += 1
+                entry.last_used = time.monotonic()
+
+    def release(self, instance: Any) -> None:
+        """Drop a reference taken with :meth:`acquire`.
+
+        Args:
+            instance: Instance previously acquired
+        """
+        with self._lock:
+            entry = self._find(instance)
+            if entry is not None and entry.ref_count > 0:
+                entry.ref_count -= 1
+                entry.last_used = time.monotonic()
+
+    @contextmanager
+    def lease(self, instance: Any) -> Iterator[Any]:
+        """Keep an instance loaded for the duration of a block.
+
+        Args:
+            instance: Instance previously returned by :meth:`get`
+
+        Yields:
+            The instance
+        """
+        self.acquire(instance)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def unload_idle(self, now: float | None = None) -> int:
+        """Unload unleased models idle for longer than the timeout.
+
+        Args:
+            now: Current monotonic time (for testing)
+
+        Returns:
+            Number of models unloaded
+        """
+        if self.idle_timeout <= 0:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [
+                key
+                for key, entry in self._entries.items()
+                if entry.ref_count == 0 and now - entry.last_used > self.idle_timeout
+            ]
+            for key in idle:
+                self._unload(key)
+        return len(idle)
+
+    def clear(self) -> None:
+        """Unload every model, including leased ones."""
+        with self._lock:
+            for key in list(self._entries):
+                self._unload(key)
+
+    def loaded_keys(self) -> list[Hashable]:
+        """Return keys of currently registered models."""
+        with self._lock:
+            return list(self._entries)
+
+    def ref_count(self, instance: Any) -> int:
+        """Return the number of active leases on an instance."""
+        with self._lock:
+            entry = self._find(instance)
+            return entry.ref_count if entry is not None else 0
+
+    def _find(self, instance: Any) -> _Entry | None:
+        """Find the entry holding an instance (caller holds the lock)."""
+        for entry in self._entries.values():
+            if entry.instance is instance:
+                return entry
+        return None
+
+    def _unload(self, key: Hashable) -> None:
+        """Remove an entry and free its model (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        unload = getattr(entry.instance, "unload", None)
+        if callable(unload):
+            try:
+                unload()
+            except Exception as e:
+                logger.debug("Error unloading model %s: %s", key, e)
+        logger.info("Unloaded idle model: %s", key)
+
+    def _ensure_reaper(self) -> None:
+        """Start the background idle-unload thread if needed."""
+        if self.idle_timeout <= 0:
+            return
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._reaper = threading.Thread(
+            target=self._reap,
+            name="ragd-model-reaper",
+            daemon=True,
+        )
+        self._reaper.start()
+
+    def _reap(self) -> None:
+        """Periodically unload idle models until the registry is empty."""
+        while True:
+            time.sleep(max(1.0, min(self.idle_timeout / 2, 60.0)))
+            self.unload_idle()
+            with self._lock:
+                if not self._entries:
+                    self._reaper = None
+                    return
+
+
+def release_torch_memory() -> None:
+    """Return cached accelerator memory after a model is unloaded.
+
+    Only acts if torch has already been imported.
+    """
+    import sys
+
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    try:
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        elif hasattr(torch, "mps") and torch.backends.mps.is_available():
+            torch.mps.empty_cache()
+    except Exception as e:
+        logger.debug("Could not release accelerator memory: %s", e)
+
+
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry.
+
+    Returns:
+        Shared ModelRegistry instance
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
@@ -210,6 +210,31 @@ class Evaluator:
             mode=SearchMode.HYBRID,
         )
 
+        return self._score_results(query, results, expected_answer, expected_docs, start_time)
+
+    def _score_results(
+        self,
+        query: str,
+        results: list[Any],
+        expected_answer: str | None,
+        expected_docs: list[str] | None,
+        start_time: float,
+        retrieval_ms: float = 0.0,
+    ) -> EvaluationResult:
+        """Compute metrics for one query's retrieved results.
+
+        Args:
+            query: Query that was evaluated
+            results: Retrieved search results
+            expected_answer: Expected answer for recall computation
+            expected_docs: Expected relevant document IDs for recall
+            start_time: Time evaluation of this query started
+            retrieval_ms: Retrieval time not covered by ``start_time``
+                (this query's share of a batched search)
+
+        Returns:
+            EvaluationResult with computed metrics
+        """
         # Extract scores and document IDs
         scores = [r.combined_score for r in results]
         doc_ids = [r.document_id for r in results]
@@ -254,7 +279,7 @@ class Evaluator:
                     model=model,
                 )
 
-        evaluation_time = (time.time() - start_time) * 1000
+        evaluation_time = (time.time() - start_time) * 1000 + retrieval_ms
 
         return EvaluationResult(
             query=query,
@@ -286,16 +311,27 @@ class Evaluator:
             EvaluationReport with all results and summary
         """
         report = EvaluationReport()
+        if not queries:
+            report.compute_summary()
+            return report
 
-        for query_data in queries:
-            query = query_data["query"]
-            expected_answer = query_data.get("expected_answer")
-            expected_docs = query_data.get("expected_docs")
-
-            result = self.evaluate(
-                query=query,
-                expected_answer=expected_answer,
-                expected_docs=expected_docs,
+        # Retrieve for every query in one batched search
+        start_time = time.time()
+        all_results = self._searcher.search_many(
+            [query_data["query"] for query_data in queries],
+            limit=self.eval_config.search_limit,
+            mode=SearchMode.HYBRID,
+        )
+        retrieval_ms = (time.time() - start_time) * 1000 / len(queries)
+
+        for query_data, results in zip(queries, all_results, strict=True):
+            result = self._score_results(
+                query=query_data["query"],
+                results=results,
+                expected_answer=query_data.get("expected_answer"),
+                expected_docs=query_data.get("expected_docs"),
+                start_time=time.time(),
+                retrieval_ms=retrieval_ms,
             )
             report.results.append(result)
 
@@ -7,7 +7,7 @@ from ragd.ingestion.extractor import (
     extract_text,
 )
 from ragd.ingestion.pipeline import IndexResult, index_document, index_path
-from ragd.utils.paths import discover_files
+from ragd.utils.paths import discover_files, iter_files
 
 __all__ = [
     "ExtractionResult",
@@ -19,4 +19,5 @@ __all__ = [
     "index_document",
     "index_path",
     "discover_files",
+    "iter_files",
 ]
@@ -4,32 +4,144 @@ This module provides various strategies for splitting text into chunks
 suitable for embedding and retrieval.
 
 v1.0.5: Configuration exposure - token encoding now configurable.
+
+Chunkers tokenise each document once (see :class:`TokenIndex`) and take
+the token count of any span from cumulative token offsets, rather than
+encoding every sentence or candidate chunk separately.
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 import re
-from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
+import numpy as np
 import tiktoken
 
 if TYPE_CHECKING:
     from ragd.config import RagdConfig
 
+logger = logging.getLogger(__name__)
+
 ChunkStrategy = Literal["sentence", "fixed", "recursive", "structure"]
 
+# Separators used to split large sections into paragraphs and sentences
+_PARAGRAPH_BREAK = re.compile(r"\n\n+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_NON_BLANK = re.compile(r"\S")
+
 
-@dataclass
 class Chunk:
-    """A text chunk with metadata."""
+    """A text chunk with metadata.
+
+    Chunkers emit chunks as spans of the source text: ``start_char`` and
+    ``end_char`` are offsets into the text that was chunked, and
+    ``content`` is sliced from it when read rather than copied up front.
+    Chunks may also be built with explicit content (e.g. when restored
+    from storage).
+    """
 
-    content: str
-    index: int
-    start_char: int
-    end_char: int
-    token_count: int
-    metadata: dict[str, Any] = field(default_factory=dict)
+    __slots__ = (
+        "index",
+        "start_char",
+        "end_char",
+        "token_count",
+        "metadata",
+        "_content",
+        "_source",
+    )
+
+    def __init__(
+        self,
+        content: str,
+        index: int,
+        start_char: int,
+        end_char: int,
+        token_count: int,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialise a chunk with explicit content.
+
+        Args:
+            content: Chunk text
+            index: Position of the chunk in its document
+            start_char: Start char offset in the source text
+            end_char: End char offset in the source text (exclusive)
+            token_count: Number of tokens in the chunk
+            metadata: Optional chunk metadata
+        """
+        self.index = index
+        self.start_char = start_char
+        self.end_char = end_char
+        self.token_count = token_count
+        self.metadata = metadata if metadata is not None else {}
+        self._content: str | None = content
+        self._source: str | None = None
+
+    @classmethod
+    def from_span(
+        cls,
+        source: str,
+        start: int,
+        end: int,
+        index: int,
+        token_count: int,
+        metadata: dict[str, Any] | None = None,
+    ) -> Chunk:
+        """Create a chunk viewing ``source[start:end]`` without copying it.
+
+        Args:
+            source: Full text that was chunked
+            start: Start char offset
+            end: End char offset (exclusive)
+            index: Position of the chunk in its document
+            token_count: Number of tokens in the span
+            metadata: Optional chunk metadata
+
+        Returns:
+            Chunk instance
+        """
+        chunk = cls.__new__(cls)
+        chunk.index = index
+        chunk.start_char = start
+        chunk.end_char = end
+        chunk.token_count = token_count
+        chunk.metadata = metadata if metadata is not None else {}
+        chunk._content = None
+        chunk._source = source
+        return chunk
+
+    @property
+    def content(self) -> str:
+        """Chunk text."""
+        if self._content is not None:
+            return self._content
+        return self._source[self.start_char : self.end_char]  # type: ignore[index]
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return (
+            f"Chunk(content={self.content!r}, index={self.index}, "
+            f"start_char={self.start_char}, end_char={self.end_char}, "
+            f"token_count={self.token_count}, metadata={self.metadata!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare chunks by content, position and metadata."""
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return (
+            self.index == other.index
+            and self.start_char == other.start_char
+            and self.end_char == other.end_char
+            and self.token_count == other.token_count
+            and self.content == other.content
+            and self.metadata == other.metadata
+        )
+
+    __hash__ = None  # type: ignore[assignment]
 
 
 class Chunker(Protocol):
@@ -48,6 +160,43 @@ class Chunker(Protocol):
         ...
 
 
+def _resolve_encoding_name(
+    encoding_name: str | None, config: RagdConfig | None
+) -> str:
+    """Resolve the tiktoken encoding name from arguments or config."""
+    if encoding_name is not None:
+        return encoding_name
+    if config is not None:
+        return config.processing.token_encoding
+    return "cl100k_base"
+
+
+def _chars_per_token(config: RagdConfig | None) -> int:
+    """Characters per token used when no encoding is available."""
+    if config is not None:
+        return config.processing.chars_per_token_estimate
+    return 4
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding | None:
+    """Load a tiktoken encoding once per process.
+
+    Returns:
+        Encoding, or None if it cannot be loaded (e.g. offline without a
+        cached copy), in which case callers fall back to estimates
+    """
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(
+            "Token encoding %s unavailable, estimating token counts: %s",
+            encoding_name,
+            e,
+        )
+        return None
+
+
 def count_tokens(
     text: str,
     encoding_name: str | None = None,
@@ -63,25 +212,142 @@ def count_tokens(
     Returns:
         Number of tokens
     """
-    # Resolve encoding from config or defaults
-    if encoding_name is None:
-        if config is not None:
-            encoding_name = config.processing.token_encoding
-        else:
-            encoding_name = "cl100k_base"
+    encoding = _get_encoding(_resolve_encoding_name(encoding_name, config))
+    if encoding is None:
+        # Fallback: rough estimate based on config or default
+        return len(text) // _chars_per_token(config)
+    return len(encoding.encode_ordinary(text))
 
-    # Get chars_per_token for fallback
-    if config is not None:
-        chars_per_token = config.processing.chars_per_token_estimate
-    else:
-        chars_per_token = 4
 
-    try:
-        encoding = tiktoken.get_encoding(encoding_name)
-        return len(encoding.encode(text))
-    except Exception:
-        # Fallback: rough estimate based on config or default
-        return len(text) // chars_per_token
+class TokenIndex:
+    """Token boundaries of a document, encoded once.
+
+    The token count of any character span is found by searching the
+    cumulative token end offsets, so chunkers never re-encode text. A
+    token belongs to the span containing its last character, so a leading
+    space token counts towards the following sentence, as it would if
+    the sentence were encoded on its own. Counts can differ by one from
+    encoding a span separately where a token straddles its boundary.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        encoding_name: str | None = None,
+        config: RagdConfig | None = None,
+    ) -> None:
+        """Tokenise a document.
+
+        Args:
+            text: Document text
+            encoding_name: Tiktoken encoding name. If None, uses config or default.
+            config: Optional ragd config for token encoding
+        """
+        self._chars_per_token = _chars_per_token(config)
+        # End char offset of each token; None when estimating from length
+        self._ends: np.ndarray | None = None
+
+        encoding = _get_encoding(_resolve_encoding_name(encoding_name, config))
+        if encoding is None:
+            return
+        tokens = encoding.encode_ordinary(text)
+        _, starts = encoding.decode_with_offsets(tokens)
+        ends = np.empty(len(starts), dtype=np.int64)
+        ends[:-1] = starts[1:]
+        ends[-1:] = len(text)
+        self._ends = ends
+
+    def count(self, start: int, end: int) -> int:
+        """Count the tokens in ``text[start:end]``.
+
+        Args:
+            start: Start char offset
+            end: End char offset (exclusive)
+
+        Returns:
+            Number of tokens
+        """
+        if self._ends is None:
+            return max(end - start, 0) // self._chars_per_token
+        ends = self._ends
+        return int(
+            np.searchsorted(ends, end, side="right")
+            - np.searchsorted(ends, start, side="right")
+        )
+
+    def count_spans(self, spans: list[tuple[int, int]]) -> list[int]:
+        """Count the tokens in many spans at once.
+
+        Args:
+            spans: (start, end) char offsets
+
+        Returns:
+            Token count of each span
+        """
+        if not spans:
+            return []
+        bounds = np.asarray(spans, dtype=np.int64)
+        if self._ends is None:
+            lengths = np.maximum(bounds[:, 1] - bounds[:, 0], 0)
+            return (lengths // self._chars_per_token).tolist()
+        counts = np.searchsorted(self._ends, bounds[:, 1], side="right") - np.searchsorted(
+            self._ends, bounds[:, 0], side="right"
+        )
+        return counts.tolist()
+
+
+def _stripped_spans(
+    pattern: re.Pattern[str],
+    text: str,
+    start: int = 0,
+    end: int | None = None,
+) -> list[tuple[int, int]]:
+    """Split ``text[start:end]`` at pattern matches into stripped spans.
+
+    Equivalent to ``[p.strip() for p in pattern.split(...) if p.strip()]``
+    but returns char offsets into ``text``.
+
+    Args:
+        pattern: Separator pattern
+        text: Full text
+        start: Start of the region to split
+        end: End of the region to split (default: end of text)
+
+    Returns:
+        (start, end) offsets of each non-empty piece
+    """
+    if end is None:
+        end = len(text)
+    spans: list[tuple[int, int]] = []
+    piece_start = start
+    bounds = [(m.start(), m.end()) for m in pattern.finditer(text, start, end)]
+    bounds.append((end, end))
+    for sep_start, sep_end in bounds:
+        span = _strip_span(text, piece_start, sep_start)
+        if span is not None:
+            spans.append(span)
+        piece_start = sep_end
+    return spans
+
+
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int] | None:
+    """Narrow ``text[start:end]`` to exclude surrounding whitespace.
+
+    Args:
+        text: Full text
+        start: Start char offset
+        end: End char offset (exclusive)
+
+    Returns:
+        Stripped (start, end) offsets, or None if the span is blank
+    """
+    match = _NON_BLANK.search(text, start, end)
+    if match is None:
+        return None
+    start = match.start()
+    while text[end - 1].isspace():
+        end -= 1
+    return start, end
 
 
 class SentenceChunker:
@@ -120,8 +386,18 @@ class SentenceChunker:
         Returns:
             List of sentences
         """
-        sentences = self._sentence_pattern.split(text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [text[start:end] for start, end in self._sentence_spans(text)]
+
+    def _sentence_spans(self, text: str) -> list[tuple[int, int]]:
+        """Find the char offsets of each stripped sentence.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (start, end) offsets
+        """
+        return _stripped_spans(self._sentence_pattern, text)
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[Chunk]:
         """Split text into chunks based on sentences.
@@ -136,92 +412,76 @@ class SentenceChunker:
         if not text.strip():
             return []
 
-        sentences = self._split_sentences(text)
-        if not sentences:
+        spans = self._sentence_spans(text)
+        if not spans:
             return []
+        token_counts = TokenIndex(text).count_spans(spans)
 
         chunks: list[Chunk] = []
-        current_sentences: list[str] = []
+        current_ids: list[int] = []
         current_tokens = 0
-        char_offset = 0
-
-        for sentence in sentences:
-            sentence_tokens = count_tokens(sentence)
+        # First sentence of the last chunk, for merging a short remainder
+        last_first_id = 0
 
+        for sentence_id, sentence_tokens in enumerate(token_counts):
             # If adding this sentence would exceed chunk size
-            if current_tokens + sentence_tokens > self.chunk_size and current_sentences:
-                # Create chunk from current sentences
-                chunk_text = " ".join(current_sentences)
-                start_char = char_offset
-                end_char = start_char + len(chunk_text)
-
+            if current_tokens + sentence_tokens > self.chunk_size and current_ids:
+                # Create chunk spanning the current sentences
                 chunks.append(
-                    Chunk(
-                        content=chunk_text,
+                    Chunk.from_span(
+                        text,
+                        spans[current_ids[0]][0],
+                        spans[current_ids[-1]][1],
                         index=len(chunks),
-                        start_char=start_char,
-                        end_char=end_char,
                         token_count=current_tokens,
                         metadata=metadata.copy() if metadata else {},
                     )
                 )
+                last_first_id = current_ids[0]
 
                 # Handle overlap
                 overlap_tokens = 0
-                overlap_sentences: list[str] = []
-                for s in reversed(current_sentences):
-                    s_tokens = count_tokens(s)
-                    if overlap_tokens + s_tokens <= self.overlap:
-                        overlap_sentences.insert(0, s)
-                        overlap_tokens += s_tokens
+                overlap_ids: list[int] = []
+                for i in reversed(current_ids):
+                    if overlap_tokens + token_counts[i] <= self.overlap:
+                        overlap_ids.insert(0, i)
+                        overlap_tokens += token_counts[i]
                     else:
                         break
 
-                char_offset = end_char - sum(len(s) + 1 for s in overlap_sentences)
-                current_sentences = overlap_sentences
+                current_ids = overlap_ids
                 current_tokens = overlap_tokens
 
-            current_sentences.append(sentence)
+            current_ids.append(sentence_id)
             current_tokens += sentence_tokens
 
-        # Handle remaining sentences
-        if current_sentences and current_tokens >= self.min_chunk_size:
-            chunk_text = " ".join(current_sentences)
+        if not current_ids:
+            return chunks
+
+        end_char = spans[current_ids[-1]][1]
+        if current_tokens >= self.min_chunk_size or not chunks:
+            # Remaining sentences, or a single chunk for small documents
             chunks.append(
-                Chunk(
-                    content=chunk_text,
+                Chunk.from_span(
+                    text,
+                    spans[current_ids[0]][0],
+                    end_char,
                     index=len(chunks),
-                    start_char=char_offset,
-                    end_char=char_offset + len(chunk_text),
                     token_count=current_tokens,
                     metadata=metadata.copy() if metadata else {},
                 )
             )
-        elif current_sentences and chunks:
-            # Merge with last chunk if too small
+        else:
+            # Extend the last chunk if the remainder is too small
             last_chunk = chunks[-1]
-            merged_content = last_chunk.content + " " + " ".join(current_sentences)
-            chunks[-1] = Chunk(
-                content=merged_content,
+            chunks[-1] = Chunk.from_span(
+                text,
+                last_chunk.start_char,
+                end_char,
                 index=last_chunk.index,
-                start_char=last_chunk.start_char,
-                end_char=last_chunk.start_char + len(merged_content),
-                token_count=last_chunk.token_count + current_tokens,
+                token_count=sum(token_counts[last_first_id : current_ids[-1] + 1]),
                 metadata=last_chunk.metadata,
             )
-        elif current_sentences:
-            # Single chunk for small documents
-            chunk_text = " ".join(current_sentences)
-            chunks.append(
-                Chunk(
-                    content=chunk_text,
-                    index=0,
-                    start_char=0,
-                    end_char=len(chunk_text),
-                    token_count=current_tokens,
-                    metadata=metadata.copy() if metadata else {},
-                )
-            )
 
         return chunks
 
@@ -269,6 +529,7 @@ class FixedChunker:
         chunk_chars = self.chunk_size * self._chars_per_token
         overlap_chars = self.overlap * self._chars_per_token
 
+        index = TokenIndex(text, config=self._config)
         chunks: list[Chunk] = []
         start = 0
 
@@ -281,15 +542,14 @@ class FixedChunker:
                 if space_pos > start:
                     end = space_pos
 
-            chunk_text = text[start:end].strip()
-            if chunk_text:
+            span = _strip_span(text, start, end)
+            if span is not None:
                 chunks.append(
-                    Chunk(
-                        content=chunk_text,
+                    Chunk.from_span(
+                        text,
+                        *span,
                         index=len(chunks),
-                        start_char=start,
-                        end_char=end,
-                        token_count=count_tokens(chunk_text),
+                        token_count=index.count(*span),
                         metadata=metadata.copy() if metadata else {},
                     )
                 )
@@ -331,6 +591,7 @@ class RecursiveChunker:
             ". ",  # Sentence
             " ",  # Word
         ]
+        self._separator_patterns = [re.compile(re.escape(sep)) for sep in self._separators]
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[Chunk]:
         """Split text recursively.
@@ -342,89 +603,87 @@ class RecursiveChunker:
         Returns:
             List of Chunk objects
         """
-        if not text.strip():
+        span = _strip_span(text, 0, len(text))
+        if span is None:
             return []
 
-        raw_chunks = self._recursive_split(text)
-        chunks: list[Chunk] = []
-        char_offset = 0
-
-        for i, chunk_text in enumerate(raw_chunks):
-            if not chunk_text.strip():
-                continue
-
-            start_char = text.find(chunk_text, char_offset)
-            if start_char == -1:
-                start_char = char_offset
-
-            chunks.append(
-                Chunk(
-                    content=chunk_text,
-                    index=len(chunks),
-                    start_char=start_char,
-                    end_char=start_char + len(chunk_text),
-                    token_count=count_tokens(chunk_text),
-                    metadata=metadata.copy() if metadata else {},
-                )
+        index = TokenIndex(text)
+        return [
+            Chunk.from_span(
+                text,
+                start,
+                end,
+                index=i,
+                token_count=index.count(start, end),
+                metadata=metadata.copy() if metadata else {},
             )
+            for i, (start, end) in enumerate(self._recursive_split(text, *span, index))
+        ]
 
-            char_offset = start_char + len(chunk_text)
-
-        return chunks
-
-    def _recursive_split(self, text: str, separators: list[str] | None = None) -> list[str]:
-        """Recursively split text.
+    def _recursive_split(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        index: TokenIndex,
+        separators: list[re.Pattern[str]] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Recursively split a region of text.
 
         Args:
-            text: Text to split
-            separators: Remaining separators to try
+            text: Full document text
+            start: Start char offset of the region
+            end: End char offset of the region
+            index: Token index of ``text``
+            separators: Remaining separator patterns to try
 
         Returns:
-            List of text chunks
+            List of (start, end) offsets of each chunk
         """
         if separators is None:
-            separators = self._separators.copy()
+            separators = self._separator_patterns
 
         if not separators:
-            return [text] if text.strip() else []
+            return [(start, end)]
 
         separator = separators[0]
         remaining = separators[1:]
 
-        if separator not in text:
-            return self._recursive_split(text, remaining)
-
-        parts = text.split(separator)
-        result: list[str] = []
-        current = ""
+        if separator.search(text, start, end) is None:
+            return self._recursive_split(text, start, end, index, remaining)
 
-        for part in parts:
-            if not part.strip():
-                continue
+        result: list[tuple[int, int]] = []
+        current: tuple[int, int] | None = None
+        current_tokens = 0
 
-            test_chunk = current + separator + part if current else part
-            if count_tokens(test_chunk) <= self.chunk_size:
-                current = test_chunk
+        for part_start, part_end in _stripped_spans(separator, text, start, end):
+            part_tokens = index.count(part_start, part_end)
+            test_tokens = index.count(current[0], part_end) if current else part_tokens
+            if test_tokens <= self.chunk_size:
+                current = (current[0] if current else part_start, part_end)
+                current_tokens = test_tokens
             else:
                 if current:
-                    if count_tokens(current) >= self.min_chunk_size:
+                    if current_tokens >= self.min_chunk_size:
                         result.append(current)
                     elif result:
-                        result[-1] = result[-1] + separator + current
+                        result[-1] = (result[-1][0], current[1])
 
-                if count_tokens(part) > self.chunk_size:
+                if part_tokens > self.chunk_size:
                     # Recursively split
-                    sub_chunks = self._recursive_split(part, remaining)
-                    result.extend(sub_chunks)
-                    current = ""
+                    result.extend(
+                        self._recursive_split(text, part_start, part_end, index, remaining)
+                    )
+                    current = None
                 else:
-                    current = part
+                    current = (part_start, part_end)
+                    current_tokens = part_tokens
 
         if current:
-            if count_tokens(current) >= self.min_chunk_size:
+            if current_tokens >= self.min_chunk_size:
                 result.append(current)
             elif result:
-                result[-1] = result[-1] + separator + current
+                result[-1] = (result[-1][0], current[1])
 
         return result
 
@@ -489,65 +748,46 @@ class StructureChunker:
         if not text.strip():
             return []
 
+        index = TokenIndex(text)
+
         # First, identify structural elements that should stay together
-        protected_regions = self._identify_protected_regions(text)
+        protected_regions = self._identify_protected_regions(text, index)
 
         # Split by headings if enabled
         if self.respect_headings:
             sections = self._split_by_headings(text)
         else:
-            sections = [text]
+            span = _strip_span(text, 0, len(text))
+            sections = [span] if span else []
 
         chunks: list[Chunk] = []
-        char_offset = 0
 
-        for section in sections:
-            if not section.strip():
-                continue
+        for section_start, section_end in sections:
+            section_tokens = index.count(section_start, section_end)
 
             # Check if this section is small enough to be a single chunk
-            section_tokens = count_tokens(section)
             if section_tokens <= self.chunk_size:
-                start_char = text.find(section, char_offset)
-                if start_char == -1:
-                    start_char = char_offset
+                pieces = [(section_start, section_end, section_tokens)]
+            else:
+                # Need to split this section further
+                pieces = self._split_large_section(
+                    text, protected_regions, index, section_start, section_end
+                )
 
+            for start, end, tokens in pieces:
                 chunks.append(
-                    Chunk(
-                        content=section.strip(),
+                    Chunk.from_span(
+                        text,
+                        start,
+                        end,
                         index=len(chunks),
-                        start_char=start_char,
-                        end_char=start_char + len(section),
-                        token_count=section_tokens,
+                        token_count=tokens,
                         metadata=metadata.copy() if metadata else {},
                     )
                 )
-                char_offset = start_char + len(section)
-            else:
-                # Need to split this section further
-                sub_chunks = self._split_large_section(section, protected_regions)
-                for sub_chunk in sub_chunks:
-                    if not sub_chunk.strip():
-                        continue
-
-                    start_char = text.find(sub_chunk, char_offset)
-                    if start_char == -1:
-                        start_char = char_offset
-
-                    chunks.append(
-                        Chunk(
-                            content=sub_chunk.strip(),
-                            index=len(chunks),
-                            start_char=start_char,
-                            end_char=start_char + len(sub_chunk),
-                            token_count=count_tokens(sub_chunk),
-                            metadata=metadata.copy() if metadata else {},
-                        )
-                    )
-                    char_offset = start_char + len(sub_chunk)
 
         # Merge chunks that are too small
-        chunks = self._merge_small_chunks(chunks)
+        chunks = self._merge_small_chunks(text, chunks)
 
         # Re-index chunks
         for i, chunk in enumerate(chunks):
@@ -555,11 +795,14 @@ class StructureChunker:
 
         return chunks
 
-    def _identify_protected_regions(self, text: str) -> list[tuple[int, int]]:
+    def _identify_protected_regions(
+        self, text: str, index: TokenIndex
+    ) -> list[tuple[int, int]]:
         """Identify regions that should not be split.
 
         Args:
             text: Text to analyse
+            index: Token index of ``text``
 
         Returns:
             List of (start, end) tuples for protected regions
@@ -570,116 +813,113 @@ class StructureChunker:
         if self.keep_tables_together:
             for match in self._table_pattern.finditer(text):
                 # Only protect if it fits in a single chunk
-                if count_tokens(match.group()) <= self.chunk_size:
+                if index.count(match.start(), match.end()) <= self.chunk_size:
                     regions.append((match.start(), match.end()))
 
         # Code blocks (always keep together if they fit)
         for match in self._code_block_pattern.finditer(text):
-            if count_tokens(match.group()) <= self.chunk_size:
+            if index.count(match.start(), match.end()) <= self.chunk_size:
                 regions.append((match.start(), match.end()))
 
         return sorted(regions, key=lambda x: x[0])
 
-    def _split_by_headings(self, text: str) -> list[str]:
+    def _split_by_headings(self, text: str) -> list[tuple[int, int]]:
         """Split text at heading boundaries.
 
         Args:
             text: Text to split
 
         Returns:
-            List of sections
+            List of (start, end) offsets of each stripped section
         """
-        # Find all heading positions
-        headings = list(self._heading_pattern.finditer(text))
-        if not headings:
-            return [text]
+        # Each section runs from a heading up to the next one
+        bounds = [match.start() for match in self._heading_pattern.finditer(text)]
+        bounds.append(len(text))
 
         sections = []
         prev_end = 0
-
-        for match in headings:
-            # Get content before this heading
-            if match.start() > prev_end:
-                before = text[prev_end:match.start()].strip()
-                if before:
-                    sections.append(before)
-
-            prev_end = match.start()
-
-        # Get remaining content (including last heading)
-        if prev_end < len(text):
-            sections.append(text[prev_end:])
+        for bound in bounds:
+            span = _strip_span(text, prev_end, bound)
+            if span is not None:
+                sections.append(span)
+            prev_end = bound
 
         return sections
 
     def _split_large_section(
-        self, text: str, protected_regions: list[tuple[int, int]]
-    ) -> list[str]:
+        self,
+        text: str,
+        protected_regions: list[tuple[int, int]],
+        index: TokenIndex,
+        start: int,
+        end: int,
+    ) -> list[tuple[int, int, int]]:
         """Split a large section into smaller chunks.
 
         Args:
-            text: Text to split
+            text: Full document text
             protected_regions: Regions that should not be split
+            index: Token index of ``text``
+            start: Start char offset of the section
+            end: End char offset of the section
 
         Returns:
-            List of text chunks
+            List of (start, end, token count) tuples, one per chunk
         """
         # Use paragraph-based splitting
-        paragraphs = re.split(r"\n\n+", text)
+        paragraphs = _stripped_spans(_PARAGRAPH_BREAK, text, start, end)
         if not paragraphs:
-            return [text]
+            return [(start, end, index.count(start, end))]
 
-        chunks: list[str] = []
-        current: list[str] = []
+        chunks: list[tuple[int, int, int]] = []
+        current: tuple[int, int] | None = None
         current_tokens = 0
 
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-
-            para_tokens = count_tokens(para)
+        for para_start, para_end in paragraphs:
+            para_tokens = index.count(para_start, para_end)
 
             # If this paragraph is very large, may need recursive splitting
             if para_tokens > self.chunk_size:
                 # Flush current buffer
                 if current:
-                    chunks.append("\n\n".join(current))
-                    current = []
+                    chunks.append((*current, current_tokens))
+                    current = None
                     current_tokens = 0
 
                 # Split the large paragraph by sentences
-                sentences = re.split(r"(?<=[.!?])\s+", para)
-                for sentence in sentences:
-                    sent_tokens = count_tokens(sentence)
+                sentences = _stripped_spans(_SENTENCE_END, text, para_start, para_end)
+                for (sent_start, sent_end), sent_tokens in zip(
+                    sentences, index.count_spans(sentences), strict=True
+                ):
                     if current_tokens + sent_tokens > self.chunk_size and current:
-                        chunks.append(" ".join(current))
-                        current = []
+                        chunks.append((*current, current_tokens))
+                        current = None
                         current_tokens = 0
-                    current.append(sentence)
+                    current = (current[0] if current else sent_start, sent_end)
                     current_tokens += sent_tokens
 
                 continue
 
             # Check if adding this paragraph exceeds limit
             if current_tokens + para_tokens > self.chunk_size and current:
-                chunks.append("\n\n".join(current))
-                current = []
+                chunks.append((*current, current_tokens))
+                current = None
                 current_tokens = 0
 
-            current.append(para)
+            current = (current[0] if current else para_start, para_end)
             current_tokens += para_tokens
 
         # Flush remaining
         if current:
-            chunks.append("\n\n".join(current))
+            chunks.append((*current, current_tokens))
 
         return chunks
 
-    def _merge_small_chunks(self, chunks: list[Chunk]) -> list[Chunk]:
+    def _merge_small_chunks(self, text: str, chunks: list[Chunk]) -> list[Chunk]:
         """Merge chunks that are too small.
 
         Args:
+            text: Full document text
             chunks: List of chunks to potentially merge
 
         Returns:
@@ -702,12 +942,11 @@ class StructureChunker:
 
                 # Merge if combined size is acceptable
                 if merged_tokens <= self.chunk_size * 1.2:  # Allow 20% overflow
-                    merged_content = last.content + "\n\n" + chunk.content
-                    result[-1] = Chunk(
-                        content=merged_content,
+                    result[-1] = Chunk.from_span(
+                        text,
+                        last.start_char,
+                        chunk.end_char,
                         index=last.index,
-                        start_char=last.start_char,
-                        end_char=chunk.end_char,
                         token_count=merged_tokens,
                         metadata=last.metadata,
                     )
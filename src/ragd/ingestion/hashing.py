@@ -40,6 +40,38 @@ class FileHash:
         return f"{self.path}:{self.size}:{self.mtime}"
 
 
+# Bytes read from each end of a file for its partial hash
+PARTIAL_HASH_BLOCK = 64 * 1024
+
+
+def partial_file_hash(path: Path, block_size: int = PARTIAL_HASH_BLOCK) -> str:
+    """Hash a file's size and its first and last blocks.
+
+    Much cheaper than hashing the whole file, and still catches most
+    edits to files whose size is unchanged. Files no larger than two
+    blocks are hashed in full.
+
+    Args:
+        path: Path to file
+        block_size: Bytes read from each end of the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        hasher.update(str(size).encode())
+        f.seek(0)
+        if size <= 2 * block_size:
+            hasher.update(f.read())
+        else:
+            hasher.update(f.read(block_size))
+            f.seek(size - block_size)
+            hasher.update(f.read(block_size))
+    return hasher.hexdigest()
+
+
 @dataclass(frozen=True, slots=True)
 class ContentHash:
     """Content-level hash for duplicate detection."""
@@ -0,0 +1,270 @@
+"""Incremental indexing manifest.
+
+Records the size, modification time, inode and a partial content hash
+(see :func:`ragd.ingestion.hashing.partial_file_hash`) of every source
+file written to the index. Before indexing, ``index_path`` compares each
+discovered file against its entry with a single ``stat`` call, so files
+that have not changed are skipped without being opened, extracted or
+hashed.
+
+A file whose modification time moved is re-indexed, since the partial
+hash cannot see edits to the middle of large files. Only a file whose
+size and modification time match but whose inode moved (e.g. replaced
+by a copy that preserved its timestamps) gets its partial hash compared
+instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ragd.ingestion.hashing import partial_file_hash
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.db"
+
+# SQLite limits bound parameters per statement; look paths up in slices
+_LOOKUP_BATCH = 500
+
+
+@dataclass(frozen=True, slots=True)
+class SourceFileState:
+    """Stat snapshot of a source file taken before it is indexed."""
+
+    path: Path
+    key: str  # Resolved path
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, path: Path) -> SourceFileState:
+        """Snapshot a file's stat.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            SourceFileState instance
+        """
+        stat = path.stat()
+        return cls(
+            path=path,
+            key=str(path.resolve()),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+        )
+
+
+@dataclass
+class ManifestScan:
+    """Result of comparing discovered files against the manifest."""
+
+    unchanged: list[Path] = field(default_factory=list)
+    changed: list[Path] = field(default_factory=list)
+    # Snapshot of each changed file, recorded once it is indexed
+    states: dict[Path, SourceFileState] = field(default_factory=dict)
+
+
+class IndexManifest:
+    """SQLite record of the source files in an index.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialise the manifest.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Create manifest table if not exists."""
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS source_files (
+                path TEXT PRIMARY KEY,
+                document_id TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                partial_hash TEXT NOT NULL,
+                indexed_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def _lookup(self, keys: list[str]) -> dict[str, tuple[Any, ...]]:
+        """Fetch manifest rows by resolved path. Caller must hold the lock."""
+        rows: dict[str, tuple[Any, ...]] = {}
+        for i in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[i : i + _LOOKUP_BATCH]
+            placeholders = ",".join("?" for _ in batch)
+            for row in self._conn.execute(
+                f"""
+                SELECT path, document_id, size, mtime_ns, inode, partial_hash
+                FROM source_files WHERE path IN ({placeholders})
+                """,
+                batch,
+            ):
+                rows[row[0]] = row
+        return rows
+
+    def scan(
+        self,
+        paths: list[Path],
+        indexed_ids: set[str] | None = None,
+    ) -> ManifestScan:
+        """Split files into those unchanged since indexing and the rest.
+
+        Args:
+            paths: Discovered files
+            indexed_ids: Document IDs present in the store; entries for
+                documents missing from it count as changed (None skips
+                this check)
+
+        Returns:
+            ManifestScan, with both lists in input order
+        """
+        scan = ManifestScan()
+        states: dict[Path, SourceFileState] = {}
+        for path in paths:
+            # Unreadable files are left for indexing to report
+            with contextlib.suppress(OSError):
+                states[path] = SourceFileState.from_path(path)
+
+        with self._lock:
+            rows = self._lookup([s.key for s in states.values()])
+
+        refreshed: list[tuple[int, int, str]] = []
+        for path in paths:
+            state = states.get(path)
+            row = rows.get(state.key) if state else None
+            if state is None or row is None or not self._unchanged(state, row, indexed_ids):
+                scan.changed.append(path)
+                if state is not None:
+                    scan.states[path] = state
+                continue
+            scan.unchanged.append(path)
+            if row[4] != state.inode:
+                refreshed.append((state.inode, state.key))
+
+        if refreshed:
+            # Save the new inode so the next scan skips the partial hash
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE source_files SET inode = ? WHERE path = ?",
+                    refreshed,
+                )
+                self._conn.commit()
+
+        if len(scan.changed) < len(paths):
+            logger.debug(
+                "Manifest: %d unchanged, %d to index", len(scan.unchanged), len(scan.changed)
+            )
+        return scan
+
+    @staticmethod
+    def _unchanged(
+        state: SourceFileState,
+        row: tuple[Any, ...],
+        indexed_ids: set[str] | None,
+    ) -> bool:
+        """Whether a file matches its manifest entry."""
+        if (row[2], row[3]) != (state.size, state.mtime_ns):
+            return False
+        if indexed_ids is not None and row[1] not in indexed_ids:
+            return False
+        if row[4] == state.inode:
+            return True
+        try:
+            return partial_file_hash(state.path) == row[5]
+        except OSError:
+            return False
+
+    def record(self, states: list[SourceFileState], document_ids: list[str]) -> None:
+        """Record files that were indexed.
+
+        Args:
+            states: Snapshots taken before each file was indexed
+            document_ids: Document ID of each file
+        """
+        if not states:
+            return
+
+        now = time.time()
+        rows = []
+        for state, document_id in zip(states, document_ids, strict=True):
+            try:
+                digest = partial_file_hash(state.path)
+            except OSError:
+                continue  # Gone since indexing; re-checked next run
+            rows.append(
+                (state.key, document_id, state.size, state.mtime_ns, state.inode, digest, now)
+            )
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO source_files
+                    (path, document_id, size, mtime_ns, inode, partial_hash, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def forget(self, paths: list[Path]) -> None:
+        """Remove files from the manifest so they are re-indexed.
+
+        Args:
+            paths: Source files
+        """
+        keys = [(str(p.resolve()),) for p in paths]
+        with self._lock:
+            self._conn.executemany("DELETE FROM source_files WHERE path = ?", keys)
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Number of files in the manifest."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM source_files").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM source_files")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> IndexManifest:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
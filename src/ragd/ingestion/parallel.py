@@ -0,0 +1,399 @@
+"""Staged parallel indexing pipeline for ragd.
+
+Splits indexing into three stages joined by bounded queues:
+
+1. Prepare - extraction, OCR fallback, normalisation and chunking in a
+   process pool (CPU-bound, no shared state)
+2. Embed - duplicate checks, contextual retrieval and cross-document
+   batched embedding on a single thread that owns the embedding model
+3. Write - ChromaDB, BM25 and image writes on the calling thread
+
+Documents leave the pipeline in the order they were fed, so results and
+progress callbacks match the sequential path in ``index_path``. Files may
+be fed from a generator (see :func:`ragd.utils.paths.iter_files`), so
+extraction starts while discovery is still walking the tree.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterable, Sized
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ragd.config import RagdConfig
+from ragd.embedding import get_embedder
+from ragd.embedding.batching import EmbeddingAccumulator
+from ragd.embedding.cache import get_embedding_cache
+from ragd.ingestion.pipeline import (
+    IndexResult,
+    PreparedDocument,
+    assemble_embedded_document,
+    check_duplicate,
+    embed_document,
+    generate_chunk_context,
+    prepare_document,
+    write_document,
+)
+from ragd.search.bm25 import BM25Index
+from ragd.storage import ChromaStore
+
+logger = logging.getLogger(__name__)
+
+# Seconds between stop-flag checks while blocked on a full/empty queue
+_POLL_INTERVAL = 0.1
+
+# Marks the end of a stage's output
+_END = object()
+
+# Configuration for the current worker process (set by _init_worker)
+_worker_config: RagdConfig | None = None
+
+
+@dataclass
+class _FeedCount:
+    """Number of files the feed stage has submitted so far."""
+
+    value: int = 0
+
+
+@dataclass
+class _StageFailure:
+    """Exception raised inside a pipeline stage, forwarded downstream."""
+
+    error: BaseException
+
+
+def resolve_worker_count(config: RagdConfig, file_count: int | None = None) -> int:
+    """Determine how many extraction processes to use.
+
+    Args:
+        config: Configuration
+        file_count: Number of files to index (None if not yet known)
+
+    Returns:
+        Worker count; 1 means the sequential path should be used
+    """
+    workers = config.indexing.workers
+    if workers <= 0:
+        # Leave one core for the embedding and writer stages
+        workers = max(1, (os.cpu_count() or 1) - 1)
+    if file_count is None:
+        return max(1, workers)
+    return max(1, min(workers, file_count))
+
+
+def _init_worker(config: RagdConfig) -> None:
+    """Store configuration in a newly started worker process."""
+    global _worker_config
+    _worker_config = config
+
+
+def _prepare_in_worker(path: Path) -> PreparedDocument | IndexResult:
+    """Run the prepare stage inside a worker process."""
+    assert _worker_config is not None, "worker not initialised"
+    return prepare_document(path, _worker_config)
+
+
+def _put(q: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+    """Put an item on a bounded queue, giving up if the pipeline stops.
+
+    Returns:
+        True if the item was queued
+    """
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue[Any], stop: threading.Event) -> Any:
+    """Get an item from a queue, returning _END if the pipeline stops."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return _END
+
+
+def _feed_stage(
+    files: Iterable[Path],
+    executor: ProcessPoolExecutor,
+    prepared_queue: queue.Queue[Any],
+    stop: threading.Event,
+    fed: _FeedCount,
+) -> None:
+    """Submit files to the process pool in order.
+
+    Futures are queued in submission order; the bounded queue limits how
+    many documents are in flight at once. ``files`` is consumed lazily on
+    this thread.
+    """
+    try:
+        for file_path in files:
+            if stop.is_set():
+                return
+            fed.value += 1
+            future = executor.submit(_prepare_in_worker, file_path)
+            if not _put(prepared_queue, (file_path, future), stop):
+                future.cancel()
+                return
+    except BaseException as e:
+        _put(prepared_queue, _StageFailure(e), stop)
+        return
+    _put(prepared_queue, _END, stop)
+
+
+def _create_accumulator(config: RagdConfig) -> EmbeddingAccumulator | None:
+    """Create a cross-document accumulator, or None if batching is disabled.
+
+    Late chunking embeds each document against its own full text, so it
+    cannot share a batch with other documents.
+    """
+    if config.embedding.late_chunking or config.embedding.batch_max_chunks <= 0:
+        return None
+    embedder = get_embedder(
+        model_name=config.embedding.model,
+        device=config.embedding.device,
+        batch_size=config.embedding.batch_size,
+        revision=config.embedding.revision,
+        cache=get_embedding_cache(config),
+    )
+    return EmbeddingAccumulator(
+        embedder,
+        max_texts=config.embedding.batch_max_chunks,
+        max_tokens=config.embedding.batch_max_tokens,
+        chars_per_token=config.processing.chars_per_token_estimate,
+    )
+
+
+def _embed_stage(
+    store: ChromaStore,
+    config: RagdConfig,
+    skip_duplicates: bool,
+    contextual: bool | None,
+    prepared_queue: queue.Queue[Any],
+    embedded_queue: queue.Queue[Any],
+    stop: threading.Event,
+) -> None:
+    """Check duplicates and embed prepared documents.
+
+    Chunks from consecutive documents are gathered into one accumulator
+    and embedded together. The batch is flushed when it reaches its budget
+    or when no more prepared documents are immediately available, so the
+    writer is never starved while extraction is the bottleneck.
+    """
+    # Documents accepted in this run that the writer may not have stored yet
+    seen_hashes: dict[str, str] = {}
+    # Outputs awaiting the next flush, in input order. Entries are either
+    # finished outputs or (prepared, context_texts) waiting for vectors.
+    pending: list[tuple[Path, Any]] = []
+
+    try:
+        accumulator = _create_accumulator(config)
+    except BaseException as e:
+        _put(embedded_queue, _StageFailure(e), stop)
+        return
+
+    def flush() -> bool:
+        vectors = accumulator.flush() if accumulator is not None else {}
+        for file_path, output in pending:
+            if isinstance(output, tuple):
+                prepared, context_texts = output
+                output = assemble_embedded_document(
+                    prepared, config, vectors[id(prepared)], context_texts
+                )
+            if not _put(embedded_queue, (file_path, output), stop):
+                return False
+        pending.clear()
+        return True
+
+    while True:
+        if pending and prepared_queue.empty():
+            # Nothing ready upstream - hand what we have to the writer
+            try:
+                if not flush():
+                    return
+            except BaseException as e:
+                _put(embedded_queue, _StageFailure(e), stop)
+                return
+
+        item = _get(prepared_queue, stop)
+        if item is _END or isinstance(item, _StageFailure):
+            try:
+                if not flush():
+                    return
+            except BaseException as e:
+                item = _StageFailure(e)
+            _put(embedded_queue, item, stop)
+            return
+
+        file_path, future = item
+        try:
+            # Don't hold a partial batch while waiting on extraction
+            if pending and not future.done() and not flush():
+                return
+            prepared = future.result()
+            if isinstance(prepared, IndexResult):
+                pending.append((file_path, prepared))
+                continue
+
+            duplicate = check_duplicate(
+                prepared, store, config, skip_duplicates, seen_hashes=seen_hashes
+            )
+            if duplicate is not None:
+                pending.append((file_path, duplicate))
+                continue
+
+            seen_hashes.setdefault(prepared.content_hash, str(file_path))
+            if accumulator is None:
+                pending.append(
+                    (file_path, embed_document(prepared, config, contextual=contextual))
+                )
+                continue
+
+            embedding_texts, context_texts = generate_chunk_context(
+                prepared, config, contextual
+            )
+            accumulator.add(id(prepared), embedding_texts)
+            pending.append((file_path, (prepared, context_texts)))
+            if accumulator.is_full() and not flush():
+                return
+        except BaseException as e:
+            _put(embedded_queue, _StageFailure(e), stop)
+            return
+
+
+def run_staged_pipeline(
+    files: Iterable[Path],
+    store: ChromaStore,
+    config: RagdConfig,
+    workers: int,
+    skip_duplicates: bool = True,
+    bm25_index: BM25Index | None = None,
+    progress_callback: Callable[[int, int, str], None] | None = None,
+    contextual: bool | None = None,
+) -> list[IndexResult]:
+    """Index files through the staged parallel pipeline.
+
+    Args:
+        files: Files to index, in the order results should be returned.
+            May be a generator; progress totals then count the files
+            discovered so far
+        store: ChromaDB store
+        config: Configuration
+        workers: Number of extraction worker processes
+        skip_duplicates: Whether to skip already-indexed documents
+        bm25_index: Optional BM25 index for hybrid search
+        progress_callback: Optional callback for progress updates
+            (completed, total, filename)
+        contextual: Override contextual retrieval setting (uses config if None)
+
+    Returns:
+        List of IndexResult for each file, in input order
+
+    Raises:
+        Exception: Re-raises the first error from any stage
+    """
+    fed = _FeedCount()
+    known_total = len(files) if isinstance(files, Sized) else None
+    queue_size = max(config.indexing.queue_size, workers)
+    prepared_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    embedded_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    # Spawn (not fork) so workers never inherit locks held by model or DB threads
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(config,),
+    )
+    threads = [
+        threading.Thread(
+            target=_feed_stage,
+            args=(files, executor, prepared_queue, stop, fed),
+            name="ragd-index-feed",
+            daemon=True,
+        ),
+        threading.Thread(
+            target=_embed_stage,
+            args=(
+                store,
+                config,
+                skip_duplicates,
+                contextual,
+                prepared_queue,
+                embedded_queue,
+                stop,
+            ),
+            name="ragd-index-embed",
+            daemon=True,
+        ),
+    ]
+    logger.debug("Starting staged indexing: %s files, %d workers", known_total, workers)
+
+    results: list[IndexResult] = []
+    completed = False
+    try:
+        for thread in threads:
+            thread.start()
+
+        while True:
+            item = embedded_queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _StageFailure):
+                raise item.error
+
+            file_path, output = item
+            if isinstance(output, IndexResult):
+                result = output
+            else:
+                result = write_document(
+                    output,
+                    store=store,
+                    config=config,
+                    skip_duplicates=skip_duplicates,
+                    bm25_index=bm25_index,
+                )
+            results.append(result)
+
+            if progress_callback:
+                progress_callback(len(results), known_total or fed.value, file_path.name)
+
+        completed = True
+    finally:
+        stop.set()
+        for thread in threads:
+            if thread.is_alive():
+                thread.join()
+        executor.shutdown(wait=completed, cancel_futures=not completed)
+        _cancel_pending(prepared_queue)
+
+    # Final callback to mark all complete
+    if progress_callback:
+        progress_callback(len(results), len(results), "")
+
+    return results
+
+
+def _cancel_pending(q: queue.Queue[Any]) -> None:
+    """Cancel futures left in a queue after the pipeline stopped early."""
+    while True:
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            return
+        if isinstance(item, tuple) and isinstance(item[1], Future):
+            item[1].cancel()
@@ -6,8 +6,10 @@ extraction -> chunking -> embedding -> storage.
 
 from __future__ import annotations
 
+import itertools
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sized
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -15,21 +17,27 @@ from pathlib import Path
 from typing import Any
 
 from ragd.config import RagdConfig, load_config
-from ragd.embedding import ChunkBoundary, create_late_chunking_embedder, get_embedder
-from ragd.ingestion.chunker import chunk_text
+from ragd.embedding import ChunkBoundary, get_embedder, get_late_chunking_embedder
+from ragd.embedding.cache import get_embedding_cache
+from ragd.embedding.registry import get_model_registry
+from ragd.ingestion.chunker import Chunk, chunk_text
 from ragd.ingestion.extractor import ExtractionResult, extract_text
+from ragd.ingestion.manifest import MANIFEST_FILE, IndexManifest, ManifestScan
 from ragd.search.bm25 import BM25Index
 from ragd.storage import ChromaStore, DocumentRecord
 from ragd.storage.chromadb import generate_content_hash, generate_document_id
 from ragd.text import normalise_text
 from ragd.text.normalise import NormalisationSettings, source_type_from_file_type
-from ragd.utils.paths import discover_files, get_file_type
+from ragd.utils.paths import get_file_type, iter_files
 
 logger = logging.getLogger(__name__)
 
 # Minimum characters to consider extraction successful (below triggers OCR fallback)
 MIN_EXTRACTION_CHARS = 50
 
+# Streamed files checked against the manifest per query
+MANIFEST_SCAN_BATCH = 256
+
 
 class FailureCategory(Enum):
     """Categories for document extraction failures."""
@@ -63,6 +71,7 @@ class SkipReason(Enum):
     UNSUPPORTED_FORMAT = "unsupported_format"  # File extension not supported
     SYMLINK = "symlink"  # Security: symlinks are skipped
     EXCLUDED_BY_PATTERN = "excluded_by_pattern"  # Matches exclusion glob
+    UNCHANGED = "unchanged"  # Source file unchanged since last indexed
 
 
 # Human-readable descriptions for skip reasons
@@ -72,6 +81,7 @@ SKIP_REASON_DESCRIPTIONS = {
     SkipReason.UNSUPPORTED_FORMAT: "Unsupported file format",
     SkipReason.SYMLINK: "Symbolic link (skipped for security)",
     SkipReason.EXCLUDED_BY_PATTERN: "Excluded by pattern",
+    SkipReason.UNCHANGED: "Unchanged since last indexed",
 }
 
 
@@ -206,45 +216,81 @@ class IndexResult:
     skip_reason: SkipReason | None = None  # Why the document was skipped
     duplicate_of: str | None = None  # Path of original if duplicate
     duplicate_hash: str | None = None  # Content hash if duplicate
+    duplicate_id: str | None = None  # Document ID of original if duplicate
 
 
-def index_document(
+@dataclass
+class PreparedDocument:
+    """A document after extraction, normalisation and chunking.
+
+    Produced by :func:`prepare_document`. Contains only picklable data so
+    it can be returned from extraction worker processes.
+    """
+
+    path: Path
+    document_id: str
+    file_type: str
+    text: str
+    content_hash: str
+    chunks: list[Chunk]
+    extraction: ExtractionResult
+
+
+@dataclass
+class EmbeddedDocument:
+    """A prepared document with embeddings and storage records attached."""
+
+    prepared: PreparedDocument
+    chunk_texts: list[str]
+    embeddings: list[list[float]]
+    metadatas: list[dict[str, Any]]
+    document_record: DocumentRecord
+
+
+def _failure_result(
     path: Path,
-    store: ChromaStore,
-    config: RagdConfig,
-    skip_duplicates: bool = True,
-    bm25_index: BM25Index | None = None,
-    contextual: bool | None = None,
+    document_id: str,
+    result: ExtractionResult,
+    error_msg: str | None,
 ) -> IndexResult:
-    """Index a single document.
+    """Build a failed IndexResult with its classified failure category."""
+    category, remediation = classify_failure(path, result, error_msg)
+    return IndexResult(
+        document_id=document_id,
+        path=str(path),
+        filename=path.name,
+        chunk_count=0,
+        success=False,
+        error=error_msg,
+        failure_category=category,
+        remediation=remediation,
+    )
+
+
+def _duplicate_policy(config: RagdConfig) -> str:
+    """Get the configured duplicate handling policy."""
+    return config.indexing.duplicate_policy if hasattr(config, "indexing") else "skip"
+
+
+def prepare_document(path: Path, config: RagdConfig) -> PreparedDocument | IndexResult:
+    """Extract, normalise and chunk a document.
+
+    This is the CPU-bound part of indexing and touches no shared state,
+    so it is safe to run in a worker process.
 
     Args:
         path: Path to document
-        store: ChromaDB store
         config: Configuration
-        skip_duplicates: Whether to skip already-indexed documents
-        bm25_index: Optional BM25 index for hybrid search
-        contextual: Override contextual retrieval setting (uses config if None)
 
     Returns:
-        IndexResult with status
+        PreparedDocument, or a failed IndexResult if no chunks were produced
     """
     document_id = generate_document_id(path)
 
     # Extract text
     result = extract_text(path)
     if not result.success:
-        category, remediation = classify_failure(path, result, result.error)
-        return IndexResult(
-            document_id=document_id,
-            path=str(path),
-            filename=path.name,
-            chunk_count=0,
-            success=False,
-            error=result.error,
-            failure_category=category,
-            remediation=remediation,
-        )
+        return _failure_result(path, document_id, result, result.error)
 
     # Try OCR fallback if extraction yielded insufficient text
     extracted_chars = len(result.text.strip())
@@ -264,17 +310,7 @@ def index_document(
             f"file size: {path.stat().st_size} bytes). "
             "Document may be image-only, encrypted, or empty."
         )
-        category, remediation = classify_failure(path, result, error_msg)
-        return IndexResult(
-            document_id=document_id,
-            path=str(path),
-            filename=path.name,
-            chunk_count=0,
-            success=False,
-            error=error_msg,
-            failure_category=category,
-            remediation=remediation,
-        )
+        return _failure_result(path, document_id, result, error_msg)
 
     # Apply text normalisation
     text = result.text
@@ -293,34 +329,9 @@ def index_document(
         norm_result = normalise_text(text, source_type, settings)
         text = norm_result.text
 
-    # Check for duplicates (use normalised text for hash)
+    # Hash normalised text for duplicate detection
     content_hash = generate_content_hash(text)
 
-    # Determine duplicate handling based on config
-    duplicate_policy = config.indexing.duplicate_policy if hasattr(config, "indexing") else "skip"
-
-    if skip_duplicates and duplicate_policy != "overwrite":
-        # Check for content hash duplicate
-        existing_doc = store.find_by_content_hash(content_hash)
-        if existing_doc:
-            return IndexResult(
-                document_id=document_id,
-                path=str(path),
-                filename=path.name,
-                chunk_count=0,
-                success=True,
-                skipped=True,
-                skip_reason=SkipReason.DUPLICATE_CONTENT,
-                duplicate_of=existing_doc.path,
-                duplicate_hash=content_hash,
-            )
-
-    # Handle overwrite policy: delete existing document first
-    if duplicate_policy == "overwrite":
-        existing_doc = store.find_by_content_hash(content_hash)
-        if existing_doc:
-            store.delete_document(existing_doc.document_id)
-
     # Chunk normalised text
     chunks = chunk_text(
         text,
@@ -354,23 +365,91 @@ def index_document(
             f"No chunks generated (extracted {text_len} chars, min_chunk_size={min_size}). "
             f"Text too short or filtered out. Method: {result.extraction_method}"
         )
-        category, remediation = classify_failure(path, result, error_msg)
-        return IndexResult(
-            document_id=document_id,
-            path=str(path),
-            filename=path.name,
-            chunk_count=0,
-            success=False,
-            error=error_msg,
-            failure_category=category,
-            remediation=remediation,
-        )
+        return _failure_result(path, document_id, result, error_msg)
+
+    return PreparedDocument(
+        path=path,
+        document_id=document_id,
+        file_type=file_type,
+        text=text,
+        content_hash=content_hash,
+        chunks=chunks,
+        extraction=result,
+    )
+
+
+def check_duplicate(
+    prepared: PreparedDocument,
+    store: ChromaStore,
+    config: RagdConfig,
+    skip_duplicates: bool = True,
+    seen_hashes: dict[str, str] | None = None,
+) -> IndexResult | None:
+    """Check whether a prepared document duplicates indexed content.
+
+    Args:
+        prepared: Prepared document
+        store: ChromaDB store
+        config: Configuration
+        skip_duplicates: Whether to skip already-indexed documents
+        seen_hashes: Optional content hash -> path map of documents accepted
+            earlier in the same run but not yet written to the store
 
+    Returns:
+        Skipped IndexResult if the document is a duplicate, otherwise None
+    """
+    if not skip_duplicates or _duplicate_policy(config) == "overwrite":
+        return None
+
+    duplicate_of: str | None = None
+    duplicate_id: str | None = None
+    if seen_hashes is not None and prepared.content_hash in seen_hashes:
+        duplicate_of = seen_hashes[prepared.content_hash]
+        duplicate_id = generate_document_id(Path(duplicate_of))
+    else:
+        existing_doc = store.find_by_content_hash(prepared.content_hash)
+        if existing_doc:
+            duplicate_of = existing_doc.path
+            duplicate_id = existing_doc.document_id
+
+    if duplicate_of is None:
+        return None
+
+    return IndexResult(
+        document_id=prepared.document_id,
+        path=str(prepared.path),
+        filename=prepared.path.name,
+        chunk_count=0,
+        success=True,
+        skipped=True,
+        skip_reason=SkipReason.DUPLICATE_CONTENT,
+        duplicate_of=duplicate_of,
+        duplicate_hash=prepared.content_hash,
+        duplicate_id=duplicate_id,
+    )
+
+
+def generate_chunk_context(
+    prepared: PreparedDocument,
+    config: RagdConfig,
+    contextual: bool | None = None,
+) -> tuple[list[str], list[str]]:
+    """Build the texts to embed for a document's chunks.
+
+    Args:
+        prepared: Prepared document
+        config: Configuration
+        contextual: Override contextual retrieval setting (uses config if None)
+
+    Returns:
+        Tuple of (embedding texts, generated contexts). Contexts are empty
+        when contextual retrieval is disabled or unavailable.
+    """
     # Determine if contextual retrieval is enabled
     use_contextual = contextual if contextual is not None else config.retrieval.contextual.enabled
 
     # Original chunk content (for storage and BM25)
-    original_chunk_texts = [c.content for c in chunks]
+    original_chunk_texts = [c.content for c in prepared.chunks]
 
     # Generate context for chunks (if enabled and LLM available)
     # Embedding texts may include context prefix
@@ -389,8 +468,8 @@ def index_document(
             if context_gen is not None:
                 contextual_chunks = context_gen.generate_contextual_chunks(
                     chunks=[(i, c) for i, c in enumerate(original_chunk_texts)],
-                    title=path.name,
-                    file_type=file_type,
+                    title=prepared.path.name,
+                    file_type=prepared.file_type,
                 )
                 # Use combined text for embedding, store context separately
                 embedding_texts = [cc.combined for cc in contextual_chunks]
@@ -400,13 +479,36 @@ def index_document(
             # Graceful fallback - continue without context
             logger.debug("Contextual retrieval unavailable: %s", e)
 
+    return embedding_texts, context_texts
+
+
+def embed_document(
+    prepared: PreparedDocument,
+    config: RagdConfig,
+    contextual: bool | None = None,
+) -> EmbeddedDocument:
+    """Generate context, embeddings and storage records for a document.
+
+    Args:
+        prepared: Prepared document
+        config: Configuration
+        contextual: Override contextual retrieval setting (uses config if None)
+
+    Returns:
+        EmbeddedDocument ready to be written to the stores
+    """
+    embedding_texts, context_texts = generate_chunk_context(prepared, config, contextual)
+
     # Generate embeddings (using context-enhanced text if available)
     # Check if late chunking is enabled and available
-    use_late_chunking = config.embedding.late_chunking
-    if use_late_chunking:
-        late_embedder = create_late_chunking_embedder(
+    if config.embedding.late_chunking:
+        late_embedder = get_late_chunking_embedder(
             model_name=config.embedding.late_chunking_model,
             device=config.embedding.device,
+            max_context_tokens=config.embedding.max_context_tokens,
+            window_overlap=config.embedding.late_chunking_window_overlap,
+            window_batch_size=config.embedding.late_chunking_window_batch,
+            cache=get_embedding_cache(config),
         )
         if late_embedder is not None:
             # Use late chunking with full document context
@@ -416,20 +518,58 @@ def index_document(
                     end=chunk.end_char,
                     content=embedding_texts[i],  # Use context-enhanced if available
                 )
-                for i, chunk in enumerate(chunks)
+                for i, chunk in enumerate(prepared.chunks)
             ]
-            embeddings = late_embedder.embed_document_chunks(text, chunk_boundaries)
-        else:
-            # Fall back to standard embedding
-            use_late_chunking = False
+            embeddings = late_embedder.embed_document_chunks(prepared.text, chunk_boundaries)
+            # Late chunking models have varying dimensions; get from embedder
+            return assemble_embedded_document(
+                prepared,
+                config,
+                embeddings,
+                context_texts,
+                embedding_model=config.embedding.late_chunking_model,
+                embedding_dimension=late_embedder.dimension,
+                late_chunking=True,
+            )
+        # Fall back to standard embedding
+
+    embedder = get_embedder(
+        model_name=config.embedding.model,
+        device=config.embedding.device,
+        batch_size=config.embedding.batch_size,
+        revision=config.embedding.revision,
+        cache=get_embedding_cache(config),
+    )
+    embeddings = embedder.embed(embedding_texts)
+    return assemble_embedded_document(prepared, config, embeddings, context_texts)
 
-    if not use_late_chunking:
-        embedder = get_embedder(
-            model_name=config.embedding.model,
-            device=config.embedding.device,
-            batch_size=config.embedding.batch_size,
-        )
-        embeddings = embedder.embed(embedding_texts)
+
+def assemble_embedded_document(
+    prepared: PreparedDocument,
+    config: RagdConfig,
+    embeddings: list[list[float]],
+    context_texts: list[str],
+    embedding_model: str | None = None,
+    embedding_dimension: int | None = None,
+    late_chunking: bool = False,
+) -> EmbeddedDocument:
+    """Attach embeddings and build chunk metadata and the document record.
+
+    Args:
+        prepared: Prepared document
+        config: Configuration
+        embeddings: One embedding per chunk
+        context_texts: Generated chunk contexts (may be empty)
+        embedding_model: Model that produced the embeddings (defaults to config)
+        embedding_dimension: Embedding dimension (defaults to config)
+        late_chunking: Whether late chunking produced the embeddings
+
+    Returns:
+        EmbeddedDocument ready to be written to the stores
+    """
+    path = prepared.path
+    file_type = prepared.file_type
+    result = prepared.extraction
 
     # Extract PDF metadata for document reference resolution
     pdf_metadata = {}
@@ -446,7 +586,7 @@ def index_document(
 
     # Prepare metadata for each chunk
     metadatas = []
-    for i, chunk in enumerate(chunks):
+    for i, chunk in enumerate(prepared.chunks):
         metadata = {
             "chunk_index": chunk.index,
             "start_char": chunk.start_char,
@@ -464,51 +604,82 @@ def index_document(
             metadata["context"] = context_texts[i]
         metadatas.append(metadata)
 
-    # Determine which embedding model was used
-    if use_late_chunking:
-        embedding_model = config.embedding.late_chunking_model
-        # Late chunking models have varying dimensions; get from embedder
-        embedding_dimension = late_embedder.dimension if late_embedder else config.embedding.dimension
-    else:
-        embedding_model = config.embedding.model
-        embedding_dimension = config.embedding.dimension
-
     # Create document record
     document_record = DocumentRecord(
-        document_id=document_id,
+        document_id=prepared.document_id,
         path=str(path),
         filename=path.name,
         file_type=file_type,
         file_size=path.stat().st_size,
-        chunk_count=len(chunks),
+        chunk_count=len(prepared.chunks),
         indexed_at=datetime.now().isoformat(),
-        content_hash=content_hash,
+        content_hash=prepared.content_hash,
         metadata={
             "pages": result.pages,
             "extraction_method": result.extraction_method,
             "normalised": config.normalisation.enabled,
             "contextual": bool(context_texts),  # Was context generated?
-            "late_chunking": use_late_chunking,  # Was late chunking used?
+            "late_chunking": late_chunking,  # Was late chunking used?
             # v2.1: Track embedding model for multi-modal and archive compatibility
-            "embedding_model": embedding_model,
-            "embedding_dimension": embedding_dimension,
+            "embedding_model": embedding_model or config.embedding.model,
+            "embedding_dimension": embedding_dimension or config.embedding.dimension,
         },
     )
 
-    # Store in ChromaDB (use original content for display)
-    store.add_document(
-        document_id=document_id,
-        chunks=original_chunk_texts,
+    return EmbeddedDocument(
+        prepared=prepared,
+        chunk_texts=[c.content for c in prepared.chunks],
         embeddings=embeddings,
         metadatas=metadatas,
         document_record=document_record,
     )
 
+
+def write_document(
+    embedded: EmbeddedDocument,
+    store: ChromaStore,
+    config: RagdConfig,
+    skip_duplicates: bool = True,
+    bm25_index: BM25Index | None = None,
+) -> IndexResult:
+    """Write an embedded document to the stores.
+
+    Args:
+        embedded: Embedded document
+        store: ChromaDB store
+        config: Configuration
+        skip_duplicates: Whether to skip already-indexed images
+        bm25_index: Optional BM25 index for hybrid search
+
+    Returns:
+        IndexResult with status
+    """
+    prepared = embedded.prepared
+    path = prepared.path
+    document_id = prepared.document_id
+    file_type = prepared.file_type
+    result = prepared.extraction
+
+    # Handle overwrite policy: delete existing document first
+    if _duplicate_policy(config) == "overwrite":
+        existing_doc = store.find_by_content_hash(prepared.content_hash)
+        if existing_doc:
+            store.delete_document(existing_doc.document_id)
+
+    # Store in ChromaDB (use original content for display)
+    store.add_document(
+        document_id=document_id,
+        chunks=embedded.chunk_texts,
+        embeddings=embedded.embeddings,
+        metadatas=embedded.metadatas,
+        document_record=embedded.document_record,
+    )
+
     # Add to BM25 index for hybrid search (use original content)
     if bm25_index is not None:
         chunk_tuples = [
             (f"{document_id}_chunk_{i}", content)
-            for i, content in enumerate(original_chunk_texts)
+            for i, content in enumerate(embedded.chunk_texts)
         ]
         bm25_index.add_chunks(document_id, chunk_tuples)
 
@@ -566,7 +737,7 @@ def index_document(
         document_id=document_id,
         path=str(path),
         filename=path.name,
-        chunk_count=len(chunks),
+        chunk_count=len(prepared.chunks),
         success=True,
         image_count=image_count,
         quality_warning=quality_warning,
@@ -574,6 +745,167 @@ def index_document(
     )
 
 
+def index_document(
+    path: Path,
+    store: ChromaStore,
+    config: RagdConfig,
+    skip_duplicates: bool = True,
+    bm25_index: BM25Index | None = None,
+    contextual: bool | None = None,
+) -> IndexResult:
+    """Index a single document.
+
+    Args:
+        path: Path to document
+        store: ChromaDB store
+        config: Configuration
+        skip_duplicates: Whether to skip already-indexed documents
+        bm25_index: Optional BM25 index for hybrid search
+        contextual: Override contextual retrieval setting (uses config if None)
+
+    Returns:
+        IndexResult with status
+    """
+    prepared = prepare_document(path, config)
+    if isinstance(prepared, IndexResult):
+        return prepared
+
+    duplicate = check_duplicate(prepared, store, config, skip_duplicates)
+    if duplicate is not None:
+        return duplicate
+
+    embedded = embed_document(prepared, config, contextual=contextual)
+    return write_document(
+        embedded,
+        store=store,
+        config=config,
+        skip_duplicates=skip_duplicates,
+        bm25_index=bm25_index,
+    )
+
+
+def _changed_files(
+    files: Iterable[Path],
+    manifest: IndexManifest,
+    indexed_ids: set[str],
+    scan: ManifestScan,
+) -> Iterator[Path]:
+    """Filter streamed files down to those changed since indexing.
+
+    Files are checked against the manifest in batches. Unchanged files and
+    the stat snapshots of changed ones are accumulated in ``scan``.
+
+    Args:
+        files: Discovered files
+        manifest: Source file manifest
+        indexed_ids: Document IDs present in the store
+        scan: Accumulator for the results of each batch
+
+    Yields:
+        Files to index
+    """
+    while batch := list(itertools.islice(files, MANIFEST_SCAN_BATCH)):
+        batch_scan = manifest.scan(batch, indexed_ids=indexed_ids)
+        scan.unchanged.extend(batch_scan.unchanged)
+        scan.states.update(batch_scan.states)
+        yield from batch_scan.changed
+
+
+def _index_files(
+    files: Iterable[Path],
+    store: ChromaStore,
+    bm25_index: BM25Index,
+    config: RagdConfig,
+    stack: ExitStack,
+    skip_duplicates: bool,
+    progress_callback: Callable[[int, int, str], None] | None,
+    contextual: bool | None,
+    many: bool,
+) -> list[IndexResult]:
+    """Index files through the staged or sequential pipeline.
+
+    Args:
+        files: Files to index (may be a generator)
+        store: ChromaDB store
+        bm25_index: BM25 index for hybrid search
+        config: Configuration
+        stack: Exit stack holding resources for the run
+        skip_duplicates: Whether to skip already-indexed documents
+        progress_callback: Optional callback for progress updates
+        contextual: Override contextual retrieval setting
+        many: Whether there is more than one file
+
+    Returns:
+        One IndexResult per file, in input order
+    """
+    from ragd.ingestion.parallel import resolve_worker_count, run_staged_pipeline
+
+    if many:
+        # Batch BM25 writes and defer FTS merging until the run ends
+        stack.enter_context(bm25_index.bulk_load())
+    # Keep the late chunking model resident for the whole run
+    if config.embedding.late_chunking:
+        late_embedder = get_late_chunking_embedder(
+            model_name=config.embedding.late_chunking_model,
+            device=config.embedding.device,
+            max_context_tokens=config.embedding.max_context_tokens,
+            window_overlap=config.embedding.late_chunking_window_overlap,
+            window_batch_size=config.embedding.late_chunking_window_batch,
+        )
+        if late_embedder is not None:
+            stack.enter_context(get_model_registry().lease(late_embedder))
+
+    workers = resolve_worker_count(config, None if many else 1)
+    if workers > 1:
+        return run_staged_pipeline(
+            files,
+            store=store,
+            config=config,
+            workers=workers,
+            skip_duplicates=skip_duplicates,
+            bm25_index=bm25_index,
+            progress_callback=progress_callback,
+            contextual=contextual,
+        )
+
+    results = []
+    total = len(files) if isinstance(files, Sized) else None
+
+    for i, file_path in enumerate(files):
+        # Show current file being processed (1-based for display)
+        if progress_callback:
+            progress_callback(i + 1, total or i + 1, file_path.name)
+
+        result = index_document(
+            file_path,
+            store=store,
+            config=config,
+            skip_duplicates=skip_duplicates,
+            bm25_index=bm25_index,
+            contextual=contextual,
+        )
+        results.append(result)
+
+    # Final callback to mark all complete
+    if progress_callback:
+        progress_callback(len(results), len(results), "")
+
+    return results
+
+
+def _unchanged_result(path: Path) -> IndexResult:
+    """Build the skipped IndexResult for a file unchanged since indexing."""
+    return IndexResult(
+        document_id=generate_document_id(path),
+        path=str(path),
+        filename=path.name,
+        chunk_count=0,
+        success=True,
+        skipped=True,
+        skip_reason=SkipReason.UNCHANGED,
+    )
+
+
 def index_path(
     path: Path,
     config: RagdConfig | None = None,
@@ -584,6 +916,16 @@ def index_path(
 ) -> list[IndexResult]:
     """Index documents from a path.
 
+    Directories with more than one file are indexed through the staged
+    parallel pipeline (see :mod:`ragd.ingestion.parallel`) unless
+    ``indexing.workers`` resolves to a single worker.
+
+    Files are streamed from discovery (see
+    :func:`ragd.utils.paths.iter_files`), so indexing starts while the
+    tree is still being walked. With ``indexing.incremental`` enabled,
+    files unchanged since they were last indexed (see
+    :mod:`ragd.ingestion.manifest`) are skipped before they are opened.
+
     Args:
         path: File or directory path
         config: Configuration (loads default if not provided)
@@ -593,43 +935,93 @@ def index_path(
         contextual: Override contextual retrieval setting (uses config if None)
 
     Returns:
-        List of IndexResult for each document
+        List of IndexResult for each document, sorted by path
     """
     if config is None:
         config = load_config()
 
-    # Discover files
-    files = discover_files(path, recursive=recursive)
-    if not files:
+    # Stream discovered files; nothing is opened until the first one is found
+    walker = iter_files(path, recursive=recursive)
+    first = next(walker, None)
+    if first is None:
         return []
+    discovered = itertools.chain([first], walker)
 
     # Initialise stores
     store = ChromaStore(config.chroma_path)
     bm25_index = BM25Index(config.chroma_path / "bm25.db")
 
-    results = []
-    total = len(files)
+    # Files skipped by the manifest, collected as discovery proceeds
+    scan = ManifestScan()
 
-    try:
-        for i, file_path in enumerate(files):
-            # Show current file being processed (1-based for display)
-            if progress_callback:
-                progress_callback(i + 1, total, file_path.name)
+    with ExitStack() as stack:
+        stack.callback(bm25_index.close)
+        stack.callback(walker.close)
+
+        # Skip files the manifest shows are unchanged and still indexed
+        manifest: IndexManifest | None = None
+        to_index: Iterator[Path] = discovered
+        if (
+            config.indexing.incremental
+            and skip_duplicates
+            and _duplicate_policy(config) != "overwrite"
+        ):
+            manifest = stack.enter_context(
+                IndexManifest(config.chroma_path / MANIFEST_FILE)
+            )
+            to_index = _changed_files(
+                discovered, manifest, store.list_document_ids(), scan
+            )
 
-            result = index_document(
-                file_path,
+        # Peek ahead so unchanged trees and single files skip pipeline setup
+        head = list(itertools.islice(to_index, 2))
+        to_index = itertools.chain(head, to_index)
+
+        # Report progress against all discovered files
+        callback = progress_callback
+        if progress_callback and manifest is not None:
+
+            def offset_callback(completed: int, total: int, filename: str) -> None:
+                skipped = len(scan.unchanged)
+                progress_callback(completed + skipped, total + skipped, filename)
+
+            callback = offset_callback
+
+        if head:
+            results = _index_files(
+                to_index,
                 store=store,
+                bm25_index=bm25_index,
                 config=config,
+                stack=stack,
                 skip_duplicates=skip_duplicates,
-                bm25_index=bm25_index,
+                progress_callback=callback,
                 contextual=contextual,
+                many=len(head) > 1,
+            )
+        else:
+            results = []
+            if progress_callback:
+                skipped = len(scan.unchanged)
+                progress_callback(skipped, skipped, "")
+
+        if manifest is not None:
+            # Duplicates are recorded under the document they duplicate, so
+            # they are skipped until that document leaves the store
+            indexed = [
+                (
+                    scan.states[Path(result.path)],
+                    result.duplicate_id or result.document_id,
+                )
+                for result in results
+                if result.success
+                and (not result.skipped or result.duplicate_id is not None)
+                and Path(result.path) in scan.states
+            ]
+            manifest.record(
+                [state for state, _ in indexed], [doc_id for _, doc_id in indexed]
             )
-            results.append(result)
-
-        # Final callback to mark all complete
-        if progress_callback:
-            progress_callback(total, total, "")
-    finally:
-        bm25_index.close()
 
-    return results
+    results.extend(_unchanged_result(file_path) for file_path in scan.unchanged)
+    # Discovery order is arbitrary; return results sorted by path
+    return sorted(results, key=lambda result: Path(result.path))
@@ -12,14 +12,15 @@ import hashlib
 import json
 import logging
 import sqlite3
-from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from datetime import datetime
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ragd.storage.connections import get_pool
+
 if TYPE_CHECKING:
     from ragd.metadata.tags import TagManager
 
@@ -188,19 +189,14 @@ class CollectionManager:
         """
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(db_path)
         self._tag_manager = tag_manager
         self._init_schema()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-    @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def _connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Borrow this thread's pooled database connection."""
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         """Initialise database schema for collections."""
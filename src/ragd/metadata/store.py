@@ -9,17 +9,24 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
-from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ragd.metadata.migration import migrate_to_current, needs_migration
 from ragd.metadata.schema import DocumentMetadata
+from ragd.storage.connections import get_pool
 
 logger = logging.getLogger(__name__)
 
+# Data tier of documents stored before ragd_data_tier, by sensitivity
+_LEGACY_SENSITIVITY_TIERS = {
+    "public": "public",
+    "internal": "personal",
+    "confidential": "sensitive",
+}
+
 
 class MetadataStore:
     """SQLite-based storage for document metadata.
@@ -44,18 +51,13 @@ class MetadataStore:
         """
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(db_path)
         self._init_schema()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-    @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def _connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Borrow this thread's pooled database connection."""
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         """Initialise database schema."""
@@ -244,6 +246,31 @@ class MetadataStore:
             rows = conn.execute("SELECT id FROM documents").fetchall()
             return [row["id"] for row in rows]
 
+    def list_data_tiers(self) -> dict[str, str]:
+        """Map every document ID to its data tier in one query.
+
+        Reads the tier straight from the stored JSON instead of loading
+        each document. Rows written before data tiers existed fall back to
+        their sensitivity, as in ``DocumentMetadata.from_dict``.
+
+        Returns:
+            Mapping of document ID to tier value (not validated)
+        """
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id,
+                       json_extract(metadata, '$.ragd_data_tier') AS tier,
+                       json_extract(metadata, '$.ragd_sensitivity') AS sensitivity
+                FROM documents
+                """
+            ).fetchall()
+        return {
+            row["id"]: row["tier"]
+            or _LEGACY_SENSITIVITY_TIERS.get(row["sensitivity"] or "public", "personal")
+            for row in rows
+        }
+
     def count(self) -> int:
         """Count total documents in the store.
 
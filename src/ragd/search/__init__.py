@@ -24,8 +24,12 @@ from ragd.search.decompose import (
 from ragd.search.hybrid import (
     HybridSearcher,
     HybridSearchResult,
+    SearcherPool,
     SearchMode,
+    close_searchers,
+    get_searcher,
     hybrid_search,
+    lease_searcher,
     reciprocal_rank_fusion,
 )
 from ragd.search.multimodal import (
@@ -58,6 +62,10 @@ __all__ = [
     "SearchMode",
     "hybrid_search",
     "reciprocal_rank_fusion",
+    "SearcherPool",
+    "get_searcher",
+    "lease_searcher",
+    "close_searchers",
     # Reranking (F-065)
     "CrossEncoderReranker",
     "RerankResult",
@@ -6,11 +6,27 @@ Uses SQLite's built-in FTS5 extension for efficient BM25 ranking.
 
 from __future__ import annotations
 
+import logging
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ragd.storage.generation import bump_generation
+
+logger = logging.getLogger(__name__)
+
+# SQLite VM instructions between deadline checks
+_PROGRESS_STEPS = 1000
+
+
+class BM25TimeoutError(sqlite3.OperationalError):
+    """A search was aborted because it ran past its deadline."""
+
 
 @dataclass
 class BM25Result:
@@ -31,6 +47,12 @@ class BM25Index:
     """
 
     TABLE_NAME = "chunks_fts"
+    CONTENT_TABLE = "chunks"
+    # PRAGMA user_version of the external-content schema
+    SCHEMA_VERSION = 2
+    # FTS5 merge defaults restored after a bulk load
+    DEFAULT_AUTOMERGE = 4
+    DEFAULT_CRISISMERGE = 16
 
     def __init__(self, db_path: Path) -> None:
         """Initialise BM25 index.
@@ -41,37 +63,134 @@ class BM25Index:
         self.db_path = db_path
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = sqlite3.connect(str(db_path))
+        # Searchers may be shared between threads; the lock serialises use
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # Documents written since the last commit while bulk loading
+        self._bulk_batch = 0
+        self._bulk_pending = 0
         self._create_tables()
 
     def _create_tables(self) -> None:
-        """Create FTS5 virtual table if not exists."""
+        """Create the index tables, migrating a legacy index if present.
+
+        Chunk rows live in an ordinary table with an index on
+        ``document_id``; the FTS5 table indexes their content externally
+        and is kept in sync by triggers. Deletes and per-document filters
+        are therefore index lookups rather than scans of the FTS table.
+        """
         cursor = self._conn.cursor()
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        legacy = version < self.SCHEMA_VERSION and cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (self.TABLE_NAME,)
+        ).fetchone()
+
+        if legacy:
+            self._migrate_legacy(cursor)
+        else:
+            self._create_schema(cursor)
+
+        # Create document tracking table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS indexed_documents (
+                document_id TEXT PRIMARY KEY,
+                indexed_at TEXT
+            )
+            """
+        )
+
+        self._conn.commit()
+
+    def _create_schema(self, cursor: sqlite3.Cursor, triggers: bool = True) -> None:
+        """Create the chunk table, FTS5 index and sync triggers.
+
+        Args:
+            cursor: Cursor to create the schema with
+            triggers: Also create the sync triggers (a migration creates
+                them after copying rows, so the copy is not indexed twice)
+        """
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.CONTENT_TABLE} (
+                id INTEGER PRIMARY KEY,
+                chunk_id TEXT NOT NULL,
+                document_id TEXT NOT NULL,
+                content TEXT NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.CONTENT_TABLE}_document "
+            f"ON {self.CONTENT_TABLE}(document_id)"
+        )
 
         # Create FTS5 table with porter stemmer tokenizer
         cursor.execute(
             f"""
             CREATE VIRTUAL TABLE IF NOT EXISTS {self.TABLE_NAME} USING fts5(
                 content,
-                chunk_id UNINDEXED,
-                document_id UNINDEXED,
+                content='{self.CONTENT_TABLE}',
+                content_rowid='id',
                 tokenize='porter unicode61'
             )
             """
         )
+        if triggers:
+            self._create_triggers(cursor)
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
 
-        # Create document tracking table
+    def _create_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """Create the triggers that keep the FTS5 index in sync."""
         cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.CONTENT_TABLE}_ai
+            AFTER INSERT ON {self.CONTENT_TABLE} BEGIN
+                INSERT INTO {self.TABLE_NAME}(rowid, content)
+                VALUES (new.id, new.content);
+            END
             """
-            CREATE TABLE IF NOT EXISTS indexed_documents (
-                document_id TEXT PRIMARY KEY,
-                indexed_at TEXT
-            )
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {self.CONTENT_TABLE}_ad
+            AFTER DELETE ON {self.CONTENT_TABLE} BEGIN
+                INSERT INTO {self.TABLE_NAME}({self.TABLE_NAME}, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END
             """
         )
 
-        self._conn.commit()
+    def _migrate_legacy(self, cursor: sqlite3.Cursor) -> None:
+        """Convert a self-contained FTS5 index to the external-content schema.
+
+        Rows are copied once in rowid order and the new FTS index is built
+        in a single rebuild pass, all inside one transaction. The sync
+        triggers are created afterwards, so copied rows are not also
+        indexed one at a time.
+        """
+        logger.info("Migrating BM25 index %s to indexed schema", self.db_path)
+        legacy = f"{self.TABLE_NAME}_legacy"
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(f"ALTER TABLE {self.TABLE_NAME} RENAME TO {legacy}")
+            self._create_schema(cursor, triggers=False)
+            cursor.execute(
+                f"""
+                INSERT INTO {self.CONTENT_TABLE} (id, chunk_id, document_id, content)
+                SELECT rowid, chunk_id, document_id, content FROM {legacy}
+                """
+            )
+            cursor.execute(f"DROP TABLE {legacy}")
+            cursor.execute(
+                f"INSERT INTO {self.TABLE_NAME}({self.TABLE_NAME}) VALUES ('rebuild')"
+            )
+            self._create_triggers(cursor)
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
 
     def add_chunks(
         self,
@@ -87,30 +206,113 @@ class BM25Index:
         if not chunks:
             return
 
-        cursor = self._conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        # Delete existing chunks for this document (for re-indexing)
-        cursor.execute(
-            f"DELETE FROM {self.TABLE_NAME} WHERE document_id = ?",
-            (document_id,),
-        )
+            # Delete existing chunks for this document (for re-indexing)
+            cursor.execute(
+                f"DELETE FROM {self.CONTENT_TABLE} WHERE document_id = ?",
+                (document_id,),
+            )
 
-        # Insert new chunks
-        cursor.executemany(
-            f"INSERT INTO {self.TABLE_NAME} (content, chunk_id, document_id) VALUES (?, ?, ?)",
-            [(content, chunk_id, document_id) for chunk_id, content in chunks],
-        )
+            # Insert new chunks (triggers index the content)
+            cursor.executemany(
+                f"INSERT INTO {self.CONTENT_TABLE} (chunk_id, document_id, content) "
+                "VALUES (?, ?, ?)",
+                [(chunk_id, document_id, content) for chunk_id, content in chunks],
+            )
 
-        # Track document
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO indexed_documents (document_id, indexed_at)
-            VALUES (?, datetime('now'))
-            """,
-            (document_id,),
-        )
+            # Track document
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO indexed_documents (document_id, indexed_at)
+                VALUES (?, datetime('now'))
+                """,
+                (document_id,),
+            )
 
-        self._conn.commit()
+            if self._bulk_batch:
+                self._bulk_pending += 1
+                if self._bulk_pending < self._bulk_batch:
+                    return
+                self._bulk_pending = 0
+            self._conn.commit()
+        bump_generation(self.db_path.parent)
+
+    @contextmanager
+    def bulk_load(
+        self,
+        batch_documents: int = 500,
+        cache_mb: int = 64,
+    ) -> Iterator[BM25Index]:
+        """Tune the index for loading many documents.
+
+        Inside the block, ``add_chunks`` commits once per
+        ``batch_documents`` documents, the database runs in WAL mode with a
+        larger page cache, and FTS5 segment merging is deferred. On exit
+        the remaining batch is committed, the previous journal mode, sync
+        and cache settings and merge settings are restored, and the index
+        is merged into a single b-tree with ``optimize``. If another
+        connection holds the database, leaving WAL mode is not possible
+        and the database stays in WAL mode.
+
+        Args:
+            batch_documents: Documents written per transaction
+            cache_mb: SQLite page cache size during the load
+
+        Yields:
+            This index
+        """
+        with self._lock:
+            # Nested bulk loads share the outer one
+            nested = bool(self._bulk_batch)
+            if not nested:
+                self._conn.commit()
+                cursor = self._conn.cursor()
+                previous_cache = cursor.execute("PRAGMA cache_size").fetchone()[0]
+                previous_sync = cursor.execute("PRAGMA synchronous").fetchone()[0]
+                previous_journal = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+                cursor.execute("PRAGMA journal_mode = WAL")
+                cursor.execute("PRAGMA synchronous = NORMAL")
+                cursor.execute(f"PRAGMA cache_size = {-cache_mb * 1024}")
+                self._set_fts_option("automerge", 0)
+                self._set_fts_option("crisismerge", 64)
+                self._conn.commit()
+                self._bulk_batch = max(1, batch_documents)
+                self._bulk_pending = 0
+
+        if nested:
+            yield self
+            return
+
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._bulk_batch = 0
+                self._bulk_pending = 0
+                self._conn.commit()
+                self._set_fts_option("automerge", self.DEFAULT_AUTOMERGE)
+                self._set_fts_option("crisismerge", self.DEFAULT_CRISISMERGE)
+                self._conn.execute(
+                    f"INSERT INTO {self.TABLE_NAME}({self.TABLE_NAME}) VALUES ('optimize')"
+                )
+                self._conn.commit()
+                cursor = self._conn.cursor()
+                cursor.execute(f"PRAGMA synchronous = {previous_sync}")
+                cursor.execute(f"PRAGMA cache_size = {previous_cache}")
+                try:
+                    cursor.execute(f"PRAGMA journal_mode = {previous_journal}")
+                except sqlite3.OperationalError as e:
+                    logger.debug("Keeping BM25 index in WAL mode: %s", e)
+            bump_generation(self.db_path.parent)
+
+    def _set_fts_option(self, option: str, value: int) -> None:
+        """Set a persistent FTS5 configuration option."""
+        self._conn.execute(
+            f"INSERT INTO {self.TABLE_NAME}({self.TABLE_NAME}, rank) VALUES (?, ?)",
+            (option, value),
+        )
 
     def search(
         self,
@@ -118,6 +320,7 @@ class BM25Index:
         limit: int = 10,
         document_filter: str | None = None,
         document_ids: list[str] | None = None,
+        deadline: float | None = None,
     ) -> list[BM25Result]:
         """Search using BM25 ranking.
 
@@ -126,6 +329,8 @@ class BM25Index:
             limit: Maximum results
             document_filter: Optional single document ID to filter by (deprecated)
             document_ids: Optional list of document IDs to filter by
+            deadline: Optional ``time.monotonic()`` value after which the
+                query is aborted with BM25TimeoutError
 
         Returns:
             List of BM25Result ordered by relevance
@@ -133,79 +338,143 @@ class BM25Index:
         if not query.strip():
             return []
 
-        cursor = self._conn.cursor()
+        with self._lock, self._deadline(deadline):
+            cursor = self._conn.cursor()
+
+            # Escape special FTS5 characters
+            escaped_query = self._escape_query(query)
+
+            # Handle document filtering (document_ids takes precedence);
+            # filters resolve through the document_id index on the chunk table
+            if document_ids:
+                # Multiple document IDs - use IN clause
+                placeholders = ",".join("?" for _ in document_ids)
+                cursor.execute(
+                    f"""
+                    SELECT
+                        c.chunk_id,
+                        c.document_id,
+                        c.content,
+                        bm25({self.TABLE_NAME}) as score
+                    FROM {self.TABLE_NAME}
+                    JOIN {self.CONTENT_TABLE} c ON c.id = {self.TABLE_NAME}.rowid
+                    WHERE {self.TABLE_NAME} MATCH ?
+                        AND c.document_id IN ({placeholders})
+                    ORDER BY score
+                    LIMIT ?
+                    """,
+                    (escaped_query, *document_ids, limit),
+                )
+            elif document_filter:
+                cursor.execute(
+                    f"""
+                    SELECT
+                        c.chunk_id,
+                        c.document_id,
+                        c.content,
+                        bm25({self.TABLE_NAME}) as score
+                    FROM {self.TABLE_NAME}
+                    JOIN {self.CONTENT_TABLE} c ON c.id = {self.TABLE_NAME}.rowid
+                    WHERE {self.TABLE_NAME} MATCH ?
+                        AND c.document_id = ?
+                    ORDER BY score
+                    LIMIT ?
+                    """,
+                    (escaped_query, document_filter, limit),
+                )
+            else:
+                cursor.execute(
+                    f"""
+                    SELECT
+                        c.chunk_id,
+                        c.document_id,
+                        c.content,
+                        bm25({self.TABLE_NAME}) as score
+                    FROM {self.TABLE_NAME}
+                    JOIN {self.CONTENT_TABLE} c ON c.id = {self.TABLE_NAME}.rowid
+                    WHERE {self.TABLE_NAME} MATCH ?
+                    ORDER BY score
+                    LIMIT ?
+                    """,
+                    (escaped_query, limit),
+                )
 
-        # Escape special FTS5 characters
-        escaped_query = self._escape_query(query)
+            results = []
+            for rank, row in enumerate(cursor.fetchall()):
+                # BM25 scores are negative in SQLite FTS5 (lower is better)
+                # Convert to positive score (higher is better)
+                bm25_score = -float(row["score"]) if row["score"] else 0.0
+
+                results.append(
+                    BM25Result(
+                        chunk_id=row["chunk_id"],
+                        document_id=row["document_id"],
+                        content=row["content"],
+                        bm25_score=bm25_score,
+                        rank=rank + 1,
+                    )
+                )
 
-        # Handle document filtering (document_ids takes precedence)
-        if document_ids:
-            # Multiple document IDs - use IN clause
-            placeholders = ",".join("?" for _ in document_ids)
-            cursor.execute(
-                f"""
-                SELECT
-                    chunk_id,
-                    document_id,
-                    content,
-                    bm25({self.TABLE_NAME}) as score
-                FROM {self.TABLE_NAME}
-                WHERE {self.TABLE_NAME} MATCH ?
-                    AND document_id IN ({placeholders})
-                ORDER BY score
-                LIMIT ?
-                """,
-                (escaped_query, *document_ids, limit),
-            )
-        elif document_filter:
-            cursor.execute(
-                f"""
-                SELECT
-                    chunk_id,
-                    document_id,
-                    content,
-                    bm25({self.TABLE_NAME}) as score
-                FROM {self.TABLE_NAME}
-                WHERE {self.TABLE_NAME} MATCH ?
-                    AND document_id = ?
-                ORDER BY score
-                LIMIT ?
-                """,
-                (escaped_query, document_filter, limit),
-            )
-        else:
-            cursor.execute(
-                f"""
-                SELECT
-                    chunk_id,
-                    document_id,
-                    content,
-                    bm25({self.TABLE_NAME}) as score
-                FROM {self.TABLE_NAME}
-                WHERE {self.TABLE_NAME} MATCH ?
-                ORDER BY score
-                LIMIT ?
-                """,
-                (escaped_query, limit),
-            )
+            return results
 
-        results = []
-        for rank, row in enumerate(cursor.fetchall()):
-            # BM25 scores are negative in SQLite FTS5 (lower is better)
-            # Convert to positive score (higher is better)
-            bm25_score = -float(row["score"]) if row["score"] else 0.0
-
-            results.append(
-                BM25Result(
-                    chunk_id=row["chunk_id"],
-                    document_id=row["document_id"],
-                    content=row["content"],
-                    bm25_score=bm25_score,
-                    rank=rank + 1,
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        document_ids: list[str] | None = None,
+        deadline: float | None = None,
+    ) -> list[list[BM25Result]]:
+        """Search for several queries over one connection.
+
+        Args:
+            queries: Search queries
+            limit: Maximum results per query
+            document_ids: Optional list of document IDs to filter by
+            deadline: Optional ``time.monotonic()`` value after which the
+                batch is aborted with BM25TimeoutError
+
+        Returns:
+            One list of BM25Result per query, in query order
+        """
+        with self._lock:
+            return [
+                self.search(
+                    query, limit=limit, document_ids=document_ids, deadline=deadline
                 )
-            )
+                for query in queries
+            ]
+
+    @contextmanager
+    def _deadline(self, deadline: float | None) -> Iterator[None]:
+        """Abort statements run in the block once ``deadline`` passes.
+
+        The progress handler is installed and removed while the caller
+        holds ``_lock``, so it only ever aborts that caller's statements.
+
+        Args:
+            deadline: ``time.monotonic()`` value, or None for no limit
+
+        Raises:
+            BM25TimeoutError: If a statement was aborted by the deadline
+        """
+        if deadline is None:
+            yield
+            return
+        if time.monotonic() >= deadline:
+            raise BM25TimeoutError("BM25 search exceeded its deadline")
 
-        return results
+        def expired() -> int:
+            return 1 if time.monotonic() >= deadline else 0
+
+        self._conn.set_progress_handler(expired, _PROGRESS_STEPS)
+        try:
+            yield
+        except sqlite3.OperationalError as e:
+            if time.monotonic() >= deadline:
+                raise BM25TimeoutError("BM25 search exceeded its deadline") from e
+            raise
+        finally:
+            self._conn.set_progress_handler(None, 0)
 
     def _escape_query(self, query: str) -> str:
         """Parse and transform query for FTS5.
@@ -261,29 +530,31 @@ class BM25Index:
         Returns:
             True if deleted, False if not found
         """
-        cursor = self._conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        # Check if exists
-        cursor.execute(
-            "SELECT 1 FROM indexed_documents WHERE document_id = ?",
-            (document_id,),
-        )
-        if not cursor.fetchone():
-            return False
+            # Check if exists
+            cursor.execute(
+                "SELECT 1 FROM indexed_documents WHERE document_id = ?",
+                (document_id,),
+            )
+            if not cursor.fetchone():
+                return False
 
-        # Delete chunks
-        cursor.execute(
-            f"DELETE FROM {self.TABLE_NAME} WHERE document_id = ?",
-            (document_id,),
-        )
+            # Delete chunks (triggers remove them from the FTS index)
+            cursor.execute(
+                f"DELETE FROM {self.CONTENT_TABLE} WHERE document_id = ?",
+                (document_id,),
+            )
 
-        # Delete document record
-        cursor.execute(
-            "DELETE FROM indexed_documents WHERE document_id = ?",
-            (document_id,),
-        )
+            # Delete document record
+            cursor.execute(
+                "DELETE FROM indexed_documents WHERE document_id = ?",
+                (document_id,),
+            )
 
-        self._conn.commit()
+            self._conn.commit()
+        bump_generation(self.db_path.parent)
         return True
 
     def document_exists(self, document_id: str) -> bool:
@@ -295,12 +566,13 @@ class BM25Index:
         Returns:
             True if document exists in index
         """
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM indexed_documents WHERE document_id = ?",
-            (document_id,),
-        )
-        return cursor.fetchone() is not None
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                "SELECT 1 FROM indexed_documents WHERE document_id = ?",
+                (document_id,),
+            )
+            return cursor.fetchone() is not None
 
     def get_stats(self) -> dict[str, int]:
         """Get index statistics.
@@ -308,25 +580,31 @@ class BM25Index:
         Returns:
             Dictionary with document and chunk counts
         """
-        cursor = self._conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM indexed_documents")
-        doc_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM indexed_documents")
+            doc_count = cursor.fetchone()[0]
 
-        cursor.execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME}")
-        chunk_count = cursor.fetchone()[0]
+            cursor.execute(f"SELECT COUNT(*) FROM {self.CONTENT_TABLE}")
+            chunk_count = cursor.fetchone()[0]
 
-        return {
-            "document_count": doc_count,
-            "chunk_count": chunk_count,
-        }
+            return {
+                "document_count": doc_count,
+                "chunk_count": chunk_count,
+            }
 
     def reset(self) -> None:
         """Reset the index. Warning: Deletes all data."""
-        cursor = self._conn.cursor()
-        cursor.execute(f"DELETE FROM {self.TABLE_NAME}")
-        cursor.execute("DELETE FROM indexed_documents")
-        self._conn.commit()
+        with self._lock:
+            cursor = self._conn.cursor()
+            # Recreate rather than delete row by row through the triggers
+            cursor.execute(f"DROP TABLE IF EXISTS {self.TABLE_NAME}")
+            cursor.execute(f"DROP TABLE IF EXISTS {self.CONTENT_TABLE}")
+            cursor.execute("DELETE FROM indexed_documents")
+            self._create_schema(cursor)
+            self._conn.commit()
+        bump_generation(self.db_path.parent)
 
     def close(self) -> None:
         """Close database connection."""
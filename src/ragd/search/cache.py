@@ -0,0 +1,91 @@
+"""In-memory caches for repeated searches.
+
+Chat retrieval and interactive use often run the same query several
+times. Searchers keep bounded LRU caches of query embeddings and of fused
+results; result entries are tagged with the index generation they were
+computed at and are discarded once the index has been written to.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache[V]:
+    """Thread-safe bounded LRU mapping with generation tagging."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialise the cache.
+
+        Args:
+            max_entries: Maximum entries kept before evicting the least
+                recently used
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[int, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, generation: int = 0) -> V | None:
+        """Look up a value.
+
+        Args:
+            key: Cache key
+            generation: Current index generation; entries stored at another
+                generation are stale and dropped
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: V, generation: int = 0) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Index generation the value was computed at
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, capacity, hits and misses
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -0,0 +1,127 @@
+"""Rank fusion for hybrid search.
+
+Combines the rankings from several retrieval legs into one list:
+
+- ``rrf``: weighted Reciprocal Rank Fusion, score = sum(w_i / (k + rank_i))
+- ``combsum``: weighted sum of per-leg normalised scores
+- ``combmnz``: CombSUM multiplied by the number of legs returning the item
+
+Item IDs are mapped to array positions once and scores are accumulated in
+NumPy arrays, so fusion is linear in the number of results plus one sort.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+import numpy as np
+
+
+class FusionMethod(Enum):
+    """Method for combining rankings."""
+
+    RRF = "rrf"  # Reciprocal Rank Fusion
+    COMBSUM = "combsum"  # Sum of normalised scores
+    COMBMNZ = "combmnz"  # CombSUM times number of legs matching
+
+
+class ScoreNormalisation(Enum):
+    """Per-leg score normalisation for score-based fusion."""
+
+    MINMAX = "minmax"  # Scale to 0-1
+    ZSCORE = "zscore"  # Zero mean, unit variance
+    NONE = "none"  # Raw scores
+
+
+def normalise_scores(
+    scores: np.ndarray,
+    method: ScoreNormalisation = ScoreNormalisation.MINMAX,
+) -> np.ndarray:
+    """Normalise one leg's scores.
+
+    Args:
+        scores: Raw scores
+        method: Normalisation method
+
+    Returns:
+        Normalised scores (constant inputs map to 1.0 for min-max and 0.0
+        for z-score)
+    """
+    if method is ScoreNormalisation.NONE or scores.size == 0:
+        return scores
+    if method is ScoreNormalisation.MINMAX:
+        low = scores.min()
+        spread = scores.max() - low
+        if spread == 0:
+            return np.ones_like(scores)
+        return (scores - low) / spread
+    std = scores.std()
+    if std == 0:
+        return np.zeros_like(scores)
+    return (scores - scores.mean()) / std
+
+
+def fuse_rankings(
+    rankings: list[list[tuple[str, float]]],
+    weights: list[float] | None = None,
+    method: FusionMethod = FusionMethod.RRF,
+    k: int = 60,
+    normalisation: ScoreNormalisation = ScoreNormalisation.MINMAX,
+) -> list[tuple[str, float]]:
+    """Combine rankings into one fused ranking.
+
+    Weights are rescaled to average 1.0, so equal weights reproduce
+    unweighted fusion. Ties keep the order in which items first appear.
+
+    Args:
+        rankings: List of rankings, each being [(id, score), ...] best first
+        weights: Optional weight per ranking
+        method: Fusion method
+        k: RRF constant
+        normalisation: Score normalisation for CombSUM/CombMNZ
+
+    Returns:
+        Fused ranking as [(id, fused_score), ...] sorted by score
+    """
+    if not rankings:
+        return []
+
+    leg_weights = np.ones(len(rankings))
+    if weights is not None:
+        given = np.asarray(weights, dtype=np.float64)
+        if given.sum() > 0:
+            leg_weights = given * len(rankings) / given.sum()
+
+    positions: dict[str, int] = {}
+    leg_positions = [
+        np.fromiter(
+            (positions.setdefault(item_id, len(positions)) for item_id, _ in ranking),
+            dtype=np.intp,
+            count=len(ranking),
+        )
+        for ranking in rankings
+    ]
+    if not positions:
+        return []
+
+    fused = np.zeros(len(positions))
+    matches = np.zeros(len(positions))
+    for weight, ranking, idx in zip(leg_weights, rankings, leg_positions, strict=True):
+        if idx.size == 0:
+            continue
+        if method is FusionMethod.RRF:
+            contribution = weight / (k + np.arange(1, idx.size + 1, dtype=np.float64))
+        else:
+            scores = np.fromiter(
+                (score for _, score in ranking), dtype=np.float64, count=len(ranking)
+            )
+            contribution = weight * normalise_scores(scores, normalisation)
+        np.add.at(fused, idx, contribution)
+        matches[np.unique(idx)] += 1
+
+    if method is FusionMethod.COMBMNZ:
+        fused *= matches
+
+    ids = list(positions)
+    order = np.argsort(-fused, kind="stable")
+    return [(ids[i], float(fused[i])) for i in order]
@@ -1,24 +1,88 @@
 """Hybrid search combining semantic and keyword search.
 
 Implements Reciprocal Rank Fusion (RRF) to combine results from
-multiple retrieval sources for improved relevance.
+multiple retrieval sources for improved relevance. The semantic and
+keyword legs run concurrently, each with an optional timeout.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import threading
+import time
 import warnings
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from ragd.config import RagdConfig, load_config
 from ragd.embedding import get_embedder
-from ragd.search.bm25 import BM25Index, BM25Result
+from ragd.search.bm25 import BM25Index, BM25Result, BM25TimeoutError
+from ragd.search.cache import LRUCache
+from ragd.search.fusion import FusionMethod, ScoreNormalisation, fuse_rankings
 from ragd.storage import BackendType, ChromaStore, VectorStore, create_vector_store
+from ragd.storage.generation import read_generation
 
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
+# Document scopes up to this size are pushed down into both retrieval
+# legs; larger ones would bind one SQL parameter per ID, so they are
+# applied to over-fetched results instead
+_SCOPE_PUSHDOWN_MAX = 900
+_SCOPE_OVERFETCH = 5
+
+# Threads shared by all searchers for the semantic retrieval leg
+_LEG_WORKERS = 4
+
+# Timed-out semantic legs keep their thread until they finish; past this
+# many, searches skip the semantic leg rather than queue behind them
+_MAX_ABANDONED_LEGS = _LEG_WORKERS // 2
+
+_leg_executor: ThreadPoolExecutor | None = None
+_leg_executor_lock = threading.Lock()
+_abandoned_legs = 0
+
+
+def _get_leg_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool for concurrent retrieval legs."""
+    global _leg_executor
+    with _leg_executor_lock:
+        if _leg_executor is None:
+            _leg_executor = ThreadPoolExecutor(
+                max_workers=_LEG_WORKERS,
+                thread_name_prefix="ragd-search",
+            )
+        return _leg_executor
+
+
+def _abandon_leg(future: Future[Any]) -> None:
+    """Count a timed-out leg against the pool until it finishes."""
+    global _abandoned_legs
+    with _leg_executor_lock:
+        _abandoned_legs += 1
+    future.add_done_callback(_release_leg)
+
+
+def _release_leg(_future: Future[Any]) -> None:
+    """Stop counting a timed-out leg once it has finished."""
+    global _abandoned_legs
+    with _leg_executor_lock:
+        _abandoned_legs -= 1
+
+
+def _legs_saturated() -> bool:
+    """Whether timed-out legs hold too many pool threads for a new leg."""
+    with _leg_executor_lock:
+        return _abandoned_legs >= _MAX_ABANDONED_LEGS
+
 
 class SearchMode(Enum):
     """Search mode selection."""
@@ -71,17 +135,52 @@ def reciprocal_rank_fusion(
     Returns:
         Combined ranking as [(id, rrf_score), ...] sorted by score
     """
-    rrf_scores: dict[str, float] = {}
+    return fuse_rankings(rankings, k=k)
+
+
+def _freeze(value: dict[str, Any] | None) -> str | None:
+    """Serialise a filter or boost mapping into a hashable cache key part."""
+    if not value:
+        return None
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _location(metadata: dict[str, Any]) -> SourceLocation:
+    """Build a source location from chunk metadata."""
+    return SourceLocation(
+        page_number=metadata.get("page_number"),
+        char_start=metadata.get("start_char"),
+        char_end=metadata.get("end_char"),
+    )
+
+
+def _split_scope(
+    document_ids: list[str] | None, limit: int
+) -> tuple[list[str] | None, set[str] | None, int]:
+    """Decide how to restrict a search to a set of documents.
+
+    Returns:
+        Tuple of (IDs to push down into the legs, IDs to filter results
+        by afterwards, results to fetch); at most one of the first two is
+        set
+    """
+    if document_ids and len(document_ids) > _SCOPE_PUSHDOWN_MAX:
+        return None, set(document_ids), limit * _SCOPE_OVERFETCH
+    return document_ids, None, limit
+
+
+def _in_scope(
+    results: list[HybridSearchResult], scope: set[str] | None, limit: int
+) -> list[HybridSearchResult]:
+    """Keep the first ``limit`` results from documents in ``scope``."""
+    if scope is None:
+        return results
+    return [r for r in results if r.document_id in scope][:limit]
 
-    for ranking in rankings:
-        for rank, (item_id, _) in enumerate(ranking, start=1):
-            if item_id not in rrf_scores:
-                rrf_scores[item_id] = 0.0
-            rrf_scores[item_id] += 1.0 / (k + rank)
 
-    # Sort by RRF score descending
-    sorted_items = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-    return sorted_items
+def _copy_results(results: list[HybridSearchResult]) -> list[HybridSearchResult]:
+    """Copy results so callers can mutate them without touching the cache."""
+    return [replace(r, metadata=dict(r.metadata)) for r in results]
 
 
 class HybridSearcher:
@@ -107,6 +206,7 @@ class HybridSearcher:
 
         # Handle vector store initialisation
         # Priority: vector_store > chroma_store > factory create
+        self._owns_vector_store = vector_store is None and chroma_store is None
         if vector_store is not None:
             self._vector_store = vector_store
         elif chroma_store is not None:
@@ -133,16 +233,37 @@ class HybridSearcher:
         )
 
         # Initialise embedder
+        cache_config = self.config.cache
+        embedding_cache = None
+        if cache_config.enabled and cache_config.query_cache_persist:
+            from ragd.embedding.cache import get_embedding_cache
+
+            embedding_cache = get_embedding_cache(self.config)
         self._embedder = get_embedder(
             model_name=self.config.embedding.model,
             device=self.config.embedding.device,
             batch_size=self.config.embedding.batch_size,
+            revision=self.config.embedding.revision,
+            cache=embedding_cache,
+        )
+
+        # In-memory query caches (v1.1)
+        self._result_cache: LRUCache[list[HybridSearchResult]] = LRUCache(
+            cache_config.query_cache_size if cache_config.enabled else 0
+        )
+        self._query_embeddings: LRUCache[list[float]] = LRUCache(
+            cache_config.query_embedding_cache_size if cache_config.enabled else 0
         )
 
         # Load search tuning parameters from config (v1.0.5)
         search_tuning = self.config.search_tuning
         self._bm25_normalisation_divisor = search_tuning.bm25_normalisation_divisor
         self._rrf_fetch_multiplier = search_tuning.rrf_fetch_multiplier
+        self._parallel_retrieval = search_tuning.parallel_retrieval
+        self._semantic_timeout = search_tuning.semantic_timeout_ms / 1000
+        self._keyword_timeout = search_tuning.keyword_timeout_ms / 1000
+        self._fusion_method = FusionMethod(search_tuning.fusion_method)
+        self._score_normalisation = ScoreNormalisation(search_tuning.score_normalisation)
 
     def search(
         self,
@@ -168,7 +289,8 @@ class HybridSearcher:
             semantic_weight: Override semantic weight (0-1)
             keyword_weight: Override keyword weight (0-1)
             rrf_k: Override RRF k constant
-            document_ids: Optional list of document IDs to restrict search to
+            document_ids: Optional list of document IDs to restrict search to;
+                very long lists filter over-fetched results instead of each leg
             document_boosts: Optional dict mapping document_id to boost factor (0.0-1.0).
                 Results from boosted documents get score multiplied by (1 + 0.5 * boost).
 
@@ -183,15 +305,114 @@ class HybridSearcher:
         kw_weight = keyword_weight if keyword_weight is not None else 0.3
         k = rrf_k if rrf_k is not None else 60
 
+        # Repeated queries are served from the result cache until the
+        # index generation moves
+        use_cache = self._result_cache.max_entries > 0
+        if use_cache:
+            key = (
+                query, mode.value, limit, min_score, _freeze(filters),
+                sem_weight, kw_weight, k,
+                tuple(document_ids) if document_ids else None,
+                _freeze(document_boosts),
+            )
+            generation = read_generation(self.config.chroma_path)
+            cached = self._result_cache.get(key, generation)
+            if cached is not None:
+                return _copy_results(cached)
+
+        pushed_ids, scope, fetch_limit = _split_scope(document_ids, limit)
         if mode == SearchMode.SEMANTIC:
-            return self._semantic_search(query, limit, min_score, filters, document_ids)
+            results = self._semantic_search(query, fetch_limit, min_score, filters, pushed_ids)
         elif mode == SearchMode.KEYWORD:
-            return self._keyword_search(query, limit, min_score, document_ids)
+            results = self._keyword_search(query, fetch_limit, min_score, pushed_ids)
         else:
-            return self._hybrid_search(
-                query, limit, min_score, filters, sem_weight, kw_weight, k,
-                document_ids, document_boosts
+            results = self._hybrid_search(
+                query, fetch_limit, min_score, filters, sem_weight, kw_weight, k,
+                pushed_ids, document_boosts
+            )
+        results = _in_scope(results, scope, limit)
+
+        if use_cache:
+            self._result_cache.put(key, _copy_results(results), generation)
+        return results
+
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        mode: SearchMode = SearchMode.HYBRID,
+        min_score: float = 0.0,
+        filters: dict[str, Any] | None = None,
+        semantic_weight: float | None = None,
+        keyword_weight: float | None = None,
+        rrf_k: int | None = None,
+        document_ids: list[str] | None = None,
+    ) -> list[list[HybridSearchResult]]:
+        """Search for many queries at once.
+
+        Queries are embedded in one batch and searched with a single
+        multi-query vector store call, while keyword lookups share one BM25
+        connection. Results are then fused per query. Per-leg timeouts are
+        not applied; they bound interactive latency, not batch throughput.
+
+        Args:
+            queries: Search queries
+            limit: Maximum results per query
+            mode: Search mode (hybrid, semantic, keyword)
+            min_score: Minimum combined score filter
+            filters: Optional metadata filters (semantic only)
+            semantic_weight: Override semantic weight (0-1)
+            keyword_weight: Override keyword weight (0-1)
+            rrf_k: Override RRF k constant
+            document_ids: Optional list of document IDs to restrict search to
+
+        Returns:
+            One list of HybridSearchResult per query, in query order
+        """
+        results: list[list[HybridSearchResult]] = [[] for _ in queries]
+        active = [i for i, query in enumerate(queries) if query.strip()]
+        if not active:
+            return results
+        texts = [queries[i] for i in active]
+
+        document_ids, scope, fetch_limit = _split_scope(document_ids, limit)
+        effective_filters = filters.copy() if filters else {}
+        if document_ids:
+            effective_filters["document_id"] = {"$in": document_ids}
+        where = effective_filters if effective_filters else None
+
+        if mode == SearchMode.SEMANTIC:
+            semantic_raw, _ = self._semantic_leg(texts, fetch_limit, where)
+            for i, raw in zip(active, semantic_raw, strict=True):
+                results[i] = _in_scope(self._semantic_results(raw, min_score), scope, limit)
+            return results
+
+        if mode == SearchMode.KEYWORD:
+            keyword_raw, _, _ = self._keyword_leg(texts, fetch_limit, document_ids)
+            for i, raw in zip(active, keyword_raw, strict=True):
+                results[i] = _in_scope(self._keyword_results(raw, min_score), scope, limit)
+            return results
+
+        semantic_raw, keyword_raw, timings = self._retrieve(
+            texts,
+            fetch_limit * self._rrf_fetch_multiplier,
+            where,
+            document_ids,
+            timeouts=False,
+        )
+        for j, i in enumerate(active):
+            fused = self._fuse(
+                semantic_raw[j],
+                keyword_raw[j],
+                timings,
+                fetch_limit,
+                min_score,
+                semantic_weight if semantic_weight is not None else 0.7,
+                keyword_weight if keyword_weight is not None else 0.3,
+                rrf_k if rrf_k is not None else 60,
             )
+            results[i] = _in_scope(fused, scope, limit)
+        return results
 
     def _semantic_search(
         self,
@@ -214,7 +435,7 @@ class HybridSearcher:
             List of results from semantic search only
         """
         # Generate query embedding
-        query_embedding = self._embedder.embed_single(query)
+        query_embedding = self._embed_queries([query])[0]
 
         # Merge document_ids filter with existing filters
         effective_filters = filters.copy() if filters else {}
@@ -228,6 +449,22 @@ class HybridSearcher:
             where=effective_filters if effective_filters else None,
         )
 
+        return self._semantic_results(raw_results, min_score)
+
+    def _semantic_results(
+        self,
+        raw_results: list[Any],
+        min_score: float,
+    ) -> list[HybridSearchResult]:
+        """Convert raw vector store results to search results.
+
+        Args:
+            raw_results: Results from the vector store
+            min_score: Minimum score filter
+
+        Returns:
+            List of results from semantic search only
+        """
         results = []
         for rank, raw in enumerate(raw_results, start=1):
             # Handle both VectorSearchResult objects and legacy dicts
@@ -247,11 +484,7 @@ class HybridSearcher:
             if score < min_score:
                 continue
 
-            location = SourceLocation(
-                page_number=metadata.get("page_number"),
-                char_start=metadata.get("start_char"),
-                char_end=metadata.get("end_char"),
-            )
+            location = _location(metadata)
 
             results.append(
                 HybridSearchResult(
@@ -292,7 +525,23 @@ class HybridSearcher:
             List of results from keyword search only
         """
         bm25_results = self._bm25.search(query, limit=limit, document_ids=document_ids)
+        return self._keyword_results(bm25_results, min_score)
+
+    def _keyword_results(
+        self,
+        bm25_results: list[BM25Result],
+        min_score: float,
+    ) -> list[HybridSearchResult]:
+        """Convert BM25 results to search results.
 
+        Args:
+            bm25_results: Results from the BM25 index
+            min_score: Minimum score filter
+
+        Returns:
+            List of results from keyword search only
+        """
+        stored = self._chunk_metadata([r.chunk_id for r in bm25_results])
         results = []
         for bm25_res in bm25_results:
             # Normalise BM25 score to 0-1 range (approximate)
@@ -300,6 +549,7 @@ class HybridSearcher:
             if normalised_score < min_score:
                 continue
 
+            metadata = stored.get(bm25_res.chunk_id, {})
             results.append(
                 HybridSearchResult(
                     content=bm25_res.content,
@@ -310,11 +560,11 @@ class HybridSearcher:
                     keyword_rank=bm25_res.rank,
                     rrf_score=normalised_score,
                     document_id=bm25_res.document_id,
-                    document_name="",  # Not available from BM25 alone
+                    document_name=metadata.get("filename", ""),
                     chunk_id=bm25_res.chunk_id,
-                    chunk_index=0,  # Not available from BM25 alone
-                    metadata={},
-                    location=None,
+                    chunk_index=metadata.get("chunk_index", 0),
+                    metadata=metadata,
+                    location=_location(metadata) if metadata else None,
                 )
             )
 
@@ -357,17 +607,81 @@ class HybridSearcher:
         if document_ids:
             effective_filters["document_id"] = {"$in": document_ids}
 
-        # Get semantic results
-        query_embedding = self._embedder.embed_single(query)
-        semantic_raw = self._vector_store.search(
-            query_embedding=query_embedding,
-            limit=fetch_limit,
-            where=effective_filters if effective_filters else None,
+        # Get semantic and keyword results (with document filtering)
+        semantic_raw, keyword_raw, timings = self._retrieve(
+            [query],
+            fetch_limit,
+            effective_filters if effective_filters else None,
+            document_ids,
         )
 
-        # Get keyword results (with document filtering)
-        keyword_raw = self._bm25.search(query, limit=fetch_limit, document_ids=document_ids)
+        return self._fuse(
+            semantic_raw[0],
+            keyword_raw[0],
+            timings,
+            limit,
+            min_score,
+            semantic_weight,
+            keyword_weight,
+            rrf_k,
+            document_boosts,
+        )
+
+    def _chunk_metadata(self, chunk_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch stored metadata for keyword hits in one vector store lookup.
 
+        BM25 only records chunk and document IDs, so filenames, chunk
+        indexes and locations for keyword-only hits come from the vector
+        store's batched ``get``.
+
+        Args:
+            chunk_ids: Chunk IDs to look up
+
+        Returns:
+            Mapping of chunk ID to metadata (missing chunks are omitted)
+        """
+        get = getattr(self._vector_store, "get", None)
+        if not chunk_ids or not callable(get):
+            return {}
+        try:
+            records = get(list(dict.fromkeys(chunk_ids)))
+        except Exception as e:
+            logger.debug("Could not fetch metadata for keyword hits: %s", e)
+            return {}
+        return {
+            record.id: record.metadata or {}
+            for record in records
+            if record is not None
+        }
+
+    def _fuse(
+        self,
+        semantic_raw: list[Any],
+        keyword_raw: list[BM25Result],
+        timings: dict[str, Any],
+        limit: int,
+        min_score: float,
+        semantic_weight: float,
+        keyword_weight: float,
+        rrf_k: int,
+        document_boosts: dict[str, float] | None = None,
+    ) -> list[HybridSearchResult]:
+        """Fuse one query's semantic and keyword results using RRF.
+
+        Args:
+            semantic_raw: Results from the vector store
+            keyword_raw: Results from the BM25 index
+            timings: Per-leg timings to attach to each result
+            limit: Maximum results
+            min_score: Minimum combined score filter
+            semantic_weight: Weight for semantic results
+            keyword_weight: Weight for keyword results
+            rrf_k: RRF k constant
+            document_boosts: Optional dict mapping document_id to boost factor
+
+        Returns:
+            List of results combined using RRF
+        """
         # Build rankings for RRF
         semantic_ranking: list[tuple[str, float]] = []
         keyword_ranking: list[tuple[str, float]] = []
@@ -408,12 +722,31 @@ class HybridSearcher:
             return []
 
         rankings_to_fuse = []
+        leg_weights = []
         if semantic_ranking:
             rankings_to_fuse.append(semantic_ranking)
+            leg_weights.append(semantic_weight)
         if keyword_ranking:
             rankings_to_fuse.append(keyword_ranking)
+            leg_weights.append(keyword_weight)
+
+        fused = fuse_rankings(
+            rankings_to_fuse,
+            weights=leg_weights,
+            method=self._fusion_method,
+            k=rrf_k,
+            normalisation=self._score_normalisation,
+        )
 
-        fused = reciprocal_rank_fusion(rankings_to_fuse, k=rrf_k)
+        # First semantic rank of each chunk
+        semantic_ranks: dict[str, int] = {}
+        for rank, (cid, _) in enumerate(semantic_ranking, 1):
+            semantic_ranks.setdefault(cid, rank)
+
+        # Metadata for keyword-only hits, fetched in one lookup
+        stored = self._chunk_metadata(
+            [chunk_id for chunk_id, _ in fused[:limit] if chunk_id not in semantic_data]
+        )
 
         # Build final results
         results = []
@@ -444,27 +777,18 @@ class HybridSearcher:
                 metadata = sem_data.get("metadata", {})
             elif kw_data:
                 content = kw_data.content
-                metadata = {}
+                metadata = stored.get(chunk_id, {})
             else:
                 continue
 
             # Get ranks
-            sem_rank = None
-            kw_rank = None
-            for i, (cid, _) in enumerate(semantic_ranking, 1):
-                if cid == chunk_id:
-                    sem_rank = i
-                    break
-            if kw_data:
-                kw_rank = kw_data.rank
-
-            location = SourceLocation(
-                page_number=metadata.get("page_number"),
-                char_start=metadata.get("start_char"),
-                char_end=metadata.get("end_char"),
-            ) if metadata else None
+            sem_rank = semantic_ranks.get(chunk_id)
+            kw_rank = kw_data.rank if kw_data else None
+
+            location = _location(metadata) if metadata else None
 
             doc_id = metadata.get("document_id", "") or (kw_data.document_id if kw_data else "")
+            metadata = {**metadata, "retrieval_timings": timings}
 
             results.append(
                 HybridSearchResult(
@@ -500,9 +824,330 @@ class HybridSearcher:
 
         return results
 
+    def _retrieve(
+        self,
+        queries: list[str],
+        limit: int,
+        where: dict[str, Any] | None,
+        document_ids: list[str] | None,
+        timeouts: bool = True,
+    ) -> tuple[list[list[Any]], list[list[BM25Result]], dict[str, Any]]:
+        """Run the semantic and keyword legs of a hybrid search.
+
+        The semantic leg runs on a worker thread while the keyword leg runs
+        on the calling thread. A leg that exceeds its timeout contributes
+        no results instead of failing the search.
+
+        Args:
+            queries: Search queries
+            limit: Results to fetch per leg and query
+            where: Metadata filter for the vector store
+            document_ids: Optional list of document IDs to restrict search to
+            timeouts: Apply the configured per-leg timeouts
+
+        Returns:
+            Tuple of (semantic results, keyword results, per-leg timings),
+            with one result list per query
+        """
+        timings: dict[str, Any] = {
+            "semantic_ms": 0.0,
+            "keyword_ms": 0.0,
+            "semantic_timed_out": False,
+            "keyword_timed_out": False,
+        }
+        semantic_timeout = self._semantic_timeout if timeouts else 0.0
+        keyword_timeout = self._keyword_timeout if timeouts else 0.0
+
+        if not self._parallel_retrieval:
+            semantic_raw, timings["semantic_ms"] = self._semantic_leg(queries, limit, where)
+            keyword_raw, timings["keyword_ms"], timings["keyword_timed_out"] = (
+                self._keyword_leg(queries, limit, document_ids, keyword_timeout)
+            )
+            return semantic_raw, keyword_raw, timings
+
+        if semantic_timeout > 0 and _legs_saturated():
+            # Earlier legs are still stuck on the backend; a new one would
+            # only queue behind them and time out too
+            logger.warning("Semantic search skipped: earlier searches have not finished")
+            keyword_raw, timings["keyword_ms"], timings["keyword_timed_out"] = (
+                self._keyword_leg(queries, limit, document_ids, keyword_timeout)
+            )
+            timings["semantic_timed_out"] = True
+            return [[] for _ in queries], keyword_raw, timings
+
+        started = time.perf_counter()
+        future = _get_leg_executor().submit(self._semantic_leg, queries, limit, where)
+        keyword_raw, timings["keyword_ms"], timings["keyword_timed_out"] = self._keyword_leg(
+            queries, limit, document_ids, keyword_timeout
+        )
+
+        timeout = None
+        if semantic_timeout > 0:
+            timeout = max(0.0, semantic_timeout - (time.perf_counter() - started))
+        try:
+            semantic_raw, timings["semantic_ms"] = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # Leave the leg to finish in the background; its result is discarded
+            logger.warning("Semantic search timed out after %.0f ms", semantic_timeout * 1000)
+            _abandon_leg(future)
+            semantic_raw = [[] for _ in queries]
+            timings["semantic_ms"] = (time.perf_counter() - started) * 1000
+            timings["semantic_timed_out"] = True
+
+        return semantic_raw, keyword_raw, timings
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed queries, reusing cached query vectors.
+
+        Only queries missing from the cache reach the embedder, in one batch.
+
+        Returns:
+            One embedding per query
+        """
+        embeddings: list[list[float] | None] = [
+            self._query_embeddings.get(q) for q in queries
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if len(missing) == 1:
+            new = [self._embedder.embed_single(queries[missing[0]])]
+        elif missing:
+            new = self._embedder.embed([queries[i] for i in missing])
+        else:
+            new = []
+        for i, embedding in zip(missing, new, strict=True):
+            embeddings[i] = embedding
+            self._query_embeddings.put(queries[i], embedding)
+        return embeddings  # type: ignore[return-value]
+
+    def _semantic_leg(
+        self,
+        queries: list[str],
+        limit: int,
+        where: dict[str, Any] | None,
+    ) -> tuple[list[list[Any]], float]:
+        """Embed the queries and search the vector store.
+
+        Several queries are embedded in one batch and, where the backend
+        supports it, searched with one multi-query call.
+
+        Returns:
+            Tuple of (raw vector store results per query, elapsed milliseconds)
+        """
+        started = time.perf_counter()
+        query_embeddings = self._embed_queries(queries)
+        if len(queries) == 1:
+            raw = [
+                self._vector_store.search(
+                    query_embedding=query_embeddings[0],
+                    limit=limit,
+                    where=where,
+                )
+            ]
+        else:
+            search_many = getattr(self._vector_store, "search_many", None)
+            if callable(search_many):
+                raw = search_many(query_embeddings=query_embeddings, limit=limit, where=where)
+            else:
+                raw = [
+                    self._vector_store.search(query_embedding=embedding, limit=limit, where=where)
+                    for embedding in query_embeddings
+                ]
+        return raw, (time.perf_counter() - started) * 1000
+
+    def _keyword_leg(
+        self,
+        queries: list[str],
+        limit: int,
+        document_ids: list[str] | None,
+        timeout: float = 0.0,
+    ) -> tuple[list[list[BM25Result]], float, bool]:
+        """Search the BM25 index, aborting it after ``timeout`` seconds.
+
+        Returns:
+            Tuple of (BM25 results per query, elapsed milliseconds, whether
+            it timed out)
+        """
+        started = time.perf_counter()
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        try:
+            if len(queries) == 1:
+                raw = [
+                    self._bm25.search(
+                        queries[0], limit=limit, document_ids=document_ids, deadline=deadline
+                    )
+                ]
+            else:
+                raw = self._bm25.search_many(
+                    queries, limit=limit, document_ids=document_ids, deadline=deadline
+                )
+        except BM25TimeoutError:
+            logger.warning("Keyword search timed out after %.0f ms", timeout * 1000)
+            return [[] for _ in queries], (time.perf_counter() - started) * 1000, True
+
+        return raw, (time.perf_counter() - started) * 1000, False
+
     def close(self) -> None:
         """Close resources."""
         self._bm25.close()
+        if self._owns_vector_store:
+            self._vector_store.close()
+
+
+@dataclass
+class _PooledSearcher:
+    """A pooled searcher and the index generation it was opened at."""
+
+    searcher: HybridSearcher
+    generation: int
+    # Searches currently running on the searcher
+    leases: int = 0
+    # Replaced after an index change; closed once the last lease ends
+    retired: bool = False
+
+
+class SearcherPool:
+    """Process-wide pool of long-lived hybrid searchers.
+
+    Searchers are keyed by data directory and configuration, so repeated
+    searches reuse the vector store client, BM25 connection and embedder
+    instead of reopening them per query. A searcher is replaced when the
+    index generation of its data directory changes (after any write, in
+    any process).
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty pool."""
+        self._searchers: dict[tuple[str, str], _PooledSearcher] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config: RagdConfig) -> HybridSearcher:
+        """Get a searcher for a configuration, opening one if needed.
+
+        The searcher is closed after the next index change once no leases
+        on it remain, so use :meth:`lease` to hold it across a search.
+
+        Args:
+            config: Configuration
+
+        Returns:
+            Shared HybridSearcher (do not close it)
+        """
+        with self._lock:
+            entry, stale = self._current(config)
+        if stale is not None:
+            stale.close()
+        return entry.searcher
+
+    @contextmanager
+    def lease(self, config: RagdConfig) -> Iterator[HybridSearcher]:
+        """Hold a pooled searcher for the duration of a block.
+
+        A searcher replaced after an index change stays open until every
+        lease on it has ended, then it is closed.
+
+        Args:
+            config: Configuration
+
+        Yields:
+            Shared HybridSearcher (do not close it)
+        """
+        with self._lock:
+            entry, stale = self._current(config)
+            entry.leases += 1
+        if stale is not None:
+            stale.close()
+        try:
+            yield entry.searcher
+        finally:
+            with self._lock:
+                entry.leases -= 1
+                release = entry.retired and entry.leases == 0
+            if release:
+                entry.searcher.close()
+
+    def _current(
+        self, config: RagdConfig
+    ) -> tuple[_PooledSearcher, HybridSearcher | None]:
+        """Find or open the entry for the current index generation.
+
+        Caller holds the lock.
+
+        Returns:
+            Tuple of (current entry, replaced searcher that is no longer
+            leased and should be closed by the caller, or None)
+        """
+        key = (str(config.chroma_path), config.model_dump_json())
+        generation = read_generation(config.chroma_path)
+
+        pooled = self._searchers.get(key)
+        if pooled is not None and pooled.generation == generation:
+            return pooled, None
+
+        stale = None
+        if pooled is not None:
+            logger.debug("Index changed, reopening searcher for %s", config.chroma_path)
+            pooled.retired = True
+            if pooled.leases == 0:
+                stale = pooled.searcher
+
+        entry = _PooledSearcher(searcher=HybridSearcher(config=config), generation=generation)
+        self._searchers[key] = entry
+        return entry, stale
+
+    def clear(self) -> None:
+        """Close and remove every pooled searcher.
+
+        Searchers that are still leased are closed when their last lease
+        ends.
+        """
+        with self._lock:
+            pooled = list(self._searchers.values())
+            self._searchers.clear()
+            idle = []
+            for entry in pooled:
+                entry.retired = True
+                if entry.leases == 0:
+                    idle.append(entry.searcher)
+        for searcher in idle:
+            searcher.close()
+
+    def __len__(self) -> int:
+        """Return the number of pooled searchers."""
+        return len(self._searchers)
+
+
+_searcher_pool = SearcherPool()
+
+
+def get_searcher(config: RagdConfig | None = None) -> HybridSearcher:
+    """Get a pooled hybrid searcher.
+
+    Args:
+        config: Configuration (loads default if not provided)
+
+    Returns:
+        Shared HybridSearcher, reopened automatically when the index changes
+    """
+    return _searcher_pool.get(config or load_config())
+
+
+@contextmanager
+def lease_searcher(config: RagdConfig | None = None) -> Iterator[HybridSearcher]:
+    """Hold a pooled hybrid searcher for the duration of a block.
+
+    Args:
+        config: Configuration (loads default if not provided)
+
+    Yields:
+        Shared HybridSearcher, kept open until the block exits
+    """
+    with _searcher_pool.lease(config or load_config()) as searcher:
+        yield searcher
+
+
+def close_searchers() -> None:
+    """Close all pooled searchers."""
+    _searcher_pool.clear()
 
 
 def hybrid_search(
@@ -512,6 +1157,7 @@ def hybrid_search(
     min_score: float = 0.0,
     config: RagdConfig | None = None,
     filters: dict[str, Any] | None = None,
+    document_ids: list[str] | None = None,
 ) -> list[HybridSearchResult]:
     """Convenience function for hybrid search.
 
@@ -522,6 +1168,8 @@ def hybrid_search(
         min_score: Minimum score filter
         config: Configuration
         filters: Optional metadata filters
+        document_ids: Optional list of document IDs to restrict both
+            retrieval legs to
 
     Returns:
         List of HybridSearchResult
@@ -529,14 +1177,12 @@ def hybrid_search(
     if isinstance(mode, str):
         mode = SearchMode(mode)
 
-    searcher = HybridSearcher(config=config)
-    try:
+    with lease_searcher(config) as searcher:
         return searcher.search(
             query=query,
             limit=limit,
             mode=mode,
             min_score=min_score,
             filters=filters,
+            document_ids=document_ids,
         )
-    finally:
-        searcher.close()
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
@@ -121,6 +121,11 @@ class CrossEncoderReranker:
             self._model = None
             self._model_loaded = True
 
+    def unload(self) -> None:
+        """Free the cross-encoder model; it reloads on next use."""
+        self._model = None
+        self._model_loaded = False
+
     @property
     def available(self) -> bool:
         """Check if reranker is available."""
@@ -293,29 +298,25 @@ class CrossEncoderReranker:
         return filtered[:top_k] if top_k else filtered
 
 
-# Module-level reranker instance for convenience
-_default_reranker: CrossEncoderReranker | None = None
-
-
 def get_reranker(config: RerankerConfig | None = None) -> CrossEncoderReranker:
     """Get or create a reranker instance.
 
+    Rerankers are shared through the model registry, so each distinct
+    configuration loads its cross-encoder once per process.
+
     Args:
         config: Optional configuration (uses defaults if not provided)
 
     Returns:
         CrossEncoderReranker instance
     """
-    global _default_reranker
-
-    if config is not None:
-        # Custom config, create new instance
-        return CrossEncoderReranker(config)
-
-    if _default_reranker is None:
-        _default_reranker = CrossEncoderReranker()
+    from ragd.embedding.registry import get_model_registry
 
-    return _default_reranker
+    config = config or RerankerConfig()
+    return get_model_registry().get(
+        ("cross_encoder", *astuple(config)),
+        lambda: CrossEncoderReranker(config),
+    )
 
 
 def rerank(
@@ -0,0 +1,73 @@
+"""Resolve tag, collection and tier filters to document IDs.
+
+Search restricts both retrieval legs to a set of document IDs (see
+``HybridSearcher.search``). This module turns the user-facing filters
+into that set once, before retrieval, so narrow filters return complete
+top-k lists instead of post-filtering a generic result list.
+"""
+
+from __future__ import annotations
+
+from ragd.config import RagdConfig
+
+
+def resolve_document_scope(
+    config: RagdConfig,
+    tags: list[str] | None = None,
+    collection: str | None = None,
+    max_tier: str | None = None,
+) -> list[str] | None:
+    """Resolve search filters to the document IDs they allow.
+
+    Filters combine with AND logic.
+
+    Args:
+        config: Configuration (locates the metadata store)
+        tags: Tags that must all be present
+        collection: Smart collection name
+        max_tier: Most sensitive data tier to include
+
+    Returns:
+        Sorted list of allowed document IDs (possibly empty), or None if
+        the filters allow every document
+
+    Raises:
+        ValueError: If the collection does not exist or the tier is unknown
+    """
+    if not tags and not collection and not max_tier:
+        return None
+
+    from ragd.metadata import MetadataStore, TagManager
+
+    store = MetadataStore(config.metadata_path)
+    allowed: set[str] | None = None
+
+    if tags:
+        tag_manager = TagManager(store)
+        allowed = set(tag_manager.find_by_tags(tags, match_all=True))
+
+    if collection:
+        from ragd.metadata.collections import CollectionManager
+
+        manager = CollectionManager(config.metadata_path, TagManager(store))
+        if manager.get_by_name(collection) is None:
+            raise ValueError(f"Collection not found: {collection}")
+        members = set(manager.get_members(collection))
+        allowed = members if allowed is None else allowed & members
+
+    if max_tier:
+        from ragd.security.tiers import DataTier, TierManager
+
+        ceiling = DataTier.from_string(max_tier)
+        tier_manager = TierManager(store)
+        excluded = (
+            tier_manager.ids_above_tier(ceiling) if ceiling < DataTier.CRITICAL else set()
+        )
+        if allowed is not None:
+            allowed -= excluded
+        elif excluded or tier_manager.default_tier > ceiling:
+            # Documents missing from the metadata store get the default tier
+            allowed = set(store.list_ids()) - excluded
+        # Otherwise the ceiling admits every document: no restriction
+
+    return None if allowed is None else sorted(allowed)
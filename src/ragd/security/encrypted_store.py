@@ -623,6 +623,12 @@ def migrate_to_encrypted(
         source_conn.close()
 
     if delete_source:
+        from ragd.storage.connections import close_pool
+
+        # Pooled connections would otherwise leave plaintext WAL files behind
+        close_pool(source_path)
         source_path.unlink()
+        for suffix in ("-wal", "-shm"):
+            source_path.with_name(source_path.name + suffix).unlink(missing_ok=True)
 
     logger.info("Migrated database to encrypted: %s -> %s", source_path, dest_path)
@@ -188,6 +188,11 @@ class TierManager:
         self._config = config or TierConfig()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    @property
+    def default_tier(self) -> DataTier:
+        """Tier of documents without a (valid) tier."""
+        return self._config.default_tier
+
     def set_tier(self, doc_id: str, tier: DataTier) -> bool:
         """Set the sensitivity tier for a document.
 
@@ -218,7 +223,28 @@ class TierManager:
         if metadata is None:
             return self._config.default_tier
 
-        tier_value = getattr(metadata, "ragd_data_tier", None)
+        return self._parse_tier(doc_id, getattr(metadata, "ragd_data_tier", None))
+
+    def ids_above_tier(self, ceiling: DataTier) -> set[str]:
+        """Find documents more sensitive than a tier.
+
+        Reads every document's tier with a single store query rather than
+        one lookup per document.
+
+        Args:
+            ceiling: Most sensitive tier to allow.
+
+        Returns:
+            IDs of documents whose tier is above ``ceiling``.
+        """
+        return {
+            doc_id
+            for doc_id, tier_value in self._store.list_data_tiers().items()
+            if self._parse_tier(doc_id, tier_value) > ceiling
+        }
+
+    def _parse_tier(self, doc_id: str, tier_value: str | None) -> DataTier:
+        """Parse a stored tier value, falling back to the default tier."""
         if not tier_value:
             return self._config.default_tier
 
@@ -11,11 +11,15 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 # Lazy import chromadb - it's heavy (~3-5 seconds)
 # Imported inside ChromaDBAdapter.__init__ when actually needed
 if TYPE_CHECKING:
     pass
 
+from ragd.storage.exact import exact_search
+from ragd.storage.generation import bump_generation
 from ragd.storage.types import (
     BackendHealth,
     BackendType,
@@ -41,12 +45,15 @@ class ChromaDBAdapter:
 
     COLLECTION_NAME = "ragd_documents"
     METADATA_COLLECTION = "ragd_metadata"
+    # Filters matching at most this many vectors are searched exactly
+    EXACT_SCAN_THRESHOLD = 2048
 
     def __init__(
         self,
         persist_directory: Path,
         dimension: int = 384,
         collection_name: str | None = None,
+        exact_scan_threshold: int = EXACT_SCAN_THRESHOLD,
         **kwargs: object,
     ) -> None:
         """Initialise ChromaDB adapter.
@@ -55,6 +62,8 @@ class ChromaDBAdapter:
             persist_directory: Directory for persistent storage
             dimension: Embedding dimension (default 384 for MiniLM)
             collection_name: Optional custom collection name
+            exact_scan_threshold: Largest filtered candidate set scored by
+                brute force instead of HNSW (0 disables)
             **kwargs: Additional ChromaDB options
         """
         # Lazy import chromadb - it's heavy (~3-5 seconds first time)
@@ -65,6 +74,7 @@ class ChromaDBAdapter:
         self._persist_directory = persist_directory
         self._dimension = dimension
         self._collection_name = collection_name or self.COLLECTION_NAME
+        self._exact_scan_threshold = exact_scan_threshold
 
         persist_directory.mkdir(parents=True, exist_ok=True)
 
@@ -148,6 +158,7 @@ class ChromaDBAdapter:
             metadatas=metadatas,
         )
 
+        bump_generation(self._persist_directory)
         logger.debug("Added %d vectors to ChromaDB", len(ids))
 
     def search(
@@ -166,20 +177,116 @@ class ChromaDBAdapter:
         Returns:
             List of VectorSearchResult with normalised scores (0-1)
         """
+        return self.search_many([query_embedding], limit=limit, where=where)[0]
+
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Search for several query vectors in one call.
+
+        Args:
+            query_embeddings: Query vectors
+            limit: Maximum number of results per query
+            where: Optional filter conditions
+
+        Returns:
+            One list of VectorSearchResult per query, in query order
+        """
+        if not query_embeddings:
+            return []
+
+        if where:
+            exact = self._exact_search(query_embeddings, limit, where)
+            if exact is not None:
+                return exact
+
         results = self._collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=limit,
             where=where,
             include=["documents", "metadatas", "distances"],
         )
 
+        return [self._row_results(results, row) for row in range(len(query_embeddings))]
+
+    def _exact_search(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int,
+        where: dict[str, Any],
+    ) -> list[list[VectorSearchResult]] | None:
+        """Score every vector matching a selective filter.
+
+        HNSW returns short result lists when few vectors pass a filter, so
+        small candidate sets are fetched and ranked exactly instead. The
+        filter is first probed for IDs only; embeddings are fetched only
+        when the candidate set is small, and documents only for the hits.
+
+        Returns:
+            One list of VectorSearchResult per query, or None if the filter
+            matches more than ``exact_scan_threshold`` vectors
+        """
+        if self._exact_scan_threshold <= 0:
+            return None
+
+        ids = self._collection.get(
+            where=where,
+            limit=self._exact_scan_threshold + 1,
+            include=[],
+        )["ids"]
+        if len(ids) > self._exact_scan_threshold:
+            return None
+        if not ids:
+            return [[] for _ in query_embeddings]
+
+        candidates = self._collection.get(ids=ids, include=["embeddings"])
+        ids = candidates["ids"]
+        distances, positions = exact_search(
+            np.asarray(query_embeddings),
+            np.asarray(candidates["embeddings"]),
+            limit,
+            metric="cosine",
+        )
+
+        hit_ids = list(dict.fromkeys(ids[pos] for pos in positions.ravel().tolist()))
+        hits = self._collection.get(ids=hit_ids, include=["documents", "metadatas"])
+        hit_count = len(hits["ids"])
+        documents = dict(zip(hits["ids"], hits["documents"] or [""] * hit_count, strict=True))
+        metadatas = dict(zip(hits["ids"], hits["metadatas"] or [{}] * hit_count, strict=True))
+        return [
+            [
+                VectorSearchResult(
+                    id=ids[pos],
+                    content=documents.get(ids[pos]) or "",
+                    score=max(0.0, min(1.0, 1.0 - float(dist) / 2.0)),
+                    metadata=metadatas.get(ids[pos]) or {},
+                    raw_distance=float(dist),
+                )
+                for dist, pos in zip(row_distances, row_positions, strict=True)
+            ]
+            for row_distances, row_positions in zip(distances, positions, strict=True)
+        ]
+
+    def _row_results(self, results: dict[str, Any], row: int) -> list[VectorSearchResult]:
+        """Convert one query's row of a ChromaDB query response.
+
+        Args:
+            results: Response from ``collection.query``
+            row: Index of the query
+
+        Returns:
+            List of VectorSearchResult with normalised scores (0-1)
+        """
         output: list[VectorSearchResult] = []
 
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                chunk_id = results["ids"][0][i] if results["ids"] else ""
+        if results["documents"] and results["documents"][row]:
+            for i, doc in enumerate(results["documents"][row]):
+                distance = results["distances"][row][i] if results["distances"] else 0.0
+                metadata = results["metadatas"][row][i] if results["metadatas"] else {}
+                chunk_id = results["ids"][row][i] if results["ids"] else ""
 
                 # Normalise cosine distance (0-2) to score (0-1)
                 # distance=0 → score=1.0 (identical)
@@ -262,6 +369,7 @@ class ChromaDBAdapter:
 
         if count > 0:
             self._collection.delete(ids=existing["ids"])
+            bump_generation(self._persist_directory)
 
         logger.debug("Deleted %d vectors from ChromaDB", count)
         return count
@@ -354,6 +462,7 @@ class ChromaDBAdapter:
             name=self.METADATA_COLLECTION,
         )
 
+        bump_generation(self._persist_directory)
         logger.info("ChromaDB reset complete")
 
     def close(self) -> None:
@@ -429,6 +538,7 @@ class ChromaDBAdapter:
 
         # Delete document metadata
         self._metadata_collection.delete(ids=[document_id])
+        bump_generation(self._persist_directory)
 
         logger.debug(
             "Deleted document %s with %d chunks",
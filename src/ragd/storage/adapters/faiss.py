@@ -7,12 +7,18 @@ library, with SQLite-backed metadata storage for filtering support.
 from __future__ import annotations
 
 import logging
+import math
 import pickle
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from ragd.storage.adapters.faiss_tuning import TuningResult, tune_search_effort
+from ragd.storage.exact import exact_search
+from ragd.storage.generation import bump_generation
 from ragd.storage.metadata.sqlite_store import SQLiteMetadataStore
 from ragd.storage.types import (
     BackendHealth,
@@ -25,6 +31,21 @@ from ragd.storage.types import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _IndexMigration:
+    """State of an index rebuild in progress."""
+
+    index_type: str
+    thread: threading.Thread | None = None
+    # Writes made after the snapshot, replayed onto the new index
+    pending_adds: list[tuple[np.ndarray, np.ndarray]] = field(default_factory=list)
+    pending_removals: list[int] = field(default_factory=list)
+    # Set by the build
+    index: Any = None
+    tuning: TuningResult | None = None
+    error: Exception | None = None
+
+
 class FAISSAdapter:
     """FAISS adapter implementing VectorStore protocol.
 
@@ -41,6 +62,26 @@ class FAISSAdapter:
     - IVFFlat: 10K-100K vectors (approximate, requires training)
     - IVFPQ: 100K-1M vectors (compressed, requires training)
     - HNSW: > 1M vectors (graph-based, no training)
+
+    New indexes are wrapped in ``IndexIDMap2`` so vectors keep stable IDs
+    and can be removed. Deleted vectors the index cannot remove (IVF and
+    HNSW, or indexes created before ID maps) are tombstoned: searches
+    over-fetch past them, and :meth:`compact` rebuilds the index without
+    them once they exceed ``compact_threshold`` of the index.
+
+    Stores start flat. Unless ``index_type`` is fixed, an add that takes
+    the store past a size threshold starts a background rebuild into the
+    larger index type, trained on a sample of the stored vectors. Writes
+    made meanwhile are replayed onto the new index, which is swapped in by
+    the next operation after the build finishes (or by :meth:`close`).
+    ``nprobe``/``efSearch`` of the new index are tuned to reach
+    ``recall_target`` on held-out vectors.
+
+    IVFPQ stores only compressed codes, so a store is never migrated out
+    of it: an index rebuilt from decoded vectors would keep their
+    quantisation error for good, and recall tuned against them would not
+    reflect the original embeddings. Re-index the documents to change the
+    type of an IVFPQ store.
     """
 
     INDEX_FILE = "faiss.index"
@@ -51,6 +92,28 @@ class FAISSAdapter:
     IVFFLAT_THRESHOLD = 100_000
     IVFPQ_THRESHOLD = 1_000_000
 
+    # Tombstoned fraction of the index that triggers compaction on persist
+    COMPACT_THRESHOLD = 0.2
+
+    # Filtered search: candidate sets up to this size are scored exactly
+    EXACT_FILTER_MAX = 8192
+    # Upper bound on the HNSW beam widened for selective filters
+    MAX_EF_SEARCH = 4096
+
+    # Decoded metadata records cached for search hydration
+    METADATA_CACHE_SIZE = 4096
+
+    # Index types in order of growth, for automatic migration
+    INDEX_TYPES = ("Flat", "IVFFlat", "IVFPQ", "HNSW")
+    # Index types that cannot reproduce the vectors added to them
+    LOSSY_INDEX_TYPES = ("IVFPQ",)
+    # Recall@10 that tuned nprobe/efSearch must reach on held-out vectors
+    RECALL_TARGET = 0.95
+    # Held-out vectors used to measure recall when tuning
+    TUNING_QUERIES = 200
+    # Training vectors sampled per IVF list
+    TRAIN_POINTS_PER_LIST = 50
+
     def __init__(
         self,
         persist_directory: Path,
@@ -58,6 +121,10 @@ class FAISSAdapter:
         index_type: str | None = None,
         nlist: int = 100,
         nprobe: int = 10,
+        compact_threshold: float = COMPACT_THRESHOLD,
+        metadata_cache_size: int = METADATA_CACHE_SIZE,
+        auto_migrate: bool = True,
+        recall_target: float = RECALL_TARGET,
         **kwargs: object,
     ) -> None:
         """Initialise FAISS adapter.
@@ -68,6 +135,14 @@ class FAISSAdapter:
             index_type: Override index type (Flat, IVFFlat, IVFPQ, HNSW)
             nlist: Number of clusters for IVF indices
             nprobe: Number of clusters to search
+            compact_threshold: Tombstoned fraction of the index above which
+                :meth:`persist` compacts it (0 disables)
+            metadata_cache_size: Decoded metadata records kept in memory
+                for search hydration (0 disables)
+            auto_migrate: Rebuild into a larger index type as the store
+                grows (ignored when ``index_type`` is given)
+            recall_target: Recall@10 used to tune search effort after a
+                rebuild
             **kwargs: Additional options
         """
         try:
@@ -82,6 +157,10 @@ class FAISSAdapter:
         self._index_type_override = index_type
         self._nlist = nlist
         self._nprobe = nprobe
+        self._compact_threshold = compact_threshold
+        self._metadata_cache_size = metadata_cache_size
+        self._auto_migrate = auto_migrate and index_type is None
+        self._recall_target = recall_target
 
         persist_directory.mkdir(parents=True, exist_ok=True)
 
@@ -91,13 +170,24 @@ class FAISSAdapter:
         self._metadata_path = persist_directory / "metadata.db"
 
         # Initialise metadata store
-        self._metadata = SQLiteMetadataStore(self._metadata_path)
+        self._metadata = SQLiteMetadataStore(
+            self._metadata_path, cache_size=self._metadata_cache_size
+        )
 
         # ID mapping: chunk_id → faiss_id (position in index)
         self._id_to_faiss: dict[str, int] = {}
         self._faiss_to_id: dict[int, str] = {}
         self._next_id = 0
 
+        # Deleted vectors still physically present in the index
+        self._tombstones: set[int] = set()
+
+        # Unpersisted changes (bump the index generation on next persist)
+        self._dirty = False
+
+        # Index rebuild in progress, if any
+        self._migration: _IndexMigration | None = None
+
         # Initialise or load index
         self._index = self._load_or_create_index()
 
@@ -123,28 +213,66 @@ class FAISSAdapter:
                     self._id_to_faiss = data.get("id_to_faiss", {})
                     self._faiss_to_id = data.get("faiss_to_id", {})
                     self._next_id = data.get("next_id", 0)
+                    self._tombstones = set(data.get("tombstones", ()))
+                    self._nprobe = data.get("nprobe", self._nprobe)
 
             logger.debug("Loaded existing FAISS index with %d vectors", index.ntotal)
             return index
 
         # Create new index
-        return self._create_index(0)
+        return self._new_index(0)
 
-    def _create_index(self, expected_size: int) -> Any:
+    def _new_index(self, expected_size: int, index_type: str | None = None) -> Any:
+        """Create an ID-mapped index sized for ``expected_size`` vectors."""
+        import faiss
+
+        return faiss.IndexIDMap2(self._create_index(expected_size, index_type))
+
+    def _uses_id_map(self) -> bool:
+        """Whether the index stores explicit vector IDs.
+
+        Indexes created before ID maps use the position in the index as
+        the vector ID and cannot remove vectors without renumbering.
+        """
+        return hasattr(self._index, "id_map")
+
+    def _index_type_for(self, size: int) -> str:
+        """Choose the index type for a store of ``size`` vectors."""
+        if self._index_type_override:
+            return self._index_type_override
+        if size < self.FLAT_THRESHOLD:
+            return "Flat"
+        if size < self.IVFFLAT_THRESHOLD:
+            return "IVFFlat"
+        if size < self.IVFPQ_THRESHOLD:
+            return "IVFPQ"
+        return "HNSW"
+
+    def _index_type_of(self, index: Any) -> str:
+        """Name the type of an existing (optionally ID-mapped) index."""
+        import faiss
+
+        inner = faiss.downcast_index(index.index) if hasattr(index, "id_map") else index
+        if isinstance(inner, faiss.IndexHNSW):
+            return "HNSW"
+        if isinstance(inner, faiss.IndexIVFPQ):
+            return "IVFPQ"
+        if isinstance(inner, faiss.IndexIVF):
+            return "IVFFlat"
+        return "Flat"
+
+    def _create_index(
+        self,
+        expected_size: int,
+        index_type: str | None = None,
+        nlist: int | None = None,
+    ) -> Any:
         """Create appropriate index based on expected size."""
         import faiss
 
         # Determine index type
-        if self._index_type_override:
-            index_type = self._index_type_override
-        elif expected_size < self.FLAT_THRESHOLD:
-            index_type = "Flat"
-        elif expected_size < self.IVFFLAT_THRESHOLD:
-            index_type = "IVFFlat"
-        elif expected_size < self.IVFPQ_THRESHOLD:
-            index_type = "IVFPQ"
-        else:
-            index_type = "HNSW"
+        index_type = index_type or self._index_type_for(expected_size)
+        nlist = nlist or self._nlist
 
         logger.debug("Creating FAISS index type: %s", index_type)
 
@@ -155,7 +283,7 @@ class FAISSAdapter:
         elif index_type == "IVFFlat":
             # Inverted file with flat storage
             quantizer = faiss.IndexFlatL2(self._dimension)
-            index = faiss.IndexIVFFlat(quantizer, self._dimension, self._nlist)
+            index = faiss.IndexIVFFlat(quantizer, self._dimension, nlist)
             return index
 
         elif index_type == "IVFPQ":
@@ -163,7 +291,7 @@ class FAISSAdapter:
             quantizer = faiss.IndexFlatL2(self._dimension)
             # m = number of subvectors, nbits = bits per code
             m = 8 if self._dimension >= 8 else self._dimension
-            index = faiss.IndexIVFPQ(quantizer, self._dimension, self._nlist, m, 8)
+            index = faiss.IndexIVFPQ(quantizer, self._dimension, nlist, m, 8)
             return index
 
         elif index_type == "HNSW":
@@ -218,6 +346,8 @@ class FAISSAdapter:
         if not ids:
             return
 
+        self._finish_migration()
+
         # Validate dimension
         for i, emb in enumerate(embeddings):
             if len(emb) != self._dimension:
@@ -241,10 +371,22 @@ class FAISSAdapter:
                     vectors.shape[0],
                     self._nlist,
                 )
-                self._index = faiss.IndexFlatL2(self._dimension)
+                self._index = faiss.IndexIDMap2(faiss.IndexFlatL2(self._dimension))
+
+        # Re-added chunks replace their previous vectors
+        replaced = [self._id_to_faiss.pop(c) for c in ids if c in self._id_to_faiss]
+        for faiss_id in replaced:
+            self._faiss_to_id.pop(faiss_id, None)
+        self._remove_vectors(replaced)
 
         # Add vectors to FAISS
-        self._index.add(vectors)
+        new_ids = np.arange(self._next_id, self._next_id + len(ids), dtype=np.int64)
+        if self._uses_id_map():
+            self._index.add_with_ids(vectors, new_ids)
+        else:
+            self._index.add(vectors)
+        if self._migration is not None:
+            self._migration.pending_adds.append((new_ids, vectors))
 
         # Update ID mappings and metadata
         metadata_batch = []
@@ -263,11 +405,13 @@ class FAISSAdapter:
             )
 
         self._next_id += len(ids)
+        self._dirty = True
 
         # Add to metadata store
         self._metadata.add_batch(metadata_batch)
 
         logger.debug("Added %d vectors to FAISS", len(ids))
+        self._maybe_migrate()
 
     def search(
         self,
@@ -285,37 +429,96 @@ class FAISSAdapter:
         Returns:
             List of VectorSearchResult with normalised scores (0-1)
         """
-        if self._index.ntotal == 0:
-            return []
+        return self.search_many([query_embedding], limit=limit, where=where)[0]
+
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Search for several query vectors with one index call.
+
+        Args:
+            query_embeddings: Query vectors
+            limit: Maximum number of results per query
+            where: Optional filter conditions
+
+        Returns:
+            One list of VectorSearchResult per query, in query order
+        """
+        import faiss
+
+        self._finish_migration()
+        if self._index.ntotal == 0 or not query_embeddings:
+            return [[] for _ in query_embeddings]
 
         # Set nprobe for IVF indices
-        if hasattr(self._index, "nprobe"):
-            self._index.nprobe = self._nprobe
+        ivf = faiss.try_extract_index_ivf(self._index)
+        if ivf is not None:
+            ivf.nprobe = self._nprobe
 
-        # Convert query to numpy
-        query = np.array([query_embedding], dtype=np.float32)
+        # Convert queries to an (n, d) matrix
+        queries = np.array(query_embeddings, dtype=np.float32)
 
         # If we have a filter, use two-stage search
         if where:
-            return self._filtered_search(query, limit, where)
+            return [
+                self._filtered_search(queries[i : i + 1], limit, where)
+                for i in range(len(queries))
+            ]
 
-        # Direct search
-        distances, indices = self._index.search(query, limit)
+        # Direct search, over-fetching past tombstoned vectors
+        fetch = min(self._index.ntotal, limit + len(self._tombstones))
+        distances, indices = self._index.search(queries, fetch)
 
-        results = []
-        for i, (dist, idx) in enumerate(zip(distances[0], indices[0])):
-            if idx == -1:  # FAISS returns -1 for empty slots
-                continue
+        return [
+            self._row_results(distances[i], indices[i])[:limit] for i in range(len(queries))
+        ]
+
+    def _row_results(
+        self,
+        distances: np.ndarray,
+        indices: np.ndarray,
+    ) -> list[VectorSearchResult]:
+        """Convert one query's row of FAISS search output.
+
+        Args:
+            distances: L2 distances for the query
+            indices: FAISS ids for the query (-1 for empty slots)
 
-            # Get metadata
-            meta_data = self._metadata.get_by_vector_id(int(idx))
+        Returns:
+            List of VectorSearchResult with normalised scores (0-1)
+        """
+        hits = [
+            (float(dist), int(idx))
+            for dist, idx in zip(distances, indices, strict=True)
+            # FAISS returns -1 for empty slots
+            if idx != -1 and int(idx) not in self._tombstones
+        ]
+        return self._hydrate(hits)
+
+    def _hydrate(self, hits: list[tuple[float, int]]) -> list[VectorSearchResult]:
+        """Attach stored metadata to search hits with one batched lookup.
+
+        Args:
+            hits: (L2 distance, FAISS id) pairs in result order
+
+        Returns:
+            List of VectorSearchResult with normalised scores (0-1); hits
+            without metadata are dropped
+        """
+        records = self._metadata.get_batch([faiss_id for _, faiss_id in hits])
+
+        results = []
+        for (dist, _), meta_data in zip(hits, records, strict=True):
             if meta_data is None:
                 continue
 
             # Normalise L2 distance to score (0-1)
             # distance=0 → score=1.0 (identical)
             # distance→∞ → score→0.0
-            score = 1.0 / (1.0 + float(dist))
+            score = 1.0 / (1.0 + dist)
 
             results.append(
                 VectorSearchResult(
@@ -323,7 +526,7 @@ class FAISSAdapter:
                     content=meta_data["content"],
                     score=score,
                     metadata=meta_data["metadata"],
-                    raw_distance=float(dist),
+                    raw_distance=dist,
                 )
             )
 
@@ -338,103 +541,110 @@ class FAISSAdapter:
         """Two-stage filtered search.
 
         1. Get matching vector IDs from metadata filter
-        2. Search only those vectors
+        2. Search only those vectors: up to ``EXACT_FILTER_MAX`` candidates
+           are scored exactly, larger sets search the index with an ID
+           selector sized to the filter's selectivity
         """
-        import faiss
-
         # Get matching vector IDs
         matching_ids = self._metadata.filter(where)
 
         if not matching_ids:
             return []
 
-        # For small result sets, do exact search on matching IDs
-        if len(matching_ids) <= limit * 10:
-            # Get all matching vectors and compute distances
-            results = []
-
-            for faiss_id in matching_ids:
-                meta_data = self._metadata.get_by_vector_id(faiss_id)
-                if meta_data is None:
-                    continue
-
-                # Reconstruct vector from index (if possible)
-                try:
-                    vector = np.zeros((1, self._dimension), dtype=np.float32)
-                    self._index.reconstruct(faiss_id, vector[0])
-                    dist = float(np.sum((query[0] - vector[0]) ** 2))
-                except RuntimeError:
-                    # Index doesn't support reconstruction
-                    # Fall back to searching with ID selector
-                    break
-
-                score = 1.0 / (1.0 + dist)
-                results.append(
-                    VectorSearchResult(
-                        id=meta_data["chunk_id"],
-                        content=meta_data["content"],
-                        score=score,
-                        metadata=meta_data["metadata"],
-                        raw_distance=dist,
-                    )
-                )
-
-            # Sort by score descending
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[:limit]
-
-        # For large result sets, use IDSelector if available
-        try:
-            id_array = np.array(matching_ids, dtype=np.int64)
-            selector = faiss.IDSelectorArray(id_array)
-
-            # Create search parameters with selector
-            params = faiss.SearchParametersIVF()
-            params.sel = selector
+        candidates = np.array(matching_ids, dtype=np.int64)
+        if len(candidates) <= self.EXACT_FILTER_MAX:
+            hits = self._exact_filtered_search(query, candidates, limit)
+        else:
+            hits = self._selector_search(query, candidates, limit)
+        return self._hydrate(hits)
 
-            distances, indices = self._index.search(
-                query, min(limit, len(matching_ids)), params=params
-            )
+    def _exact_filtered_search(
+        self,
+        query: np.ndarray,
+        candidates: np.ndarray,
+        limit: int,
+    ) -> list[tuple[float, int]]:
+        """Score candidate vectors exactly with one matrix product.
 
-        except (AttributeError, TypeError):
-            # Fallback: search all, filter results
-            distances, indices = self._index.search(query, self._index.ntotal)
+        Args:
+            query: (1, d) query matrix
+            candidates: FAISS ids of the candidate vectors
+            limit: Maximum number of hits
 
-            matching_set = set(matching_ids)
-            filtered = [
-                (d, i)
-                for d, i in zip(distances[0], indices[0])
-                if i in matching_set
-            ][:limit]
+        Returns:
+            (L2 distance, FAISS id) pairs, nearest first
+        """
+        try:
+            vectors = self._reconstruct(candidates)
+        except RuntimeError:
+            # Metadata is committed before the index is persisted, so after
+            # a crash it can list vectors the saved index lacks; the selector
+            # skips those
+            return self._selector_search(query, candidates, limit)
+        distances, positions = exact_search(query, vectors, limit, metric="l2")
+        return [
+            (float(dist), int(candidates[pos]))
+            for dist, pos in zip(distances[0], positions[0], strict=True)
+        ]
+
+    def _selector_search(
+        self,
+        query: np.ndarray,
+        candidates: np.ndarray,
+        limit: int,
+    ) -> list[tuple[float, int]]:
+        """Search the index restricted to candidate IDs.
 
-            if filtered:
-                distances = np.array([[d for d, _ in filtered]])
-                indices = np.array([[i for _, i in filtered]])
-            else:
-                return []
+        The more selective the filter, the more IVF lists are probed (or
+        the wider the HNSW beam), so enough candidates are visited to fill
+        the top-k list.
 
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx == -1:
-                continue
+        Args:
+            query: (1, d) query matrix
+            candidates: FAISS ids of the candidate vectors
+            limit: Maximum number of hits
 
-            meta_data = self._metadata.get_by_vector_id(int(idx))
-            if meta_data is None:
-                continue
+        Returns:
+            (L2 distance, FAISS id) pairs, nearest first
+        """
+        import faiss
 
-            score = 1.0 / (1.0 + float(dist))
+        k = min(limit, len(candidates))
+        selector = faiss.IDSelectorBatch(candidates)
+        ivf = faiss.try_extract_index_ivf(self._index)
+        inner = (
+            faiss.downcast_index(self._index.index) if self._uses_id_map() else self._index
+        )
 
-            results.append(
-                VectorSearchResult(
-                    id=meta_data["chunk_id"],
-                    content=meta_data["content"],
-                    score=score,
-                    metadata=meta_data["metadata"],
-                    raw_distance=float(dist),
-                )
+        if ivf is not None:
+            # Expect about 2k candidates in the probed lists
+            nprobe = math.ceil(2 * k * ivf.nlist / len(candidates))
+            params = faiss.SearchParametersIVF(
+                sel=selector, nprobe=min(ivf.nlist, max(self._nprobe, nprobe))
             )
+        elif isinstance(inner, faiss.IndexHNSW):
+            selectivity = len(candidates) / self._index.ntotal
+            ef_search = max(inner.hnsw.efSearch, math.ceil(k / selectivity))
+            params = faiss.SearchParametersHNSW(
+                sel=selector, efSearch=min(self.MAX_EF_SEARCH, ef_search)
+            )
+        else:
+            params = faiss.SearchParameters(sel=selector)
 
-        return results
+        try:
+            distances, indices = self._index.search(query, k, params=params)
+        except (AttributeError, TypeError, RuntimeError):
+            # Fallback: search all, filter results
+            distances, indices = self._index.search(query, self._index.ntotal)
+            keep = np.isin(indices[0], candidates)
+            distances = distances[:, keep][:, :k]
+            indices = indices[:, keep][:, :k]
+
+        return [
+            (float(dist), int(idx))
+            for dist, idx in zip(distances[0], indices[0], strict=True)
+            if idx != -1
+        ]
 
     def get(self, ids: list[str]) -> list[VectorSearchResult | None]:
         """Retrieve vectors by ID.
@@ -446,9 +656,9 @@ class FAISSAdapter:
             List of results (None for missing IDs)
         """
         results: list[VectorSearchResult | None] = []
+        records = self._metadata.get_batch_by_chunk_ids(ids)
 
-        for chunk_id in ids:
-            meta_data = self._metadata.get(chunk_id)
+        for chunk_id, meta_data in zip(ids, records, strict=True):
             if meta_data is None:
                 results.append(None)
             else:
@@ -466,8 +676,8 @@ class FAISSAdapter:
     def delete(self, ids: list[str]) -> int:
         """Delete vectors by ID.
 
-        Note: FAISS doesn't support true deletion. We mark as deleted
-        in metadata and rebuild index periodically.
+        Vectors are removed from the index where it supports removal and
+        tombstoned otherwise (see :meth:`compact`).
 
         Args:
             ids: List of vector IDs to delete
@@ -477,16 +687,313 @@ class FAISSAdapter:
         """
         # Delete from metadata
         count = self._metadata.delete(ids)
+        if count:
+            self._dirty = True
 
         # Remove from ID mappings
+        removed = []
         for chunk_id in ids:
             faiss_id = self._id_to_faiss.pop(chunk_id, None)
             if faiss_id is not None:
                 self._faiss_to_id.pop(faiss_id, None)
+                removed.append(faiss_id)
+        self._remove_vectors(removed)
 
         logger.debug("Deleted %d vectors from FAISS metadata", count)
         return count
 
+    def _remove_vectors(self, faiss_ids: list[int]) -> None:
+        """Remove vectors from the index, tombstoning any it cannot remove."""
+        import faiss
+
+        if not faiss_ids:
+            return
+        self._dirty = True
+        if self._migration is not None:
+            self._migration.pending_removals.extend(faiss_ids)
+        # IndexIDMap2 renumbers the sub-index positions on removal, but IVF
+        # lists keep theirs, so ID-mapped IVF indexes tombstone instead
+        if self._uses_id_map() and faiss.try_extract_index_ivf(self._index) is None:
+            try:
+                self._index.remove_ids(np.array(faiss_ids, dtype=np.int64))
+                return
+            except RuntimeError:
+                pass  # e.g. HNSW does not support removal
+        self._tombstones.update(faiss_ids)
+
+    @property
+    def tombstone_count(self) -> int:
+        """Return the number of deleted vectors still in the index."""
+        return len(self._tombstones)
+
+    def compact(self) -> int:
+        """Rebuild the index without tombstoned vectors.
+
+        Live vectors keep their IDs, so the metadata store is unchanged.
+        IVF indexes keep their trained quantiser (and PQ codebooks): the
+        stored codes of live vectors are copied into an emptied clone, so
+        compaction neither retrains nor re-encodes them. Other indexes are
+        rebuilt from their stored vectors. Indexes created before ID maps
+        are converted to ID-mapped indexes.
+
+        Returns:
+            Number of tombstoned vectors dropped
+        """
+        import faiss
+
+        if not self._tombstones:
+            return 0
+
+        live_ids = np.array(sorted(self._faiss_to_id), dtype=np.int64)
+        ivf = faiss.try_extract_index_ivf(self._index)
+        if ivf is not None:
+            index = self._compact_ivf(ivf, live_ids)
+        else:
+            vectors = self._reconstruct(live_ids)
+            index, _ = self._build_index(self._index_type_of(self._index), live_ids, vectors)
+
+        dropped = len(self._tombstones)
+        self._index = index
+        self._tombstones = set()
+        self._dirty = True
+        logger.info("Compacted FAISS index: dropped %d deleted vectors", dropped)
+        return dropped
+
+    def _compact_ivf(self, ivf: Any, live_ids: np.ndarray) -> Any:
+        """Copy the live entries of an IVF index into an emptied clone.
+
+        Args:
+            ivf: The IVF index (inside the ID map, if any)
+            live_ids: Sorted IDs of the vectors to keep
+
+        Returns:
+            ID-mapped IVF index holding only ``live_ids``
+        """
+        import faiss
+        from faiss.contrib.inspect_tools import get_invlist
+
+        # Vector ID of each position stored in the inverted lists
+        if self._uses_id_map():
+            position_ids = faiss.vector_to_array(self._index.id_map)
+        else:
+            position_ids = np.arange(ivf.ntotal, dtype=np.int64)
+        live = np.isin(position_ids, live_ids)
+        new_position = np.cumsum(live) - 1
+
+        fresh = faiss.clone_index(ivf)
+        fresh.reset()
+        # Entries are written straight into the lists; map them afterwards
+        fresh.make_direct_map(False)
+        index = faiss.IndexIDMap2(fresh)
+        for list_no in range(ivf.nlist):
+            positions, codes = get_invlist(ivf.invlists, list_no)
+            keep = live[positions]
+            if not keep.any():
+                continue
+            kept_ids = np.ascontiguousarray(new_position[positions[keep]], dtype=np.int64)
+            kept_codes = np.ascontiguousarray(codes[keep])
+            fresh.invlists.add_entries(
+                list_no, len(kept_ids), faiss.swig_ptr(kept_ids), faiss.swig_ptr(kept_codes)
+            )
+
+        fresh.ntotal = index.ntotal = int(live.sum())
+        faiss.copy_array_to_vector(position_ids[live], index.id_map)
+        index.construct_rev_map()
+        fresh.make_direct_map()
+        fresh.nprobe = ivf.nprobe
+        return index
+
+    def _reconstruct(self, faiss_ids: np.ndarray) -> np.ndarray:
+        """Read stored vectors back from the index by ID."""
+        import faiss
+
+        if not len(faiss_ids):
+            return np.empty((0, self._dimension), dtype=np.float32)
+
+        ivf = faiss.try_extract_index_ivf(self._index)
+        if ivf is not None and ivf.direct_map.type == faiss.DirectMap.NoMap:
+            # IVF indexes need a direct map to reconstruct; an array map is
+            # safe as vectors are never removed from them (see above)
+            ivf.make_direct_map()
+        return np.asarray(
+            self._index.reconstruct_batch(np.asarray(faiss_ids, dtype=np.int64)),
+            dtype=np.float32,
+        )
+
+    def _build_index(
+        self,
+        index_type: str,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        tune: bool = False,
+    ) -> tuple[Any, TuningResult | None]:
+        """Build an ID-mapped index holding ``vectors``.
+
+        IVF quantisers are trained on a sample of the vectors, falling back
+        to a flat index if there are too few. Only touches its arguments,
+        so it can run off the calling thread.
+
+        Args:
+            index_type: Index type to build
+            ids: Vector ID of each row of ``vectors``
+            vectors: (n, d) vectors to add
+            tune: Tune nprobe/efSearch on held-out vectors (excluded from
+                quantiser training)
+
+        Returns:
+            Tuple of (index, tuning result or None)
+        """
+        import faiss
+
+        order = np.random.default_rng(0).permutation(len(vectors))
+        held_out = order[: min(self.TUNING_QUERIES, len(vectors) // 10) if tune else 0]
+        train_pool = order[len(held_out) :]
+
+        nlist = max(self._nlist, math.isqrt(len(vectors)))
+        index = faiss.IndexIDMap2(self._create_index(len(vectors), index_type, nlist))
+        if not index.is_trained:
+            # PQ codebooks need 256 points whatever the number of lists
+            min_train = max(nlist, 256) if index_type == "IVFPQ" else nlist
+            if len(train_pool) >= min_train:
+                sample = np.sort(train_pool[: nlist * self.TRAIN_POINTS_PER_LIST])
+                index.train(vectors[sample])
+            else:
+                index = faiss.IndexIDMap2(faiss.IndexFlatL2(self._dimension))
+        if len(ids):
+            index.add_with_ids(vectors, ids)
+
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            ivf.make_direct_map()
+
+        tuning = None
+        if len(held_out):
+            tuning = tune_search_effort(index, vectors, ids, held_out, self._recall_target)
+        return index, tuning
+
+    def _maybe_migrate(self) -> None:
+        """Start a background rebuild if the store outgrew its index type."""
+        if not self._auto_migrate or self._migration is not None:
+            return
+        target = self._index_type_for(len(self._faiss_to_id))
+        current = self._index_type_of(self._index)
+        if current in self.LOSSY_INDEX_TYPES:
+            return
+        if self.INDEX_TYPES.index(target) > self.INDEX_TYPES.index(current):
+            self._start_migration(target, background=True)
+
+    def _start_migration(self, index_type: str, background: bool) -> None:
+        """Snapshot the live vectors and build a new index from them.
+
+        Args:
+            index_type: Index type to build
+            background: Build on a separate thread
+
+        Raises:
+            ValueError: If the current index only stores compressed vectors
+        """
+        current = self._index_type_of(self._index)
+        if current in self.LOSSY_INDEX_TYPES:
+            raise ValueError(
+                f"Cannot rebuild a {current} FAISS index: it stores compressed "
+                "vectors only. Re-index the documents to change the index type."
+            )
+        live_ids = np.array(sorted(self._faiss_to_id), dtype=np.int64)
+        vectors = self._reconstruct(live_ids)
+        migration = _IndexMigration(index_type=index_type)
+        self._migration = migration
+        logger.info(
+            "Rebuilding FAISS index as %s (%d vectors)", index_type, len(live_ids)
+        )
+
+        def build() -> None:
+            try:
+                migration.index, migration.tuning = self._build_index(
+                    index_type, live_ids, vectors, tune=True
+                )
+            except Exception as e:  # noqa: BLE001 - reported when finishing
+                migration.error = e
+
+        if background:
+            migration.thread = threading.Thread(
+                target=build, name="faiss-rebuild", daemon=True
+            )
+            migration.thread.start()
+        else:
+            build()
+
+    def _finish_migration(self, wait: bool = False) -> None:
+        """Swap in a rebuilt index once its build has finished.
+
+        Writes made since the snapshot are replayed onto the new index.
+
+        Args:
+            wait: Block until a running build finishes
+        """
+        migration = self._migration
+        if migration is None:
+            return
+        if migration.thread is not None:
+            if wait:
+                migration.thread.join()
+            elif migration.thread.is_alive():
+                return
+
+        self._migration = None
+        if migration.index is None:
+            logger.warning(
+                "FAISS index rebuild as %s failed, keeping current index: %s",
+                migration.index_type,
+                migration.error,
+            )
+            self._auto_migrate = False
+            return
+
+        index = migration.index
+        for new_ids, vectors in migration.pending_adds:
+            index.add_with_ids(vectors, new_ids)
+        self._index = index
+        self._tombstones = set()
+        self._remove_vectors(migration.pending_removals)
+
+        tuning = migration.tuning
+        if tuning is not None and tuning.parameter == "nprobe":
+            self._nprobe = tuning.value
+        self._dirty = True
+        logger.info(
+            "Swapped in %s FAISS index (%d vectors%s)",
+            migration.index_type,
+            index.ntotal,
+            f", {tuning.parameter}={tuning.value} at recall {tuning.recall:.2f}"
+            if tuning
+            else "",
+        )
+
+    def rebuild_index(self, index_type: str | None = None) -> str:
+        """Rebuild the index now, in the calling thread.
+
+        Args:
+            index_type: Index type to build (default: the type suited to
+                the number of stored vectors)
+
+        Returns:
+            Type of the resulting index
+
+        Raises:
+            ValueError: If the current index is IVFPQ (see class docstring)
+        """
+        self._finish_migration(wait=True)
+        target = index_type or self._index_type_for(len(self._faiss_to_id))
+        self._start_migration(target, background=False)
+        self._finish_migration()
+        return self._index_type_of(self._index)
+
+    def _needs_compaction(self) -> bool:
+        """Whether tombstones exceed the compaction threshold."""
+        if not self._tombstones or self._compact_threshold <= 0:
+            return False
+        return len(self._tombstones) > self._compact_threshold * max(1, self._index.ntotal)
+
     def exists(self, id: str) -> bool:
         """Check if a vector exists.
 
@@ -536,8 +1043,7 @@ class FAISSAdapter:
             count = self._index.ntotal
             latency = (time.perf_counter() - start) * 1000
 
-            # Determine index type
-            index_type = type(self._index).__name__
+            index_type = self._index_type_of(self._index)
 
             return BackendHealth(
                 backend=BackendType.FAISS,
@@ -545,7 +1051,10 @@ class FAISSAdapter:
                 message=f"OK ({count} vectors, {index_type})",
                 details={
                     "vector_count": count,
+                    "tombstones": len(self._tombstones),
                     "index_type": index_type,
+                    "migrating_to": self._migration.index_type if self._migration else None,
+                    "nprobe": self._nprobe,
                     "persist_directory": str(self._persist_directory),
                     "dimension": self._dimension,
                 },
@@ -562,9 +1071,16 @@ class FAISSAdapter:
             )
 
     def persist(self) -> None:
-        """Persist index and mappings to disk."""
+        """Persist index and mappings to disk.
+
+        Compacts the index first if tombstones exceed the threshold.
+        """
         import faiss
 
+        self._finish_migration()
+        if self._needs_compaction():
+            self.compact()
+
         # Save FAISS index
         faiss.write_index(self._index, str(self._index_path))
 
@@ -575,10 +1091,16 @@ class FAISSAdapter:
                     "id_to_faiss": self._id_to_faiss,
                     "faiss_to_id": self._faiss_to_id,
                     "next_id": self._next_id,
+                    "tombstones": sorted(self._tombstones),
+                    "nprobe": self._nprobe,
                 },
                 f,
             )
 
+        # Other processes only see FAISS changes once they are on disk
+        if self._dirty:
+            bump_generation(self._persist_directory)
+            self._dirty = False
         logger.debug("Persisted FAISS index and mappings")
 
     def reset(self) -> None:
@@ -590,21 +1112,33 @@ class FAISSAdapter:
             self._index_path.unlink()
         if self._id_map_path.exists():
             self._id_map_path.unlink()
-        if self._metadata_path.exists():
-            self._metadata_path.unlink()
+        # Close pooled connections first so no WAL is left behind
+        self._metadata.close()
+        for path in (
+            self._metadata_path,
+            self._metadata_path.with_name(self._metadata_path.name + "-wal"),
+            self._metadata_path.with_name(self._metadata_path.name + "-shm"),
+        ):
+            path.unlink(missing_ok=True)
 
-        # Reset state
+        # Reset state (a rebuild in progress is abandoned)
+        self._migration = None
         self._id_to_faiss = {}
         self._faiss_to_id = {}
         self._next_id = 0
-        self._index = faiss.IndexFlatL2(self._dimension)
+        self._tombstones = set()
+        self._index = faiss.IndexIDMap2(faiss.IndexFlatL2(self._dimension))
 
         # Reinitialise metadata
-        self._metadata = SQLiteMetadataStore(self._metadata_path)
+        self._metadata = SQLiteMetadataStore(
+            self._metadata_path, cache_size=self._metadata_cache_size
+        )
 
+        bump_generation(self._persist_directory)
         logger.info("FAISS reset complete")
 
     def close(self) -> None:
-        """Clean up resources."""
+        """Clean up resources, waiting for any index rebuild to finish."""
+        self._finish_migration(wait=True)
         self.persist()
         self._metadata.close()
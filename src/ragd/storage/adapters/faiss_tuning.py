@@ -0,0 +1,119 @@
+"""Recall-driven tuning of FAISS search effort.
+
+Approximate indexes trade recall for speed through one knob: ``nprobe``
+(IVF lists scanned) or ``efSearch`` (HNSW beam width). Fixed defaults are
+either wasteful or lossy depending on corpus size, so after building an
+index the FAISS adapter picks the smallest setting that reaches a recall
+target on held-out queries, measured against exact neighbours.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Values tried for each knob, smallest first
+NPROBE_STEPS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+EF_SEARCH_STEPS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+@dataclass
+class TuningResult:
+    """Outcome of search-effort tuning."""
+
+    parameter: str  # "nprobe" or "efSearch"
+    value: int
+    recall: float
+
+
+def recall_at_k(
+    index: Any,
+    queries: np.ndarray,
+    query_ids: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+) -> float:
+    """Measure recall@k of an index against exact neighbours.
+
+    Queries are corpus vectors, so each query's own ID is ignored.
+
+    Args:
+        index: FAISS index returning vector IDs
+        queries: (n, d) query matrix
+        query_ids: ID of each query vector
+        truth: (n, k + 1) exact neighbour IDs, nearest first
+        k: Number of neighbours scored
+
+    Returns:
+        Mean fraction of true neighbours found
+    """
+    _, found = index.search(queries, truth.shape[1])
+    hits = 0
+    total = 0
+    for qid, row_truth, row_found in zip(query_ids, truth, found, strict=True):
+        expected = [i for i in row_truth if i != qid][:k]
+        got = {i for i in row_found if i != qid and i != -1}
+        hits += sum(1 for i in expected if i in got)
+        total += len(expected)
+    return hits / total if total else 1.0
+
+
+def tune_search_effort(
+    index: Any,
+    vectors: np.ndarray,
+    ids: np.ndarray,
+    query_positions: np.ndarray,
+    target: float = 0.95,
+    k: int = 10,
+) -> TuningResult | None:
+    """Set the smallest nprobe/efSearch reaching a recall target.
+
+    The chosen value is left set on the index. If no value reaches the
+    target, the largest one tried is kept.
+
+    Args:
+        index: Built FAISS index (optionally ID-mapped) holding ``vectors``
+        vectors: (m, d) original indexed vectors; exact neighbours are
+            computed from them, so they must not be decoded from a lossy
+            (e.g. PQ) index
+        ids: Vector ID of each row of ``vectors``
+        query_positions: Rows of ``vectors`` used as held-out queries
+        target: Recall@k to reach
+        k: Number of neighbours scored
+
+    Returns:
+        TuningResult, or None for indexes without a search-effort knob
+    """
+    import faiss
+
+    ivf = faiss.try_extract_index_ivf(index)
+    inner = faiss.downcast_index(index.index) if hasattr(index, "id_map") else index
+    if ivf is not None:
+        parameter, steps = "nprobe", [s for s in NPROBE_STEPS if s < ivf.nlist]
+        steps.append(ivf.nlist)
+    elif isinstance(inner, faiss.IndexHNSW):
+        parameter, steps = "efSearch", list(EF_SEARCH_STEPS)
+    else:
+        return None
+
+    if len(query_positions) == 0:
+        return None
+
+    queries = np.ascontiguousarray(vectors[query_positions], dtype=np.float32)
+    _, truth_positions = faiss.knn(queries, vectors, min(k + 1, len(vectors)))
+    truth = ids[truth_positions]
+    query_ids = ids[query_positions]
+
+    recall = 0.0
+    for value in steps:
+        if ivf is not None:
+            ivf.nprobe = value
+        else:
+            inner.hnsw.efSearch = value
+        recall = recall_at_k(index, queries, query_ids, truth, k)
+        if recall >= target:
+            break
+
+    return TuningResult(parameter=parameter, value=value, recall=recall)
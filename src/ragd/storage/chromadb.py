@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from ragd.storage.generation import bump_generation
+
 # Lazy import chromadb - it's heavy (~3-5 seconds)
 # Imported inside ChromaStore.__init__ when actually needed
 if TYPE_CHECKING:
@@ -128,6 +130,7 @@ class ChromaStore:
                 }
             ],
         )
+        bump_generation(self.persist_directory)
 
     def search(
         self,
@@ -257,6 +260,14 @@ class ChromaStore:
         result = self._metadata.get(ids=[document_id])
         return bool(result["ids"])
 
+    def list_document_ids(self) -> set[str]:
+        """List the IDs of all indexed documents.
+
+        Returns:
+            Set of document IDs
+        """
+        return set(self._metadata.get(include=[])["ids"])
+
     def delete_document(self, document_id: str) -> bool:
         """Delete a document and its chunks.
 
@@ -277,6 +288,7 @@ class ChromaStore:
         # Delete metadata
         self._metadata.delete(ids=[document_id])
 
+        bump_generation(self.persist_directory)
         return True
 
     def list_documents(self) -> list[DocumentRecord]:
@@ -330,6 +342,7 @@ class ChromaStore:
         self._metadata = self._client.get_or_create_collection(
             name=self.METADATA_COLLECTION,
         )
+        bump_generation(self.persist_directory)
 
 
 def generate_document_id(path: Path) -> str:
@@ -0,0 +1,231 @@
+"""Pooled SQLite connections.
+
+Metadata stores used to open a fresh connection for every operation,
+which dominated the latency of metadata-heavy commands. A pool keeps one
+persistent connection per thread for each database file, configured once
+with WAL journaling and read-tuning pragmas. Persistent connections also
+make sqlite3's prepared-statement cache effective.
+
+Stores on the same file share a pool (see :func:`get_pool`), so the tag,
+collection and document stores behind ``metadata.sqlite`` reuse one
+connection per thread. Threads such as the folder watcher or the TUI get
+their own connection; connections are never shared between threads.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Connection tuning defaults
+MMAP_SIZE = 64 * 1024 * 1024  # bytes of the file memory-mapped for reads
+CACHE_KB = 8 * 1024  # page cache per connection
+BUSY_TIMEOUT = 30.0  # seconds to wait for a lock held by another writer
+CACHED_STATEMENTS = 256  # prepared statements kept per connection
+
+
+class SQLiteConnectionPool:
+    """Per-thread persistent connections to one SQLite database.
+
+    :meth:`connection` commits on success and rolls back on error at the
+    outermost level, so nested use within a thread shares one
+    transaction. If the database file is deleted or replaced, all
+    connections are closed and reopened on the new file.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        mmap_size: int = MMAP_SIZE,
+        cache_kb: int = CACHE_KB,
+        busy_timeout: float = BUSY_TIMEOUT,
+        cached_statements: int = CACHED_STATEMENTS,
+    ) -> None:
+        """Initialise the pool. Connections are opened on first use.
+
+        Args:
+            db_path: Path to SQLite database file
+            mmap_size: Bytes of the database to memory-map (0 disables)
+            cache_kb: Page cache size per connection in KiB
+            busy_timeout: Seconds to wait for locks held by other writers
+            cached_statements: Prepared statements cached per connection
+        """
+        self.db_path = db_path
+        self._mmap_size = mmap_size
+        self._cache_kb = cache_kb
+        self._busy_timeout = busy_timeout
+        self._cached_statements = cached_statements
+
+        self._lock = threading.Lock()
+        # Thread ident -> connection, and -> nesting depth of connection()
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._depth: dict[int, int] = {}
+        self._file_id: tuple[int, int] | None = None
+        self._pid = os.getpid()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the calling thread's connection.
+
+        Yields:
+            Connection with ``sqlite3.Row`` rows
+        """
+        ident = threading.get_ident()
+        conn = self._acquire(ident)
+        outermost = self._depth.get(ident, 0) == 0
+        self._depth[ident] = self._depth.get(ident, 0) + 1
+        try:
+            yield conn
+            if outermost:
+                conn.commit()
+        except Exception:
+            if outermost:
+                conn.rollback()
+            raise
+        finally:
+            self._depth[ident] = self._depth.get(ident, 1) - 1
+
+    def _acquire(self, ident: int) -> sqlite3.Connection:
+        """Return the thread's connection, opening or reopening it."""
+        with self._lock:
+            if os.getpid() != self._pid:
+                # Forked child: the parent's handles must not be used
+                self._connections.clear()
+                self._depth.clear()
+                self._file_id = None
+                self._pid = os.getpid()
+
+            conn = self._connections.get(ident)
+            if conn is not None and self._depth.get(ident, 0) > 0:
+                return conn
+            if conn is not None and self._file_changed():
+                logger.debug("Database file replaced, reopening: %s", self.db_path)
+                self._close_all()
+                conn = None
+            if conn is None:
+                self._prune_dead_threads()
+                conn = self._open()
+                self._connections[ident] = conn
+            return conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self._busy_timeout,
+            check_same_thread=False,  # pool.close() may run on another thread
+            cached_statements=self._cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = {-int(self._cache_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        self._file_id = self._stat()
+        return conn
+
+    def _stat(self) -> tuple[int, int] | None:
+        """Identify the database file by device and inode."""
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _file_changed(self) -> bool:
+        """Check whether the file was deleted or replaced since opening."""
+        return self._stat() != self._file_id
+
+    def _prune_dead_threads(self) -> None:
+        """Close connections owned by threads that have exited."""
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [i for i in self._connections if i not in alive]:
+            self._close_connection(ident)
+
+    def _close_connection(self, ident: int) -> None:
+        """Close one thread's connection (lock held)."""
+        conn = self._connections.pop(ident)
+        self._depth.pop(ident, None)
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug("Error closing connection to %s: %s", self.db_path, e)
+
+    def _close_all(self) -> None:
+        """Close every connection (lock held)."""
+        for ident in list(self._connections):
+            self._close_connection(ident)
+        self._file_id = None
+
+    def close(self) -> None:
+        """Close all connections. The pool reopens them on next use."""
+        with self._lock:
+            self._close_all()
+
+    def __len__(self) -> int:
+        """Return the number of open connections."""
+        return len(self._connections)
+
+
+# Pools live as long as some store holds them; connections close with them
+_pools: weakref.WeakValueDictionary[Path, SQLiteConnectionPool] = (
+    weakref.WeakValueDictionary()
+)
+_pools_lock = threading.Lock()
+
+
+def _pool_key(db_path: Path) -> Path:
+    """Normalise a database path for the pool registry."""
+    return Path(os.path.abspath(db_path))
+
+
+def get_pool(db_path: Path) -> SQLiteConnectionPool:
+    """Get the shared connection pool for a database file.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Pool shared by every caller using the same file; callers keep a
+        reference to it for as long as they use the database
+    """
+    key = _pool_key(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLiteConnectionPool(db_path)
+        return pool
+
+
+def close_pool(db_path: Path) -> None:
+    """Close the pooled connections to a database file.
+
+    Call before deleting or replacing the file, so that no open
+    connection leaves its WAL files behind. The pool stays registered and
+    reopens connections on next use.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    with _pools_lock:
+        pool = _pools.get(_pool_key(db_path))
+    if pool is not None:
+        pool.close()
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection in the process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,59 @@
+"""Index generation counters.
+
+Every write to an index directory (vector store or BM25) bumps a counter
+stored next to the data. Long-lived readers such as pooled searchers
+compare the counter with the value they saw when they opened their
+handles, and reopen when it has moved, including after writes from other
+processes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+GENERATION_FILE = "index.generation"
+
+
+def read_generation(directory: Path) -> int:
+    """Read the current generation of an index directory.
+
+    Args:
+        directory: Index directory
+
+    Returns:
+        Generation counter (0 if the index has never been written)
+    """
+    try:
+        return int((directory / GENERATION_FILE).read_text().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_generation(directory: Path) -> int:
+    """Advance the generation of an index directory after a write.
+
+    The new value is at least the current time in nanoseconds, so two
+    processes bumping concurrently never write the same value.
+
+    Args:
+        directory: Index directory
+
+    Returns:
+        New generation counter (0 if it could not be written)
+    """
+    generation = max(read_generation(directory) + 1, time.time_ns())
+    target = directory / GENERATION_FILE
+    tmp = directory / f"{GENERATION_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        tmp.write_text(str(generation))
+        os.replace(tmp, target)
+    except OSError as e:
+        logger.debug("Could not update index generation in %s: %s", directory, e)
+        return 0
+    return generation
@@ -9,11 +9,14 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
-from collections.abc import Iterator
-from contextlib import contextmanager
+import threading
+from collections import OrderedDict
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
+from ragd.storage.connections import get_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,14 +60,25 @@ class SQLiteMetadataStore:
     CREATE INDEX IF NOT EXISTS idx_document_id ON vector_metadata(document_id);
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, cache_size: int = 0) -> None:
         """Initialise SQLite metadata store.
 
         Args:
             db_path: Path to SQLite database file
+            cache_size: Decoded records kept in memory by vector ID for
+                :meth:`get_batch` (0 disables)
         """
         self._db_path = db_path
         db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(db_path)
+
+        # Cleared on every write: a replace on chunk_id drops the old
+        # vector_id row, and deletes must not be served from cache
+        self._cache_size = cache_size
+        self._cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by every invalidation; reads started earlier are not cached
+        self._cache_epoch = 0
 
         # Initialise database
         with self._connection() as conn:
@@ -72,22 +86,9 @@ class SQLiteMetadataStore:
 
         logger.debug("SQLiteMetadataStore initialised: %s", db_path)
 
-    @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Get a database connection with proper cleanup."""
-        conn = sqlite3.connect(
-            str(self._db_path),
-            detect_types=sqlite3.PARSE_DECLTYPES,
-        )
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+    def _connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Borrow this thread's pooled connection (commits on success)."""
+        return self._pool.connection()
 
     def add(
         self,
@@ -115,6 +116,7 @@ class SQLiteMetadataStore:
                 """,
                 (vector_id, chunk_id, document_id, content, json.dumps(metadata)),
             )
+        self._invalidate_cache()
 
     def add_batch(
         self,
@@ -137,6 +139,7 @@ class SQLiteMetadataStore:
                     for vid, cid, did, content, meta in items
                 ],
             )
+        self._invalidate_cache()
 
     def get(self, chunk_id: str) -> dict[str, Any] | None:
         """Get metadata by chunk ID.
@@ -203,6 +206,8 @@ class SQLiteMetadataStore:
     def get_batch(self, vector_ids: list[int]) -> list[dict[str, Any] | None]:
         """Get metadata for multiple vector IDs efficiently.
 
+        Uncached IDs are fetched in one query.
+
         Args:
             vector_ids: List of vector IDs
 
@@ -212,30 +217,103 @@ class SQLiteMetadataStore:
         if not vector_ids:
             return []
 
+        result_map: dict[int, dict[str, Any]] = {}
+        epoch = 0
+        if self._cache_size > 0:
+            with self._cache_lock:
+                epoch = self._cache_epoch
+                for vid in vector_ids:
+                    record = self._cache.get(vid)
+                    if record is not None:
+                        self._cache.move_to_end(vid)
+                        result_map[vid] = record
+
+        missing = [vid for vid in dict.fromkeys(vector_ids) if vid not in result_map]
+        if missing:
+            with self._connection() as conn:
+                placeholders = ",".join("?" * len(missing))
+                rows = conn.execute(
+                    f"""
+                    SELECT vector_id, chunk_id, document_id, content, metadata
+                    FROM vector_metadata
+                    WHERE vector_id IN ({placeholders})
+                    """,
+                    missing,
+                ).fetchall()
+
+            fetched = {row["vector_id"]: self._row_to_record(row) for row in rows}
+            result_map.update(fetched)
+            self._cache_records(fetched, epoch)
+
+        # Return in order, copied so callers cannot modify cached records
+        return [
+            {**record, "metadata": dict(record["metadata"])}
+            if (record := result_map.get(vid)) is not None
+            else None
+            for vid in vector_ids
+        ]
+
+    def get_batch_by_chunk_ids(self, chunk_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Get metadata for multiple chunk IDs in one query.
+
+        Args:
+            chunk_ids: List of chunk identifiers
+
+        Returns:
+            List of metadata dicts (None for missing IDs)
+        """
+        if not chunk_ids:
+            return []
+
+        unique = list(dict.fromkeys(chunk_ids))
         with self._connection() as conn:
-            placeholders = ",".join("?" * len(vector_ids))
+            placeholders = ",".join("?" * len(unique))
             rows = conn.execute(
                 f"""
                 SELECT vector_id, chunk_id, document_id, content, metadata
                 FROM vector_metadata
-                WHERE vector_id IN ({placeholders})
+                WHERE chunk_id IN ({placeholders})
                 """,
-                vector_ids,
+                unique,
             ).fetchall()
 
-            # Build lookup
-            result_map: dict[int, dict[str, Any]] = {}
-            for row in rows:
-                result_map[row["vector_id"]] = {
-                    "vector_id": row["vector_id"],
-                    "chunk_id": row["chunk_id"],
-                    "document_id": row["document_id"],
-                    "content": row["content"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
-                }
+        result_map = {row["chunk_id"]: self._row_to_record(row) for row in rows}
+        return [result_map.get(cid) for cid in chunk_ids]
 
-            # Return in order
-            return [result_map.get(vid) for vid in vector_ids]
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> dict[str, Any]:
+        """Decode a vector_metadata row."""
+        return {
+            "vector_id": row["vector_id"],
+            "chunk_id": row["chunk_id"],
+            "document_id": row["document_id"],
+            "content": row["content"],
+            "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+        }
+
+    def _cache_records(self, records: dict[int, dict[str, Any]], epoch: int) -> None:
+        """Add decoded records to the LRU cache.
+
+        Args:
+            records: Records by vector ID
+            epoch: Cache epoch read before the records were queried; if a
+                write has invalidated the cache since, the records may be
+                stale and are not cached
+        """
+        if self._cache_size <= 0 or not records:
+            return
+        with self._cache_lock:
+            if epoch != self._cache_epoch:
+                return
+            self._cache.update(records)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached records after a write."""
+        with self._cache_lock:
+            self._cache_epoch += 1
+            self._cache.clear()
 
     def filter(self, where: dict[str, Any]) -> list[int]:
         """Find vector IDs matching filter criteria.
@@ -404,7 +482,8 @@ class SQLiteMetadataStore:
                 f"DELETE FROM vector_metadata WHERE chunk_id IN ({placeholders})",
                 chunk_ids,
             )
-            return cursor.rowcount
+        self._invalidate_cache()
+        return cursor.rowcount
 
     def delete_by_document(self, document_id: str) -> int:
         """Delete all metadata for a document.
@@ -420,7 +499,8 @@ class SQLiteMetadataStore:
                 "DELETE FROM vector_metadata WHERE document_id = ?",
                 (document_id,),
             )
-            return cursor.rowcount
+        self._invalidate_cache()
+        return cursor.rowcount
 
     def delete_by_vector_ids(self, vector_ids: list[int]) -> int:
         """Delete metadata by vector IDs.
@@ -440,7 +520,8 @@ class SQLiteMetadataStore:
                 f"DELETE FROM vector_metadata WHERE vector_id IN ({placeholders})",
                 vector_ids,
             )
-            return cursor.rowcount
+        self._invalidate_cache()
+        return cursor.rowcount
 
     def count(self) -> int:
         """Return total number of metadata records."""
@@ -477,8 +558,5 @@ class SQLiteMetadataStore:
             return [row["vector_id"] for row in rows]
 
     def close(self) -> None:
-        """Close database connections.
-
-        Note: This is a no-op since we use connection-per-operation pattern.
-        """
-        pass
+        """Close pooled database connections (reopened on next use)."""
+        self._pool.close()
@@ -101,6 +101,24 @@ class VectorStore(Protocol):
         """
         ...
 
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Search for several query vectors in one backend call.
+
+        Args:
+            query_embeddings: Query vectors
+            limit: Maximum number of results per query
+            where: Optional filter conditions (backend-specific)
+
+        Returns:
+            One list of VectorSearchResult per query, in query order
+        """
+        ...
+
     def get(self, ids: list[str]) -> list[VectorSearchResult | None]:
         """Retrieve vectors by ID.
 
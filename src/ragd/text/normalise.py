@@ -165,54 +165,47 @@ class TextNormaliser:
         """
         from ragd.text.captions import remove_captions
         from ragd.text.pdf_fixes import (
-            fix_ligature_errors,
-            fix_ocr_spelling,
-            fix_spaced_letters,
             fix_spurious_newlines,
-            fix_title_ocr,
-            fix_word_boundaries,
+            get_rule_engine,
+            get_word_rule_engine,
         )
 
+        settings = self.settings
         changes: list[str] = []
-        normalised = text
 
-        if self.settings.fix_spaced_letters:
-            new_text = fix_spaced_letters(normalised)
-            if new_text != normalised:
-                changes.append("fixed_spaced_letters")
-                normalised = new_text
-
-        if self.settings.fix_word_boundaries:
-            new_text = fix_word_boundaries(normalised)
-            if new_text != normalised:
-                changes.append("fixed_word_boundaries")
-                normalised = new_text
+        # Spaced letters and merged words, in one scan
+        groups = [
+            group
+            for group, enabled in (
+                ("spaced_letters", settings.fix_spaced_letters),
+                ("word_boundaries", settings.fix_word_boundaries),
+            )
+            if enabled
+        ]
+        normalised, fired = get_rule_engine(*groups).apply(text)
+        changes.extend(fired)
 
-        if self.settings.fix_line_breaks:
+        if settings.fix_line_breaks:
             new_text = fix_spurious_newlines(normalised)
             if new_text != normalised:
                 changes.append("fixed_spurious_newlines")
                 normalised = new_text
 
-        # Apply ligature fixes (F-051)
-        if self.settings.fix_ligature_errors:
-            new_text = fix_ligature_errors(normalised)
-            if new_text != normalised:
-                changes.append("fixed_ligature_errors")
-                normalised = new_text
-
-        # Apply title OCR fixes (F-051)
-        if self.settings.fix_title_ocr:
-            new_text = fix_title_ocr(normalised)
-            if new_text != normalised:
-                changes.append("fixed_title_ocr")
-                normalised = new_text
-
-        if self.settings.fix_ocr_spelling:
-            new_text = fix_ocr_spelling(normalised)
-            if new_text != normalised:
-                changes.append("fixed_ocr_spelling")
-                normalised = new_text
+        # Ligature (F-051), title (F-051) and OCR fixes, in one pass over
+        # the words
+        groups = [
+            group
+            for group, enabled in (
+                ("ligature_errors", settings.fix_ligature_errors),
+                ("title_ocr", settings.fix_title_ocr),
+                ("ocr_spelling", settings.fix_ocr_spelling),
+            )
+            if enabled
+        ]
+        normalised, fired = get_word_rule_engine(
+            *groups, repair_unrecognised=settings.fix_ocr_spelling
+        ).apply(normalised)
+        changes.extend(fired)
 
         # Remove captions (F-051)
         if self.settings.remove_captions:
@@ -5,60 +5,286 @@ Addresses common issues from PDF text extraction:
 - Merged words from missing spaces
 - Spurious line breaks
 - OCR errors
+
+Fixes are expressed as :class:`Rule` lists and applied by an engine
+that scans the text once per group of fixes rather than once per
+pattern: :class:`RuleEngine` joins patterns into one alternation, and
+:class:`WordRuleEngine` fixes each distinct word once and reuses the
+result. Dictionary decisions (is this a merged word, can this OCR error
+be repaired) are memoised per word.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from functools import lru_cache
 
 from ragd.text.wordlist import get_common_words, is_valid_word
 
+# Distinct words remembered by the word-level fixes
+_WORD_CACHE_SIZE = 65536
 
-def fix_spaced_letters(text: str) -> str:
-    """Fix spaced-out letters like 'y o u r' → 'your'.
 
-    This pattern commonly occurs in justified PDF text where characters
-    are spaced apart.
+@dataclass(frozen=True)
+class Rule:
+    """A substitution applied by a rule engine.
 
-    Args:
-        text: Text with potential spaced letters
-
-    Returns:
-        Text with spaced letters collapsed
+    Attributes:
+        label: Change recorded when the rule alters text
+        pattern: Regular expression to find
+        replacement: Template (may use backreferences), or a function
+            from the matched text to its replacement
+        ignore_case: Match case-insensitively
     """
-    # Pattern: single letters separated by spaces (minimum 3 letters)
-    # e.g., "y o u r" or "c o m p u t e r"
-    pattern = r"\b([a-zA-Z])((?:\s+[a-zA-Z]){2,})\b"
 
-    def replace_spaced(match: re.Match[str]) -> str:
-        # Get all characters
-        full_match = match.group(0)
-        letters = re.findall(r"[a-zA-Z]", full_match)
-        collapsed = "".join(letters)
+    label: str
+    pattern: str
+    replacement: str | Callable[[str], str]
+    ignore_case: bool = False
 
-        # Verify it forms a valid word
-        if is_valid_word(collapsed.lower()):
-            return collapsed
 
-        # Not a valid word, return original
-        return full_match
+class RuleEngine:
+    """Apply an ordered list of rules in one scan of the text.
 
-    return re.sub(pattern, replace_spaced, text)
+    All patterns are joined into a single alternation. At each position
+    the first rule (in list order) that matches is applied, and scanning
+    resumes after the match, so replaced text is not re-examined by
+    later rules.
+    """
 
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        """Compile rules.
+
+        Args:
+            rules: Rules in priority order
+        """
+        self.rules = tuple(rules)
+        self._patterns = [
+            re.compile(rule.pattern, re.IGNORECASE if rule.ignore_case else 0)
+            for rule in self.rules
+        ]
+        self._pattern = (
+            re.compile(
+                "|".join(
+                    f"(?P<r{i}>(?i:{rule.pattern}))"
+                    if rule.ignore_case
+                    else f"(?P<r{i}>{rule.pattern})"
+                    for i, rule in enumerate(self.rules)
+                )
+            )
+            if self.rules
+            else None
+        )
+        # Rule owning each top-level group (match.lastindex)
+        self._rule_at = (
+            {index: int(name[1:]) for name, index in self._pattern.groupindex.items()}
+            if self._pattern
+            else {}
+        )
+
+    def apply(self, text: str) -> tuple[str, list[str]]:
+        """Apply the rules.
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Tuple of (fixed text, labels of rules that changed it, in
+            rule order)
+        """
+        if self._pattern is None:
+            return text, []
+
+        fired: set[int] = set()
+        rule_at = self._rule_at
+
+        def replace(match: re.Match[str]) -> str:
+            i = rule_at[match.lastindex]  # type: ignore[index]
+            rule = self.rules[i]
+            original = match.group()
+            if callable(rule.replacement):
+                fixed = rule.replacement(original)
+            else:
+                # Re-match the rule alone so backreferences use its groups
+                own = self._patterns[i].match(match.string, match.start())
+                fixed = own.expand(rule.replacement)  # type: ignore[union-attr]
+            if fixed != original:
+                fired.add(i)
+            return fixed
+
+        result = self._pattern.sub(replace, text)
+        labels: list[str] = []
+        for i in sorted(fired):
+            if self.rules[i].label not in labels:
+                labels.append(self.rules[i].label)
+        return result, labels
+
+    def sub(self, text: str) -> str:
+        """Apply the rules, returning only the fixed text.
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Fixed text
+        """
+        return self.apply(text)[0]
+
+
+class WordRuleEngine:
+    """Apply rules that only rewrite letters within a word, word by word.
+
+    The text is scanned once for words (``\\w+`` runs). Each distinct word
+    is fixed once, by applying the rules to it in order, and the result is
+    reused for every occurrence. Rules must match letters only, anchored
+    at most by ``\\b`` and lookaheads, so a word gives the same result on
+    its own as in context, and the output equals applying each rule to
+    the whole text in turn.
+
+    An optional ``repair`` function is then applied to words that are
+    purely alphabetic, at least four letters and delimited by whitespace.
+    """
 
-def fix_word_boundaries(text: str) -> str:
-    """Fix merged words like 'abig' → 'a big'.
+    _WORD = re.compile(r"\w+")
+    _REPAIR_LABEL = "fixed_ocr_spelling"
+
+    def __init__(
+        self,
+        rules: Sequence[Rule],
+        repair: Callable[[str], str] | None = None,
+    ) -> None:
+        """Compile rules.
+
+        Args:
+            rules: Rules in the order to apply them
+            repair: Optional whole-word repair for unrecognised words
+        """
+        self.rules = tuple(rules)
+        self._repair = repair
+        self._patterns = [
+            re.compile(rule.pattern, re.IGNORECASE if rule.ignore_case else 0)
+            for rule in self.rules
+        ]
+        # Cheap test for words no rule can touch
+        self._any = (
+            re.compile(
+                "|".join(
+                    f"(?i:{rule.pattern})" if rule.ignore_case else f"(?:{rule.pattern})"
+                    for rule in self.rules
+                )
+            )
+            if self.rules
+            else None
+        )
+        self._fix_word = lru_cache(maxsize=_WORD_CACHE_SIZE)(self._apply_rules)
+
+    def _apply_rules(self, word: str) -> tuple[str, tuple[str, ...], str | None]:
+        """Fix a word.
+
+        Returns:
+            Tuple of (word with rules applied, labels of rules that
+            changed it, repaired word to use if it is whitespace-delimited
+            or None)
+        """
+        labels: list[str] = []
+        if self._any is not None and self._any.search(word) is not None:
+            for rule, pattern in zip(self.rules, self._patterns, strict=True):
+                replacement = rule.replacement
+                if callable(replacement):
+                    fixed = pattern.sub(lambda m, fn=replacement: fn(m.group()), word)
+                else:
+                    fixed = pattern.sub(replacement, word)
+                if fixed != word:
+                    word = fixed
+                    if rule.label not in labels:
+                        labels.append(rule.label)
+
+        repaired = None
+        if self._repair is not None and len(word) >= 4 and word.isalpha():
+            candidate = self._repair(word)
+            if candidate != word:
+                repaired = candidate
+        return word, tuple(labels), repaired
+
+    def apply(self, text: str) -> tuple[str, list[str]]:
+        """Apply the rules.
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Tuple of (fixed text, labels of rules that changed it, in
+            rule order)
+        """
+        if not self.rules and self._repair is None:
+            return text, []
+
+        fired: set[str] = set()
+        end = len(text)
+        fix_word = self._fix_word
+
+        def replace(match: re.Match[str]) -> str:
+            word, labels, repaired = fix_word(match.group())
+            if labels:
+                fired.update(labels)
+            if repaired is not None:
+                start, stop = match.span()
+                if (start == 0 or text[start - 1].isspace()) and (
+                    stop == end or text[stop].isspace()
+                ):
+                    fired.add(self._REPAIR_LABEL)
+                    return repaired
+            return word
+
+        result = self._WORD.sub(replace, text)
+        order = [rule.label for rule in self.rules] + [self._REPAIR_LABEL]
+        return result, [label for label in dict.fromkeys(order) if label in fired]
+
+    def sub(self, text: str) -> str:
+        """Apply the rules, returning only the fixed text.
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Fixed text
+        """
+        return self.apply(text)[0]
+
+
+@lru_cache(maxsize=_WORD_CACHE_SIZE)
+def _collapse_spaced(run: str) -> str:
+    """Collapse a run of spaced letters if it spells a word."""
+    collapsed = "".join(run.split())
+    return collapsed if is_valid_word(collapsed.lower()) else run
+
+
+# Pattern: single letters separated by spaces (minimum 3 letters)
+# e.g., "y o u r" or "c o m p u t e r"
+SPACED_LETTER_RULES = [
+    Rule("fixed_spaced_letters", r"\b[a-zA-Z](?:\s+[a-zA-Z]){2,}\b", _collapse_spaced),
+]
 
-    This commonly occurs when PDF extraction misses space characters.
+
+def fix_spaced_letters(text: str) -> str:
+    """Fix spaced-out letters like 'y o u r' → 'your'.
+
+    This pattern commonly occurs in justified PDF text where characters
+    are spaced apart.
 
     Args:
-        text: Text with potential merged words
+        text: Text with potential spaced letters
 
     Returns:
-        Text with word boundaries fixed
+        Text with spaced letters collapsed
     """
-    common_prefixes = {
+    return get_rule_engine("spaced_letters").sub(text)
+
+
+COMMON_PREFIXES = frozenset(
+    {
         "a",
         "an",
         "the",
@@ -83,8 +309,10 @@ def fix_word_boundaries(text: str) -> str:
         "he",
         "me",
     }
+)
 
-    common_suffixes = {
+COMMON_SUFFIXES = frozenset(
+    {
         "the",
         "and",
         "for",
@@ -117,50 +345,62 @@ def fix_word_boundaries(text: str) -> str:
         "may",
         "day",
     }
+)
 
-    result = text
-
-    # Try to split merged words using common prefix patterns
-    for prefix in common_prefixes:
-        # Pattern: prefix directly followed by another word
-        pattern = rf"\b({prefix})([a-z]{{3,}})\b"
+# Longest first, so "thecomputer" splits after "the" rather than "t"
+_PREFIX_LENGTHS = sorted({len(p) for p in COMMON_PREFIXES}, reverse=True)
+_SUFFIX_LENGTHS = sorted({len(s) for s in COMMON_SUFFIXES}, reverse=True)
 
-        def split_prefix(match: re.Match[str]) -> str:
-            full_word = match.group(0)
-            # Don't split if the original word is already valid
-            if is_valid_word(full_word.lower()):
-                return full_word
 
-            prefix_word = match.group(1)
-            rest = match.group(2)
-            # Only split if the rest forms a valid word
-            if is_valid_word(rest.lower()):
-                return f"{prefix_word} {rest}"
-            return full_word
+@lru_cache(maxsize=_WORD_CACHE_SIZE)
+def _split_merged_word(word: str) -> str:
+    """Split a word made of a common word and another word.
 
-        result = re.sub(pattern, split_prefix, result, flags=re.IGNORECASE)
+    A word is only split if it is not itself valid and the other part
+    is a valid word; a leading common word (prefix) is tried before a
+    trailing one (suffix).
+    """
+    lower = word.lower()
+    if is_valid_word(lower):
+        return word
+
+    for size in _PREFIX_LENGTHS:
+        if (
+            len(word) - size >= 3
+            and lower[:size] in COMMON_PREFIXES
+            and is_valid_word(lower[size:])
+        ):
+            return f"{word[:size]} {word[size:]}"
+
+    for size in _SUFFIX_LENGTHS:
+        if (
+            len(word) - size >= 2
+            and lower[-size:] in COMMON_SUFFIXES
+            and is_valid_word(lower[:-size])
+        ):
+            return f"{word[:-size]} {word[-size:]}"
+
+    return word
+
+
+# Candidates are whole words long enough to hold a prefix plus 3 letters
+WORD_BOUNDARY_RULES = [
+    Rule("fixed_word_boundaries", r"\b[a-z]{4,}\b", _split_merged_word, ignore_case=True),
+]
 
-    # Try common suffix patterns (word ending with common word)
-    for suffix in common_suffixes:
-        # Pattern: word ending with a common word suffix
-        pattern = rf"\b([a-z]{{2,}})({suffix})\b"
 
-        def split_suffix(match: re.Match[str]) -> str:
-            full_word = match.group(0)
-            # Don't split if the original word is already valid
-            if is_valid_word(full_word.lower()):
-                return full_word
+def fix_word_boundaries(text: str) -> str:
+    """Fix merged words like 'abig' → 'a big'.
 
-            first = match.group(1)
-            suffix_word = match.group(2)
-            # Only split if the first part forms a valid word
-            if is_valid_word(first.lower()):
-                return f"{first} {suffix_word}"
-            return full_word
+    This commonly occurs when PDF extraction misses space characters.
 
-        result = re.sub(pattern, split_suffix, result, flags=re.IGNORECASE)
+    Args:
+        text: Text with potential merged words
 
-    return result
+    Returns:
+        Text with word boundaries fixed
+    """
+    return get_rule_engine("word_boundaries").sub(text)
 
 
 def fix_spurious_newlines(text: str) -> str:
@@ -232,6 +472,70 @@ def fix_spurious_newlines(text: str) -> str:
     return result
 
 
+# Common OCR confusion patterns, matched case-insensitively
+OCR_PATTERNS = [
+    # rn → m (very common)
+    (r"\brn(?=[aeiou])", "m"),  # rn before vowel → m
+    # vv → w
+    (r"vv", "w"),
+    # cl → d (in specific contexts)
+    (r"\bcl(?=ose|ear|ean|aim|ass)", "d"),
+    # Common misspellings from OCR
+    (r"\btbe\b", "the"),
+    (r"\btlie\b", "the"),
+    (r"\bwbich\b", "which"),
+    (r"\bwbat\b", "what"),
+    (r"\btbat\b", "that"),
+    (r"\btbis\b", "this"),
+    (r"\bwitb\b", "with"),
+    (r"\bfrorn\b", "from"),
+    (r"\bsorne\b", "some"),
+    (r"\btirne\b", "time"),
+    (r"\brnore\b", "more"),
+    (r"\bbecorne\b", "become"),
+    (r"\bnarne\b", "name"),
+    (r"\bsarne\b", "same"),
+    (r"\bcarne\b", "came"),
+    (r"\bgarne\b", "game"),
+    (r"\bfrarne\b", "frame"),
+]
+
+OCR_SPELLING_RULES = [
+    Rule("fixed_ocr_spelling", pattern, replacement, ignore_case=True)
+    for pattern, replacement in OCR_PATTERNS
+]
+
+# OCR character substitutions tried on unrecognised words
+OCR_SUBSTITUTIONS = {
+    "rn": "m",
+    "vv": "w",
+    "cl": "d",
+    "ii": "u",
+    "nn": "m",
+}
+
+_OCR_SUBSTITUTION_PATTERNS = [
+    (wrong, re.compile(wrong, re.IGNORECASE), right)
+    for wrong, right in OCR_SUBSTITUTIONS.items()
+]
+
+
+@lru_cache(maxsize=_WORD_CACHE_SIZE)
+def _fix_ocr_word(word: str) -> str:
+    """Repair an unrecognised word with the first OCR substitution that fits."""
+    lower = word.lower()
+    if is_valid_word(lower):
+        return word
+
+    for wrong, pattern, right in _OCR_SUBSTITUTION_PATTERNS:
+        if wrong in lower:
+            candidate = pattern.sub(right, word)
+            if is_valid_word(candidate.lower()):
+                return candidate
+
+    return word
+
+
 def fix_ocr_spelling(text: str) -> str:
     """Fix common OCR errors.
 
@@ -243,103 +547,16 @@ def fix_ocr_spelling(text: str) -> str:
     - 0 → O (and vice versa)
     - 1 → l (and vice versa)
 
-    Args:
-        text: Text with potential OCR errors
-
-    Returns:
-        Text with OCR errors fixed
-    """
-    # Common OCR confusion patterns
-    ocr_patterns = [
-        # rn → m (very common)
-        (r"\brn(?=[aeiou])", "m"),  # rn before vowel → m
-        # vv → w
-        (r"vv", "w"),
-        # cl → d (in specific contexts)
-        (r"\bcl(?=ose|ear|ean|aim|ass)", "d"),
-        # Common misspellings from OCR
-        (r"\btbe\b", "the"),
-        (r"\btlie\b", "the"),
-        (r"\bwbich\b", "which"),
-        (r"\bwbat\b", "what"),
-        (r"\btbat\b", "that"),
-        (r"\btbis\b", "this"),
-        (r"\bwitb\b", "with"),
-        (r"\bfrorn\b", "from"),
-        (r"\bsorne\b", "some"),
-        (r"\btirne\b", "time"),
-        (r"\brnore\b", "more"),
-        (r"\bbecorne\b", "become"),
-        (r"\bnarne\b", "name"),
-        (r"\bsarne\b", "same"),
-        (r"\bcarne\b", "came"),
-        (r"\bgarne\b", "game"),
-        (r"\bfrarne\b", "frame"),
-    ]
-
-    result = text
-    for pattern, replacement in ocr_patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-    # More aggressive: try to fix unrecognised words
-    result = _fix_unrecognised_words(result)
-
-    return result
-
-
-def _fix_unrecognised_words(text: str) -> str:
-    """Try to fix unrecognised words using OCR substitutions.
-
-    Processes text line-by-line to preserve document structure.
+    Unrecognised words are then repaired with OCR character
+    substitutions where that yields a known word.
 
     Args:
         text: Text with potential OCR errors
 
     Returns:
-        Text with some errors fixed, preserving newlines
+        Text with OCR errors fixed
     """
-    # OCR character substitutions
-    substitutions = {
-        "rn": "m",
-        "vv": "w",
-        "cl": "d",
-        "ii": "u",
-        "nn": "m",
-    }
-
-    # Process line-by-line to preserve newlines
-    lines = text.split("\n")
-    fixed_lines = []
-
-    for line in lines:
-        words = line.split()
-        fixed_words = []
-
-        for word in words:
-            # Skip short words and words with non-alpha characters
-            if len(word) < 4 or not word.isalpha():
-                fixed_words.append(word)
-                continue
-
-            # Skip if already a valid word
-            if is_valid_word(word.lower()):
-                fixed_words.append(word)
-                continue
-
-            # Try substitutions
-            fixed = word
-            for wrong, right in substitutions.items():
-                if wrong in word.lower():
-                    candidate = re.sub(wrong, right, word, flags=re.IGNORECASE)
-                    if is_valid_word(candidate.lower()):
-                        fixed = candidate
-                        break
-
-            fixed_words.append(fixed)
-
-        fixed_lines.append(" ".join(fixed_words))
-
-    return "\n".join(fixed_lines)
+    return get_word_rule_engine("ocr_spelling", repair_unrecognised=True).sub(text)
 
 
 @lru_cache(maxsize=1)
@@ -374,6 +591,11 @@ LIGATURE_PATTERNS = [
     (r"\biag", "flag"),
 ]
 
+LIGATURE_RULES = [
+    Rule("fixed_ligature_errors", pattern, replacement, ignore_case=True)
+    for pattern, replacement in LIGATURE_PATTERNS
+]
+
 
 def fix_ligature_errors(text: str) -> str:
     """Fix common OCR ligature confusion (fi, fl, ff).
@@ -387,12 +609,7 @@ def fix_ligature_errors(text: str) -> str:
     Returns:
         Text with ligature errors corrected
     """
-    result = text
-
-    for pattern, replacement in LIGATURE_PATTERNS:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-    return result
+    return get_word_rule_engine("ligature_errors").sub(text)
 
 
 # Title case OCR patterns (common misrecognitions in headings)
@@ -413,6 +630,10 @@ TITLE_OCR_PATTERNS = [
     (r"\bTliose\b", "Those"),
 ]
 
+TITLE_OCR_RULES = [
+    Rule("fixed_title_ocr", pattern, replacement) for pattern, replacement in TITLE_OCR_PATTERNS
+]
+
 
 def fix_title_ocr(text: str) -> str:
     """Fix common OCR errors in title case text.
@@ -426,9 +647,44 @@ def fix_title_ocr(text: str) -> str:
     Returns:
         Text with title OCR errors corrected
     """
-    result = text
+    return get_word_rule_engine("title_ocr").sub(text)
 
-    for pattern, replacement in TITLE_OCR_PATTERNS:
-        result = re.sub(pattern, replacement, result)
 
-    return result
+RULE_GROUPS: dict[str, list[Rule]] = {
+    "spaced_letters": SPACED_LETTER_RULES,
+    "word_boundaries": WORD_BOUNDARY_RULES,
+    "ligature_errors": LIGATURE_RULES,
+    "title_ocr": TITLE_OCR_RULES,
+    "ocr_spelling": OCR_SPELLING_RULES,
+}
+
+
+@lru_cache(maxsize=64)
+def get_rule_engine(*groups: str) -> RuleEngine:
+    """Get a :class:`RuleEngine` for rule groups, compiled once.
+
+    Args:
+        *groups: Names from ``RULE_GROUPS``, in priority order
+
+    Returns:
+        RuleEngine applying the rules of every group in one scan
+    """
+    return RuleEngine([rule for group in groups for rule in RULE_GROUPS[group]])
+
+
+@lru_cache(maxsize=64)
+def get_word_rule_engine(*groups: str, repair_unrecognised: bool = False) -> WordRuleEngine:
+    """Get a :class:`WordRuleEngine` for rule groups, compiled once.
+
+    Args:
+        *groups: Names from ``RULE_GROUPS``, in the order to apply them
+        repair_unrecognised: Also repair unrecognised words with OCR
+            character substitutions
+
+    Returns:
+        WordRuleEngine applying the rules of every group
+    """
+    return WordRuleEngine(
+        [rule for group in groups for rule in RULE_GROUPS[group]],
+        repair=_fix_ocr_word if repair_unrecognised else None,
+    )
@@ -333,7 +333,7 @@ def index_command(
     This is useful after changing embedding models or configuration.
     """
     from ragd.config import ensure_data_dir, load_config
-    from ragd.ingestion import discover_files, index_path
+    from ragd.ingestion import index_path
     from ragd.ui import format_index_results
 
     con = get_console(no_color)
@@ -364,19 +364,10 @@ def index_command(
         config.indexing.duplicate_policy = "overwrite"
         con.print("[dim]Overwrite mode: existing documents will be re-indexed[/dim]")
 
-    # Discover files first to get total count
-    files = discover_files(path, recursive=recursive)
-    total_files = len(files)
-
-    if total_files == 0:
-        con.print("[yellow]No supported files found to index.[/yellow]")
-        raise typer.Exit()
-
+    # Files are discovered while indexing runs, so the total grows as it goes
     if output_format == "rich" and not verbose:
         # Progress bar mode (default)
-        con.print(
-            f"\n[bold]Indexing {total_files} document{'s' if total_files != 1 else ''}...[/bold]\n"
-        )
+        con.print(f"\n[bold]Indexing documents in {path}...[/bold]\n")
 
         # Suppress stdout/stderr from third-party libraries (PaddleOCR, Docling, etc.)
         # This prevents library output from disrupting Rich's progress bar rendering
@@ -391,7 +382,7 @@ def index_command(
             console=con,
             transient=False,
         ) as progress:
-            task = progress.add_task("Indexing...", total=total_files, current_file="")
+            task = progress.add_task("Indexing...", total=None, current_file="")
 
             def progress_callback(completed: int, total: int, filename: str) -> None:
                 # completed = number of files finished, filename = current file (empty when done)
@@ -400,7 +391,9 @@ def index_command(
                     file_display = f"[dim]({truncated})[/dim]"
                 else:
                     file_display = "[green](done)[/green]"
-                progress.update(task, completed=completed, current_file=file_display)
+                progress.update(
+                    task, completed=completed, total=total, current_file=file_display
+                )
 
             # Suppress library output during indexing to keep progress bar clean
             with SuppressStdout():
@@ -428,6 +421,10 @@ def index_command(
             contextual=use_contextual,
         )
 
+    if not results:
+        con.print("[yellow]No supported files found to index.[/yellow]")
+        raise typer.Exit()
+
     # Format output
     output = format_index_results(
         results,
@@ -448,6 +445,8 @@ def search_command(
     output_format: OutputFormat = "rich",
     no_color: bool = False,
     tags: list[str] | None = None,
+    collection: str | None = None,
+    max_tier: str | None = None,
 ) -> None:
     """Search indexed documents with natural language.
 
@@ -507,20 +506,20 @@ def search_command(
         raise typer.Exit(1)
     cite_style = cite.lower()
 
-    # Tag filtering: get allowed document IDs
-    allowed_doc_ids: set[str] | None = None
-    if tags:
-        from ragd.metadata.tags import TagManager
-        from ragd.storage.metadata import MetadataStore
+    # Tag, collection and tier filters restrict retrieval to these documents
+    from ragd.search.scope import resolve_document_scope
 
-        store = MetadataStore(config.data_dir / "metadata.db")
-        tag_mgr = TagManager(store)
-        matching_ids = tag_mgr.find_by_tags(tags, match_all=True)
-        allowed_doc_ids = set(matching_ids)
+    try:
+        allowed_doc_ids = resolve_document_scope(
+            config, tags=tags, collection=collection, max_tier=max_tier
+        )
+    except ValueError as e:
+        con.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from e
 
-        if not allowed_doc_ids:
-            con.print(f"[yellow]No documents found with tags: {', '.join(tags)}[/yellow]")
-            return
+    if allowed_doc_ids is not None and not allowed_doc_ids:
+        con.print("[yellow]No documents match the given filters[/yellow]")
+        return
 
     try:
         with Progress(
@@ -537,6 +536,7 @@ def search_command(
                 mode=search_mode,
                 min_score=effective_min_score,
                 config=config,
+                document_ids=allowed_doc_ids,
             )
     except QueryParseError as e:
         con.print(f"[red]{e.user_message()}[/red]")
@@ -562,10 +562,6 @@ def search_command(
         for hr in hybrid_results
     ]
 
-    # Filter by tags if specified
-    if allowed_doc_ids is not None:
-        results = [r for r in results if r.document_id in allowed_doc_ids]
-
     # Determine if we should use interactive mode
     # Interactive mode requires: TTY, rich format, not disabled, and results exist
     use_interactive = (
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Threads listing directories concurrently during discovery
+DISCOVERY_WORKERS = 8
+
 FileType = Literal["pdf", "txt", "md", "html", "unknown"]
 
 SUPPORTED_EXTENSIONS: dict[str, FileType] = {
@@ -46,40 +52,109 @@ def is_supported_file(path: Path) -> bool:
     return get_file_type(path) != "unknown"
 
 
-def discover_files(path: Path, recursive: bool = True) -> list[Path]:
-    """Discover supported files in a path.
+def _scan_directory(directory: str) -> tuple[list[Path], list[str]]:
+    """List the supported files and subdirectories of one directory.
+
+    Symlinks are skipped for security (prevents path traversal attacks).
+
+    Args:
+        directory: Directory path
+
+    Returns:
+        Tuple of (supported files, subdirectory paths)
+    """
+    files: list[Path] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                supported = os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                try:
+                    if entry.is_symlink():
+                        if supported:
+                            logger.warning("Skipping symlink: %s", entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif supported and entry.is_file(follow_symlinks=False):
+                        files.append(Path(entry.path))
+                except OSError as e:
+                    logger.debug("Cannot stat %s: %s", entry.path, e)
+    except OSError as e:
+        logger.warning("Cannot read directory %s: %s", directory, e)
+    return files, subdirs
+
+
+def iter_files(
+    path: Path,
+    recursive: bool = True,
+    workers: int = DISCOVERY_WORKERS,
+) -> Iterator[Path]:
+    """Stream supported files from a path as they are found.
+
+    Walks the tree once with ``os.scandir``, classifying each entry by
+    extension. With ``workers > 1``, directories are listed concurrently
+    on a thread pool, which hides per-directory latency on network
+    mounts. Files are yielded in no particular order.
 
     Symlinks are skipped for security (prevents path traversal attacks).
 
     Args:
         path: File or directory path
         recursive: Whether to search recursively
+        workers: Threads listing directories concurrently
 
-    Returns:
-        List of supported file paths
+    Yields:
+        Supported file paths
     """
     # Security: Skip symlinks to prevent path traversal
     if path.is_symlink():
         logger.warning("Skipping symlink: %s", path)
-        return []
+        return
 
     if path.is_file():
         if is_supported_file(path):
-            return [path]
-        return []
+            yield path
+        return
 
     if not path.is_dir():
-        return []
+        return
+
+    if not recursive or workers <= 1:
+        pending = [str(path)]
+        while pending:
+            files, subdirs = _scan_directory(pending.pop())
+            yield from files
+            if recursive:
+                pending.extend(subdirs)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ragd-discover") as executor:
+        running: set[Future[tuple[list[Path], list[str]]]] = {
+            executor.submit(_scan_directory, str(path))
+        }
+        try:
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    running.update(executor.submit(_scan_directory, d) for d in subdirs)
+                    yield from files
+        finally:
+            # Stop listing if the consumer closes the generator early
+            for future in running:
+                future.cancel()
 
-    files = []
-    pattern = "**/*" if recursive else "*"
 
-    for ext in SUPPORTED_EXTENSIONS:
-        for file_path in path.glob(f"{pattern}{ext}"):
-            # Security: Skip symlinks in directory traversal
-            if file_path.is_symlink():
-                logger.warning("Skipping symlink: %s", file_path)
-                continue
-            files.append(file_path)
+def discover_files(path: Path, recursive: bool = True) -> list[Path]:
+    """Discover supported files in a path.
+
+    Symlinks are skipped for security (prevents path traversal attacks).
+
+    Args:
+        path: File or directory path
+        recursive: Whether to search recursively
 
-    return sorted(files)
+    Returns:
+        Sorted list of supported file paths
+    """
+    return sorted(iter_files(path, recursive=recursive))
@@ -290,6 +290,16 @@ class ColPaliEmbedder(VisionEmbedder):
         """Return model name."""
         return self._model_name
 
+    def unload(self) -> None:
+        """Free the model and processor; they reload on next use."""
+        if self._model is None:
+            return
+        from ragd.embedding.registry import release_torch_memory
+
+        self._model = None
+        self._processor = None
+        release_torch_memory()
+
     def is_available(self) -> bool:
         """Check if ColPali is available.
 
@@ -330,6 +340,9 @@ def create_vision_embedder(
 ) -> ColPaliEmbedder | None:
     """Create a vision embedder if dependencies are available.
 
+    Embedders are shared through the model registry, so repeated calls
+    with the same settings reuse one loaded model until it goes idle.
+
     Args:
         model_name: Model to use
         device: Device to use
@@ -342,4 +355,9 @@ def create_vision_embedder(
         logger.info("Vision embedding unavailable: %s", message)
         return None
 
-    return ColPaliEmbedder(model_name=model_name, device=device)
+    from ragd.embedding.registry import get_model_registry
+
+    return get_model_registry().get(
+        ("vision", model_name, device),
+        lambda: ColPaliEmbedder(model_name=model_name, device=device),
+    )
@@ -15,7 +15,9 @@ from ragd.benchmark.runner import (
     BenchmarkResult,
     BenchmarkRunner,
     BenchmarkSuite,
+    FusionBenchmark,
     IndexingBenchmark,
+    NormalisationBenchmark,
     SearchBenchmark,
     StartupBenchmark,
 )
@@ -234,6 +236,32 @@ class TestSearchBenchmark:
         assert result.name == "search"
 
 
+class TestFusionBenchmark:
+    """Test FusionBenchmark."""
+
+    @pytest.mark.parametrize("method", ["rrf", "combsum", "combmnz"])
+    def test_fusion_benchmark_run(self, method: str) -> None:
+        """FusionBenchmark should time fusion at large fetch limits."""
+        result = FusionBenchmark(fetch_limit=2000, method=method, iterations=2).run()
+
+        assert result.name == "fusion"
+        assert len(result.times_ms) == 2
+        assert result.metadata["fetch_limit"] == 2000
+
+
+class TestNormalisationBenchmark:
+    """Test NormalisationBenchmark."""
+
+    def test_normalisation_benchmark_run(self) -> None:
+        """NormalisationBenchmark should report time per MB."""
+        result = NormalisationBenchmark(size_mb=0.05, iterations=2).run()
+
+        assert result.name == "normalisation"
+        assert len(result.times_ms) == 2
+        assert result.metadata["size_mb"] == pytest.approx(0.05, abs=0.001)
+        assert result.metadata["ms_per_mb"] > 0
+
+
 class TestBenchmarkRunner:
     """Test BenchmarkRunner."""
 
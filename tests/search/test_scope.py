@@ -0,0 +1,66 @@
+"""Tests for resolving search filters to document IDs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ragd.config import RagdConfig
+from ragd.metadata import DocumentMetadata, MetadataStore, TagManager
+from ragd.metadata.collections import CollectionManager
+from ragd.search.scope import resolve_document_scope
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> RagdConfig:
+    """Config with a populated metadata store."""
+    config = RagdConfig()
+    config.storage.data_dir = tmp_path
+    store = MetadataStore(config.metadata_path)
+    store.set("doc-a", DocumentMetadata(ragd_tags=["work", "python"], ragd_data_tier="public"))
+    store.set("doc-b", DocumentMetadata(ragd_tags=["work"], ragd_data_tier="sensitive"))
+    store.set("doc-c", DocumentMetadata(ragd_tags=["home"], ragd_data_tier="personal"))
+    CollectionManager(config.metadata_path, TagManager(store)).create(
+        "office", include_all=["work"]
+    )
+    return config
+
+
+def test_no_filters(config: RagdConfig) -> None:
+    assert resolve_document_scope(config) is None
+
+
+def test_tags(config: RagdConfig) -> None:
+    assert resolve_document_scope(config, tags=["work"]) == ["doc-a", "doc-b"]
+    assert resolve_document_scope(config, tags=["work", "python"]) == ["doc-a"]
+
+
+def test_collection_and_tier_combine(config: RagdConfig) -> None:
+    assert resolve_document_scope(config, collection="office") == ["doc-a", "doc-b"]
+    assert resolve_document_scope(config, collection="office", max_tier="personal") == ["doc-a"]
+    assert resolve_document_scope(config, max_tier="personal") == ["doc-a", "doc-c"]
+
+
+def test_no_match_is_empty(config: RagdConfig) -> None:
+    assert resolve_document_scope(config, tags=["missing"]) == []
+
+
+def test_unknown_collection(config: RagdConfig) -> None:
+    with pytest.raises(ValueError):
+        resolve_document_scope(config, collection="nope")
+
+
+def test_tier_is_resolved_in_one_query(config: RagdConfig) -> None:
+    with patch.object(MetadataStore, "get", side_effect=AssertionError("per-document get")):
+        assert resolve_document_scope(config, max_tier="public") == ["doc-a"]
+
+
+def test_tier_admitting_everything_is_unrestricted(config: RagdConfig) -> None:
+    assert resolve_document_scope(config, max_tier="critical") is None
+    assert resolve_document_scope(config, max_tier="sensitive") is None
+    assert resolve_document_scope(config, tags=["work"], max_tier="sensitive") == [
+        "doc-a",
+        "doc-b",
+    ]
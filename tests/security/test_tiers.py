@@ -172,6 +172,15 @@ class TestTierManager:
         assert counts[DataTier.SENSITIVE] == 1
         assert counts[DataTier.PERSONAL] == 1  # doc-003 defaults to personal
 
+    def test_ids_above_tier(self, manager) -> None:
+        """Test finding documents above a tier ceiling."""
+        manager.set_tier("doc-001", DataTier.PUBLIC)
+        manager.set_tier("doc-002", DataTier.CRITICAL)
+
+        assert manager.ids_above_tier(DataTier.PUBLIC) == {"doc-002", "doc-003"}
+        assert manager.ids_above_tier(DataTier.SENSITIVE) == {"doc-002"}
+        assert manager.ids_above_tier(DataTier.CRITICAL) == set()
+
     def test_promote_tier(self, manager) -> None:
         """Test promoting document tier."""
         manager.set_tier("doc-001", DataTier.PERSONAL)
@@ -1,10 +1,18 @@
 """Tests for text chunking module."""
 
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
 from ragd.ingestion.chunker import (
     Chunk,
     SentenceChunker,
     FixedChunker,
     RecursiveChunker,
+    StructureChunker,
+    TokenIndex,
     chunk_text,
     count_tokens,
     CHUNKERS,
@@ -127,3 +135,128 @@ def test_chunk_indices() -> None:
     if len(chunks) > 1:
         indices = [c.index for c in chunks]
         assert indices == list(range(len(chunks)))
+
+
+# Byte-level encoding that needs no download
+BYTE_ENCODING = tiktoken.Encoding(
+    name="test_bytes",
+    pat_str=r" ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={},
+)
+
+
+@pytest.fixture
+def byte_encoding() -> Iterator[tiktoken.Encoding]:
+    """Use the byte-level encoding for all token counting."""
+    with patch("ragd.ingestion.chunker._get_encoding", return_value=BYTE_ENCODING):
+        yield BYTE_ENCODING
+
+
+@pytest.mark.usefixtures("byte_encoding")
+def test_token_index_matches_span_encoding() -> None:
+    """Test span counts match encoding each span on its own."""
+    text = "First sentence here. Second one follows!\n\nThird: a new paragraph."
+    spans = [(0, 20), (21, 40), (42, 48), (49, len(text))]
+    index = TokenIndex(text)
+
+    expected = [count_tokens(text[start:end]) for start, end in spans]
+    assert index.count_spans(spans) == expected
+    assert [index.count(start, end) for start, end in spans] == expected
+    assert index.count(0, len(text)) == count_tokens(text)
+
+
+def test_token_index_estimates_without_encoding() -> None:
+    """Test counts fall back to a length estimate."""
+    with patch("ragd.ingestion.chunker._get_encoding", return_value=None):
+        index = TokenIndex("x" * 40)
+        assert index.count(0, 40) == 10
+        assert index.count_spans([(0, 8), (8, 40)]) == [2, 8]
+
+
+@pytest.mark.parametrize(
+    "chunker",
+    [
+        SentenceChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+        FixedChunker(chunk_size=10, overlap=2),
+        RecursiveChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+        StructureChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+    ],
+)
+def test_chunkers_encode_document_once(
+    byte_encoding: tiktoken.Encoding, chunker: object
+) -> None:
+    """Test chunkers tokenise the document once rather than per piece."""
+    text = "\n\n".join(
+        f"Paragraph {i}. It has two sentences." for i in range(20)
+    )
+    with patch.object(
+        byte_encoding, "encode_ordinary", wraps=byte_encoding.encode_ordinary
+    ) as encode:
+        chunks = chunker.chunk(text)  # type: ignore[attr-defined]
+
+    assert len(chunks) > 1
+    assert encode.call_count == 1
+
+
+@pytest.mark.usefixtures("byte_encoding")
+def test_sentence_chunk_token_counts() -> None:
+    """Test sentence chunk token counts add up the sentences they hold."""
+    text = "Alpha beta gamma. Delta epsilon zeta. Eta theta iota. Kappa lambda mu."
+    chunks = SentenceChunker(chunk_size=40, overlap=0, min_chunk_size=1).chunk(text)
+
+    for chunk in chunks:
+        sentences = chunk.content.split(". ")
+        pieces = [s if s.endswith(".") else s + "." for s in sentences]
+        assert chunk.token_count == sum(count_tokens(p) for p in pieces)
+
+
+SPAN_TEXT = (
+    "# Title\n\nIntro paragraph.  It has two sentences!\n\n\n"
+    + "Body text goes on. " * 30
+    + "\n\n## Section\n\nA list follows:\n- one\n- two\n\n"
+    + "Closing words.\nAnother Sentence here. " * 15
+)
+
+
+@pytest.mark.parametrize(
+    "chunker",
+    [
+        SentenceChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+        FixedChunker(chunk_size=40, overlap=5),
+        RecursiveChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+        StructureChunker(chunk_size=40, overlap=10, min_chunk_size=5),
+    ],
+)
+def test_chunk_offsets_match_source(chunker: object) -> None:
+    """Test chunk offsets locate each chunk's content in the source text."""
+    chunks = chunker.chunk(SPAN_TEXT)  # type: ignore[attr-defined]
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert SPAN_TEXT[chunk.start_char : chunk.end_char] == chunk.content
+        assert chunk.content == chunk.content.strip()
+    starts = [c.start_char for c in chunks]
+    assert starts == sorted(starts)
+
+
+def test_sentence_chunk_offsets_with_paragraphs() -> None:
+    """Test sentence chunks keep the source whitespace between sentences."""
+    text = "First sentence here.\n\nSecond one follows.   Third one ends it."
+    chunks = SentenceChunker(chunk_size=100, overlap=0, min_chunk_size=1).chunk(text)
+
+    assert len(chunks) == 1
+    assert chunks[0].start_char == 0
+    assert chunks[0].end_char == len(text)
+    assert chunks[0].content == text
+
+
+def test_chunk_from_span() -> None:
+    """Test span chunks read content from the source text."""
+    text = "  Leading and trailing  "
+    chunk = Chunk.from_span(text, 2, 22, index=0, token_count=3)
+
+    assert chunk.content == "Leading and trailing"
+    assert chunk == Chunk(
+        content="Leading and trailing", index=0, start_char=2, end_char=22, token_count=3
+    )
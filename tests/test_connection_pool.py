@@ -0,0 +1,81 @@
+"""Tests for pooled SQLite connections."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from ragd.metadata import MetadataStore, TagManager
+from ragd.metadata.collections import CollectionManager
+from ragd.storage.connections import SQLiteConnectionPool, close_pool, get_pool
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> SQLiteConnectionPool:
+    pool = SQLiteConnectionPool(tmp_path / "test.sqlite")
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+    return pool
+
+
+def test_connection_is_persistent_and_tuned(pool: SQLiteConnectionPool) -> None:
+    with pool.connection() as first:
+        mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert mode == "wal"
+
+
+def test_threads_get_own_connections(pool: SQLiteConnectionPool) -> None:
+    with pool.connection() as main_conn:
+        pass
+    seen = []
+
+    def worker() -> None:
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items VALUES ('from thread')")
+            seen.append(conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_conn
+    with pool.connection() as conn:
+        assert conn.execute("SELECT name FROM items").fetchall()[0][0] == "from thread"
+
+
+def test_outermost_block_owns_transaction(pool: SQLiteConnectionPool) -> None:
+    with pytest.raises(RuntimeError), pool.connection() as outer:
+        outer.execute("INSERT INTO items VALUES ('a')")
+        with pool.connection() as inner:
+            inner.execute("INSERT INTO items VALUES ('b')")
+        raise RuntimeError("abort")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_reopens_deleted_file(pool: SQLiteConnectionPool) -> None:
+    pool.db_path.unlink()
+
+    with pool.connection() as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+
+    assert tables == []
+
+
+def test_stores_share_pool(tmp_path: Path) -> None:
+    db_path = tmp_path / "metadata.sqlite"
+    store = MetadataStore(db_path)
+    manager = CollectionManager(db_path, TagManager(store))
+
+    assert store._pool is manager._pool is get_pool(db_path)
+
+    close_pool(db_path)
+    assert len(store._pool) == 0
+    assert store.count() == 0
@@ -63,3 +63,160 @@ class TestGetEmbedder:
         """Test get_embedder with specific model."""
         embedder = get_embedder(model_name="all-MiniLM-L6-v2")
         assert embedder.model_name == "all-MiniLM-L6-v2"
+
+
+class _RecordingEmbedder:
+    """Embedder that records calls and encodes text length."""
+
+    model_name = "recording"
+    dimension = 1
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class TestEmbeddingAccumulator:
+    """Tests for cross-document embedding micro-batching."""
+
+    def test_flush_embeds_once_and_scatters(self) -> None:
+        """All documents are embedded in one call and mapped back."""
+        from ragd.embedding.batching import EmbeddingAccumulator
+
+        embedder = _RecordingEmbedder()
+        acc = EmbeddingAccumulator(embedder)  # type: ignore[arg-type]
+        acc.add("a", ["xxxx", "x"])
+        acc.add("b", ["xx"])
+
+        vectors = acc.flush()
+
+        assert len(embedder.calls) == 1
+        assert vectors == {"a": [[4.0], [1.0]], "b": [[2.0]]}
+        assert len(acc) == 0
+
+    def test_texts_are_length_sorted(self) -> None:
+        """The combined batch is sorted by length to reduce padding."""
+        from ragd.embedding.batching import EmbeddingAccumulator
+
+        embedder = _RecordingEmbedder()
+        acc = EmbeddingAccumulator(embedder)  # type: ignore[arg-type]
+        acc.add("a", ["ccc", "a"])
+        acc.add("b", ["bb"])
+        acc.flush()
+
+        assert embedder.calls[0] == ["a", "bb", "ccc"]
+
+    def test_is_full_by_count_and_tokens(self) -> None:
+        """Budget is reached by text count or estimated tokens."""
+        from ragd.embedding.batching import EmbeddingAccumulator
+
+        by_count = EmbeddingAccumulator(_RecordingEmbedder(), max_texts=2)  # type: ignore[arg-type]
+        by_count.add("a", ["x"])
+        assert not by_count.is_full()
+        by_count.add("b", ["y"])
+        assert by_count.is_full()
+
+        by_tokens = EmbeddingAccumulator(
+            _RecordingEmbedder(), max_tokens=10, chars_per_token=4  # type: ignore[arg-type]
+        )
+        by_tokens.add("a", ["x" * 40])
+        assert by_tokens.is_full()
+
+    def test_flush_empty(self) -> None:
+        """Flushing with nothing queued returns no vectors."""
+        from ragd.embedding.batching import EmbeddingAccumulator
+
+        embedder = _RecordingEmbedder()
+        assert EmbeddingAccumulator(embedder).flush() == {}  # type: ignore[arg-type]
+        assert embedder.calls == []
+
+
+class _FakeModel:
+    """Model stand-in that records unloads."""
+
+    def __init__(self) -> None:
+        self.unloaded = False
+
+    def unload(self) -> None:
+        self.unloaded = True
+
+
+class TestModelRegistry:
+    """Tests for the shared model registry."""
+
+    def test_get_reuses_instance(self) -> None:
+        """Factory runs once per key."""
+        from ragd.embedding.registry import ModelRegistry
+
+        registry = ModelRegistry(idle_timeout=0)
+        created: list[int] = []
+
+        def factory() -> _FakeModel:
+            created.append(1)
+            return _FakeModel()
+
+        first = registry.get(("late", "m"), factory)
+        second = registry.get(("late", "m"), factory)
+        other = registry.get(("late", "other"), factory)
+
+        assert first is second
+        assert other is not first
+        assert len(created) == 2
+
+    def test_idle_models_are_unloaded(self) -> None:
+        """Unleased models past the timeout are unloaded and dropped."""
+        import time
+
+        from ragd.embedding.registry import ModelRegistry
+
+        registry = ModelRegistry(idle_timeout=10)
+        model = registry.get("m", _FakeModel)
+
+        assert registry.unload_idle(now=time.monotonic() + 5) == 0
+        assert registry.unload_idle(now=time.monotonic() + 60) == 1
+        assert model.unloaded
+        assert registry.loaded_keys() == []
+
+    def test_leased_models_stay_loaded(self) -> None:
+        """Reference-counted leases block idle unloading."""
+        import time
+
+        from ragd.embedding.registry import ModelRegistry
+
+        registry = ModelRegistry(idle_timeout=10)
+        model = registry.get("m", _FakeModel)
+
+        with registry.lease(model):
+            with registry.lease(model):
+                assert registry.ref_count(model) == 2
+            assert registry.unload_idle(now=time.monotonic() + 60) == 0
+            assert not model.unloaded
+
+        assert registry.ref_count(model) == 0
+        assert registry.unload_idle(now=time.monotonic() + 60) == 1
+
+    def test_late_chunking_embedder_is_shared(self) -> None:
+        """get_late_chunking_embedder returns one instance per settings."""
+        from unittest.mock import patch
+
+        from ragd.embedding.late_chunking import get_late_chunking_embedder
+        from ragd.embedding.registry import ModelRegistry
+
+        registry = ModelRegistry(idle_timeout=0)
+        with (
+            patch(
+                "ragd.embedding.late_chunking.check_late_chunking_available",
+                return_value=(True, ""),
+            ),
+            patch("ragd.embedding.registry.get_model_registry", return_value=registry),
+        ):
+            first = get_late_chunking_embedder("model-a")
+            second = get_late_chunking_embedder("model-a")
+            other = get_late_chunking_embedder("model-a", max_context_tokens=512)
+
+        assert first is second
+        assert other is not first
+        assert not first.is_loaded()
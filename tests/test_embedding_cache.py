@@ -0,0 +1,201 @@
+"""Tests for the persistent embedding cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ragd.config import RagdConfig
+from ragd.embedding import embedder as embedder_module
+from ragd.embedding.cache import (
+    EmbeddingCache,
+    embed_with_cache,
+    get_embedding_cache,
+    text_hash,
+)
+from ragd.embedding.embedder import SentenceTransformerEmbedder, get_embedder
+from ragd.embedding.late_chunking import ChunkBoundary, LateChunkingEmbedder
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    """Create a temporary embedding cache."""
+    with EmbeddingCache(tmp_path / "embeddings.db") as c:
+        yield c
+
+
+NS = EmbeddingCache.namespace("test-model")
+
+
+class TestTextHash:
+    """Tests for cache key hashing."""
+
+    def test_whitespace_insensitive(self) -> None:
+        assert text_hash("hello   world\n") == text_hash("hello world")
+
+    def test_content_sensitive(self) -> None:
+        assert text_hash("hello world") != text_hash("hello there")
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache storage."""
+
+    def test_round_trip(self, cache: EmbeddingCache) -> None:
+        cache.put_many(NS, ["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+        assert cache.get_many(NS, ["b", "missing", "a"]) == [
+            [3.0, 4.0],
+            None,
+            [1.0, 2.0],
+        ]
+
+    def test_namespaces_are_isolated(self, cache: EmbeddingCache) -> None:
+        other = EmbeddingCache.namespace("test-model", revision="abc123")
+        cache.put_many(NS, ["a"], [[1.0]])
+        assert cache.get_many(other, ["a"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        with EmbeddingCache(tmp_path / "e.db") as first:
+            first.put_many(NS, ["a"], [[0.5, 0.25]])
+        with EmbeddingCache(tmp_path / "e.db") as second:
+            assert second.get_many(NS, ["a"]) == [[0.5, 0.25]]
+            assert second.get_stats()["size_bytes"] == 8
+
+    def test_float16_storage(self, tmp_path: Path) -> None:
+        with EmbeddingCache(tmp_path / "e.db", dtype="float16") as c:
+            c.put_many(NS, ["a"], [[0.5, 0.25]])
+            assert c.get_many(NS, ["a"]) == [[0.5, 0.25]]
+            assert c.get_stats()["size_bytes"] == 4
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        with EmbeddingCache(tmp_path / "e.db", max_size_mb=1) as c:
+            vector = [0.0] * 1024  # 4 KB as float32
+            c.put_many(NS, ["old"], [vector])
+            c.put_many(NS, ["recent"], [vector])
+            c.get_many(NS, ["old"])  # Touch so "recent" becomes least recent
+            c.put_many(NS, [f"k{i}" for i in range(300)], [vector] * 300)
+
+            assert c.get_stats()["size_bytes"] <= c.max_bytes
+            assert c.get_many(NS, ["recent"]) == [None]
+
+    def test_clear(self, cache: EmbeddingCache) -> None:
+        cache.put_many(NS, ["a"], [[1.0]])
+        cache.clear()
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestEmbedWithCache:
+    """Tests for cache-aware embedding."""
+
+    def test_only_misses_are_embedded(self, cache: EmbeddingCache) -> None:
+        calls: list[list[str]] = []
+
+        def embed(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[float(len(t))] for t in texts]
+
+        first = embed_with_cache(cache, NS, ["one", "three"], embed)
+        second = embed_with_cache(cache, NS, ["one", "three", "seven", "seven"], embed)
+
+        assert first == [[3.0], [5.0]]
+        assert second == [[3.0], [5.0], [5.0], [5.0]]
+        assert calls == [["one", "three"], ["seven"]]
+
+
+class TestEmbedderIntegration:
+    """Tests for embedders consulting the cache."""
+
+    def test_sentence_transformer_skips_cached(
+        self, cache: EmbeddingCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        encoded: list[str] = []
+
+        def fake_encode(texts: list[str]) -> list[list[float]]:
+            encoded.extend(texts)
+            return [[1.0, 0.0] for _ in texts]
+
+        embedder = SentenceTransformerEmbedder(model_name="fake", cache=cache)
+        monkeypatch.setattr(embedder, "_encode", fake_encode)
+
+        embedder.embed(["unchanged paragraph", "old paragraph"])
+        embedder.embed(["unchanged paragraph", "edited paragraph"])
+
+        assert encoded == ["unchanged paragraph", "old paragraph", "edited paragraph"]
+
+    def test_get_embedder_scopes_cache_to_caller(
+        self, cache: EmbeddingCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(embedder_module, "_embedder", None)
+        model = object()
+
+        indexing = get_embedder(model_name="fake", cache=cache)
+        query = get_embedder(model_name="fake")
+        query._model = model  # type: ignore[assignment]
+
+        assert indexing._cache is cache
+        assert query._cache is None
+        assert get_embedder(model_name="fake") is query
+        # The cached embedder shares the already-loaded model
+        assert indexing.is_loaded()
+        assert indexing._ensure_model() is model
+
+    def test_get_late_chunking_embedder_scopes_cache_to_caller(
+        self, cache: EmbeddingCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from ragd.embedding import late_chunking
+        from ragd.embedding.registry import ModelRegistry
+
+        registry = ModelRegistry()
+        monkeypatch.setattr(late_chunking, "check_late_chunking_available", lambda: (True, ""))
+        monkeypatch.setattr("ragd.embedding.registry.get_model_registry", lambda: registry)
+        model, tokenizer = object(), object()
+
+        indexing = late_chunking.get_late_chunking_embedder(model_name="fake", cache=cache)
+        shared = late_chunking.get_late_chunking_embedder(model_name="fake")
+        shared._model, shared._tokenizer = model, tokenizer
+
+        assert indexing is not shared
+        assert indexing._cache is cache
+        assert shared._cache is None
+        assert late_chunking.get_late_chunking_embedder(model_name="fake") is shared
+        # The cached embedder shares the already-loaded model
+        assert indexing.is_loaded()
+        indexing._ensure_model()
+        assert (indexing._model, indexing._tokenizer) == (model, tokenizer)
+
+    def test_late_chunking_skips_model_for_unchanged_document(
+        self, cache: EmbeddingCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runs: list[str] = []
+
+        def fake_embed(text: str, chunks: list[ChunkBoundary]) -> list[list[float]]:
+            runs.append(text)
+            return [[1.0] for _ in chunks]
+
+        embedder = LateChunkingEmbedder(model_name="fake", cache=cache)
+        monkeypatch.setattr(embedder, "_embed_document_chunks", fake_embed)
+        chunks = [ChunkBoundary(0, 5, "Hello"), ChunkBoundary(6, 11, "world")]
+
+        embedder.embed_document_chunks("Hello world", chunks)
+        embedder.embed_document_chunks("Hello world", chunks)
+        embedder.embed_document_chunks("Hello there", chunks)
+
+        assert runs == ["Hello world", "Hello there"]
+
+
+class TestGetEmbeddingCache:
+    """Tests for the shared cache accessor."""
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        config = RagdConfig()
+        config.storage.data_dir = tmp_path
+        config.cache.embedding_cache = False
+        assert get_embedding_cache(config) is None
+
+    def test_shared_per_data_dir(self, tmp_path: Path) -> None:
+        config = RagdConfig()
+        config.storage.data_dir = tmp_path
+        cache = get_embedding_cache(config)
+        assert cache is not None
+        assert get_embedding_cache(config) is cache
+        assert cache.db_path == tmp_path / "cache" / "embeddings.db"
@@ -380,6 +380,27 @@ class TestEvaluator:
             assert result.metrics.context_precision == 1.0  # 1 relevant of 1
             evaluator.close()
 
+    def test_evaluate_batch_uses_batched_search(self, mock_config):
+        """Batch evaluation retrieves every query in one search_many call."""
+        with patch("ragd.evaluation.evaluator.HybridSearcher") as MockSearcher:
+            mock_result = MagicMock()
+            mock_result.combined_score = 0.8
+            mock_result.document_id = "doc1"
+            searcher = MockSearcher.return_value
+            searcher.search_many.return_value = [[mock_result], []]
+
+            evaluator = Evaluator(config=mock_config)
+            report = evaluator.evaluate_batch(
+                [{"query": "first", "expected_docs": ["doc1"]}, {"query": "second"}]
+            )
+
+            searcher.search_many.assert_called_once()
+            searcher.search.assert_not_called()
+            assert [r.query for r in report.results] == ["first", "second"]
+            assert report.results[0].expected_docs == ["doc1"]
+            assert report.results[1].retrieved_chunks == 0
+            evaluator.close()
+
 
 class TestEvaluationStorage:
     """Tests for EvaluationStorage."""
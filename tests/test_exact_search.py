@@ -0,0 +1,107 @@
+"""Tests for brute-force filtered vector search."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ragd.storage.exact import exact_search
+
+
+@pytest.fixture
+def data() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(3, 16)), rng.normal(size=(200, 16))
+
+
+@pytest.mark.parametrize("metric", ["cosine", "l2"])
+def test_matches_full_sort(data, metric: str) -> None:
+    """Partial selection returns the same neighbours as a full sort."""
+    queries, vectors = data
+    distances, positions = exact_search(queries, vectors, limit=10, metric=metric)
+
+    if metric == "cosine":
+        unit_q = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        unit_v = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        full = 1.0 - unit_q @ unit_v.T
+    else:
+        full = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2)
+
+    expected = np.argsort(full, axis=1)[:, :10]
+    np.testing.assert_array_equal(positions, expected)
+    np.testing.assert_allclose(
+        distances, np.take_along_axis(full, expected, axis=1), rtol=1e-4, atol=1e-4
+    )
+
+
+def test_limit_larger_than_candidates(data) -> None:
+    """All candidates are returned, sorted, when fewer than the limit."""
+    queries, vectors = data
+    distances, positions = exact_search(queries, vectors[:4], limit=10)
+
+    assert positions.shape == (3, 4)
+    assert np.all(np.diff(distances, axis=1) >= 0)
+
+
+def test_no_candidates(data) -> None:
+    queries, _ = data
+    distances, positions = exact_search(queries, np.empty((0, 16)), limit=5)
+    assert distances.shape == positions.shape == (3, 0)
+
+
+class _FakeCollection:
+    """Collection stand-in recording what each ``get`` call includes."""
+
+    def __init__(self, vectors: np.ndarray, matching: int) -> None:
+        self.ids = [f"c{i}" for i in range(len(vectors))]
+        self.vectors = dict(zip(self.ids, vectors.tolist(), strict=True))
+        self.matching = matching
+        self.calls: list[tuple[list[str], int]] = []
+
+    def get(self, ids=None, where=None, limit=None, include=()):
+        if ids is None:
+            assert where is not None
+            ids = self.ids[: min(self.matching, limit)]
+        self.calls.append((list(include), len(ids)))
+        return {
+            "ids": ids,
+            "embeddings": [self.vectors[i] for i in ids] if "embeddings" in include else None,
+            "documents": [f"text {i}" for i in ids] if "documents" in include else None,
+            "metadatas": [{"id": i} for i in ids] if "metadatas" in include else None,
+        }
+
+
+def _adapter(collection: _FakeCollection, threshold: int):
+    from ragd.storage.adapters.chromadb import ChromaDBAdapter
+
+    adapter = ChromaDBAdapter.__new__(ChromaDBAdapter)
+    adapter._collection = collection
+    adapter._exact_scan_threshold = threshold
+    return adapter
+
+
+def test_chroma_probe_fetches_ids_only_for_broad_filters(data) -> None:
+    """A broad filter is detected without fetching vectors or documents."""
+    queries, vectors = data
+    collection = _FakeCollection(vectors, matching=200)
+
+    assert _adapter(collection, threshold=50)._exact_search(queries, 5, {"a": 1}) is None
+    assert collection.calls == [([], 51)]
+
+
+def test_chroma_exact_search_fetches_documents_for_hits_only(data) -> None:
+    """Selective filters load embeddings for candidates and text for hits."""
+    queries, vectors = data
+    collection = _FakeCollection(vectors, matching=40)
+
+    results = _adapter(collection, threshold=50)._exact_search(queries, 5, {"a": 1})
+
+    _, expected = exact_search(queries, vectors[:40], limit=5)
+    assert [[r.id for r in row] for row in results] == [
+        [f"c{pos}" for pos in row] for row in expected
+    ]
+    assert results[0][0].content == f"text {results[0][0].id}"
+    assert results[0][0].metadata == {"id": results[0][0].id}
+    include = [call[0] for call in collection.calls]
+    assert include == [[], ["embeddings"], ["documents", "metadatas"]]
+    assert collection.calls[2][1] <= 15
@@ -0,0 +1,313 @@
+"""Tests for FAISS adapter deletion, compaction and filtered search."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from ragd.storage.adapters.faiss import FAISSAdapter  # noqa: E402
+
+DIM = 8
+
+
+@pytest.fixture
+def vectors() -> np.ndarray:
+    return np.random.default_rng(0).normal(size=(40, DIM)).astype(np.float32)
+
+
+def _fill(adapter: FAISSAdapter, vectors: np.ndarray) -> None:
+    n = len(vectors)
+    adapter.add(
+        [f"c{i}" for i in range(n)],
+        vectors.tolist(),
+        [f"text {i}" for i in range(n)],
+        [{"document_id": f"d{i % 4}"} for i in range(n)],
+    )
+
+
+def test_delete_removes_vectors(tmp_path: Path, vectors: np.ndarray) -> None:
+    """ID-mapped indexes drop deleted vectors immediately."""
+    adapter = FAISSAdapter(tmp_path, dimension=DIM)
+    _fill(adapter, vectors)
+    adapter.delete(["c0", "c1"])
+
+    assert adapter._index.ntotal == 38
+    assert adapter.tombstone_count == 0
+    assert "c0" not in [r.id for r in adapter.search(vectors[0].tolist(), limit=5)]
+
+
+def test_re_add_replaces_vector(tmp_path: Path, vectors: np.ndarray) -> None:
+    adapter = FAISSAdapter(tmp_path, dimension=DIM)
+    _fill(adapter, vectors)
+    adapter.add(["c0"], [vectors[1].tolist()], ["new"], [{"document_id": "d0"}])
+
+    assert adapter._index.ntotal == 40
+    assert [r.id for r in adapter.search(vectors[0].tolist(), limit=1)] != ["c0"]
+
+
+def test_tombstones_are_over_fetched(tmp_path: Path, vectors: np.ndarray) -> None:
+    """Indexes without removal still return full top-k lists."""
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, index_type="HNSW")
+    _fill(adapter, vectors)
+    nearest = [r.id for r in adapter.search(vectors[0].tolist(), limit=6)]
+    adapter.delete(nearest[:3])
+
+    results = adapter.search(vectors[0].tolist(), limit=3)
+
+    assert adapter.tombstone_count == 3
+    assert [r.id for r in results] == nearest[3:]
+
+
+def test_persist_compacts_past_threshold(tmp_path: Path, vectors: np.ndarray) -> None:
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, index_type="HNSW", compact_threshold=0.1)
+    _fill(adapter, vectors)
+    adapter.delete([f"c{i}" for i in range(5)])
+    adapter.persist()
+
+    assert adapter.tombstone_count == 0
+    assert adapter._index.ntotal == 35
+    assert [r.id for r in adapter.search(vectors[7].tolist(), limit=1)] == ["c7"]
+
+
+def test_compact_converts_positional_index(tmp_path: Path, vectors: np.ndarray) -> None:
+    """Indexes created before ID maps are rebuilt with stable IDs."""
+    adapter = FAISSAdapter(tmp_path, dimension=DIM)
+    adapter._index = faiss.IndexFlatL2(DIM)
+    _fill(adapter, vectors)
+    adapter.delete(["c0", "c1"])
+
+    assert adapter.tombstone_count == 2
+    assert adapter.compact() == 2
+    assert hasattr(adapter._index, "id_map")
+    assert [r.id for r in adapter.search(vectors[9].tolist(), limit=1)] == ["c9"]
+
+    adapter.close()
+    reopened = FAISSAdapter(tmp_path, dimension=DIM)
+    assert reopened._index.ntotal == 38
+    assert [r.id for r in reopened.search(vectors[9].tolist(), limit=1)] == ["c9"]
+
+
+@pytest.mark.parametrize("index_type", ["IVFFlat", "IVFPQ"])
+def test_compact_ivf_keeps_stored_codes(tmp_path: Path, index_type: str) -> None:
+    """IVF compaction copies codes instead of retraining and re-encoding."""
+    vectors = np.random.default_rng(5).normal(size=(600, DIM)).astype(np.float32)
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, index_type=index_type, nlist=16)
+    _fill(adapter, vectors)
+    live = np.array([adapter._id_to_faiss[f"c{i}"] for i in range(10, 600)])
+    before = adapter._reconstruct(live)
+    centroids = faiss.try_extract_index_ivf(adapter._index).quantizer.reconstruct_n(0, 16)
+
+    adapter.delete([f"c{i}" for i in range(10)])
+    assert adapter.tombstone_count == 10
+    assert adapter.compact() == 10
+
+    ivf = faiss.try_extract_index_ivf(adapter._index)
+    assert adapter._index.ntotal == ivf.ntotal == 590
+    np.testing.assert_array_equal(ivf.quantizer.reconstruct_n(0, 16), centroids)
+    np.testing.assert_array_equal(adapter._reconstruct(live), before)
+
+    adapter.add(["new"], [vectors[0].tolist()], ["new"], [{"document_id": "d0"}])
+    assert "new" in [r.id for r in adapter.search(vectors[0].tolist(), limit=3)]
+    adapter.close()
+
+    reopened = FAISSAdapter(tmp_path, dimension=DIM)
+    np.testing.assert_array_equal(reopened._reconstruct(live), before)
+    assert "c42" in [r.id for r in reopened.search(vectors[42].tolist(), limit=3)]
+
+
+def test_search_hydrates_in_one_query(tmp_path: Path, vectors: np.ndarray) -> None:
+    adapter = FAISSAdapter(tmp_path, dimension=DIM)
+    _fill(adapter, vectors)
+    calls = []
+    original = adapter._metadata.get_batch
+
+    def counting(ids: list[int]) -> list:
+        calls.append(ids)
+        return original(ids)
+
+    adapter._metadata.get_batch = counting  # type: ignore[method-assign]
+    results = adapter.search(vectors[3].tolist(), limit=10)
+
+    assert len(calls) == 1
+    assert len(results) == 10
+    assert results[0].id == "c3"
+
+
+def test_metadata_cache_invalidated_by_delete(tmp_path: Path, vectors: np.ndarray) -> None:
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, metadata_cache_size=16)
+    _fill(adapter, vectors)
+    adapter.search(vectors[0].tolist(), limit=5)
+    assert len(adapter._metadata._cache) == 5
+
+    adapter.delete(["c0"])
+
+    assert len(adapter._metadata._cache) == 0
+    assert adapter._metadata.get_batch([0, 1])[0] is None
+    assert [r and r.id for r in adapter.get(["c1", "c0"])] == ["c1", None]
+
+
+def test_metadata_read_racing_a_write_is_not_cached(
+    tmp_path: Path, vectors: np.ndarray
+) -> None:
+    """Records read before a write invalidates the cache are not cached."""
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, metadata_cache_size=16)
+    _fill(adapter, vectors)
+    store = adapter._metadata
+    decode = store._row_to_record
+
+    def delete_while_reading(row):
+        store._row_to_record = decode  # type: ignore[method-assign]
+        store.delete(["c0"])
+        return decode(row)
+
+    store._row_to_record = delete_while_reading  # type: ignore[method-assign]
+    assert store.get_batch([0])[0]["chunk_id"] == "c0"
+
+    assert len(store._cache) == 0
+    assert store.get_batch([0]) == [None]
+
+
+def _filtered_truth(vectors: np.ndarray, query: np.ndarray, doc: int, k: int) -> list[str]:
+    ids = [i for i in range(len(vectors)) if i % 4 == doc]
+    dist = ((vectors[ids] - query) ** 2).sum(axis=1)
+    return [f"c{ids[i]}" for i in np.argsort(dist)[:k]]
+
+
+@pytest.mark.parametrize("index_type", ["Flat", "HNSW"])
+@pytest.mark.parametrize("exact_max", [0, 8192])
+def test_filtered_search_is_complete(
+    tmp_path: Path, index_type: str, exact_max: int
+) -> None:
+    """Both the exact and the selector path return the true top-k."""
+    vectors = np.random.default_rng(1).normal(size=(400, DIM)).astype(np.float32)
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, index_type=index_type)
+    adapter.EXACT_FILTER_MAX = exact_max
+    _fill(adapter, vectors)
+
+    results = adapter.search(vectors[5].tolist(), limit=5, where={"document_id": "d1"})
+
+    assert [r.id for r in results] == _filtered_truth(vectors, vectors[5], 1, 5)
+    assert results[0].raw_distance == pytest.approx(0.0, abs=1e-4)
+
+
+def test_filtered_search_tolerates_unpersisted_vectors(
+    tmp_path: Path, vectors: np.ndarray
+) -> None:
+    """Metadata rows whose vectors never reached the saved index are skipped."""
+    adapter = FAISSAdapter(tmp_path, dimension=DIM)
+    _fill(adapter, vectors[:5])
+    adapter.persist()
+    adapter.add(["c5"], [vectors[5].tolist()], ["text 5"], [{"document_id": "d1"}])
+
+    # Reopen without persisting, as after a crash
+    reopened = FAISSAdapter(tmp_path, dimension=DIM)
+    results = reopened.search(vectors[1].tolist(), limit=5, where={"document_id": "d1"})
+
+    assert [r.id for r in results] == ["c1"]
+
+
+def test_filtered_search_widens_ivf_probe(tmp_path: Path) -> None:
+    """ID-mapped IVF indexes probe enough lists for selective filters."""
+    vectors = np.random.default_rng(2).normal(size=(800, DIM)).astype(np.float32)
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, index_type="IVFFlat", nlist=16, nprobe=1)
+    adapter.EXACT_FILTER_MAX = 0
+    _fill(adapter, vectors)
+
+    results = adapter.search(vectors[3].tolist(), limit=5, where={"document_id": "d3"})
+
+    assert [r.id for r in results] == _filtered_truth(vectors, vectors[3], 3, 5)
+
+
+def _small_thresholds(adapter: FAISSAdapter) -> FAISSAdapter:
+    adapter.FLAT_THRESHOLD = 300
+    adapter.IVFFLAT_THRESHOLD = 100_000
+    return adapter
+
+
+def test_grows_into_ivf_and_tunes_nprobe(tmp_path: Path) -> None:
+    vectors = np.random.default_rng(3).normal(size=(600, DIM)).astype(np.float32)
+    adapter = _small_thresholds(FAISSAdapter(tmp_path, dimension=DIM, nprobe=1))
+    _fill(adapter, vectors[:200])
+    assert adapter._migration is None
+
+    _fill(adapter, vectors)
+    adapter.close()
+
+    assert adapter._index_type_of(adapter._index) == "IVFFlat"
+    assert adapter._nprobe > 1
+    reopened = FAISSAdapter(tmp_path, dimension=DIM)
+    assert reopened._index_type_of(reopened._index) == "IVFFlat"
+    assert reopened._nprobe == adapter._nprobe
+    assert [r.id for r in reopened.search(vectors[42].tolist(), limit=1)] == ["c42"]
+
+
+def test_writes_during_rebuild_are_replayed(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    vectors = np.random.default_rng(4).normal(size=(400, DIM)).astype(np.float32)
+    adapter = _small_thresholds(FAISSAdapter(tmp_path, dimension=DIM))
+    release = threading.Event()
+    build = adapter._build_index
+
+    def blocked_build(*args, **kwargs):
+        release.wait(5)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(adapter, "_build_index", blocked_build)
+    _fill(adapter, vectors[:350])
+    assert adapter._migration is not None
+
+    adapter.add(["late"], [vectors[399].tolist()], ["late"], [{"document_id": "d9"}])
+    adapter.delete(["c7"])
+    assert adapter._index_type_of(adapter._index) == "Flat"
+
+    release.set()
+    adapter._finish_migration(wait=True)
+
+    assert adapter._index_type_of(adapter._index) == "IVFFlat"
+    assert adapter.tombstone_count == 1
+    assert [r.id for r in adapter.search(vectors[399].tolist(), limit=1)] == ["late"]
+    assert "c7" not in [r.id for r in adapter.search(vectors[7].tolist(), limit=5)]
+    assert [r.id for r in adapter.search(vectors[8].tolist(), limit=1)] == ["c8"]
+
+
+def test_tuning_measures_recall_on_original_vectors(tmp_path: Path, monkeypatch) -> None:
+    """Rebuilding into IVFPQ tunes against the stored, uncompressed vectors."""
+    from ragd.storage.adapters import faiss as faiss_module
+
+    vectors = np.random.default_rng(6).normal(size=(600, DIM)).astype(np.float32)
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, nlist=16)
+    _fill(adapter, vectors)
+    seen = []
+    tune = faiss_module.tune_search_effort
+
+    def spy(index, tuned_vectors, *args, **kwargs):
+        seen.append(tuned_vectors)
+        return tune(index, tuned_vectors, *args, **kwargs)
+
+    monkeypatch.setattr(faiss_module, "tune_search_effort", spy)
+
+    assert adapter.rebuild_index("IVFPQ") == "IVFPQ"
+    np.testing.assert_array_equal(seen[0], vectors)
+
+
+def test_does_not_migrate_out_of_pq(tmp_path: Path) -> None:
+    """PQ codes are never decoded into the training data of a new index."""
+    vectors = np.random.default_rng(7).normal(size=(700, DIM)).astype(np.float32)
+    adapter = FAISSAdapter(tmp_path, dimension=DIM, nlist=16)
+    _fill(adapter, vectors[:600])
+    adapter.rebuild_index("IVFPQ")
+    adapter.FLAT_THRESHOLD = 10
+    adapter.IVFFLAT_THRESHOLD = 20
+    adapter.IVFPQ_THRESHOLD = 30
+
+    _fill(adapter, vectors)
+
+    assert adapter._migration is None
+    assert adapter._index_type_of(adapter._index) == "IVFPQ"
+    with pytest.raises(ValueError, match="compressed"):
+        adapter.rebuild_index("HNSW")
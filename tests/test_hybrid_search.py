@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from ragd.search.bm25 import BM25Index, BM25Result
+from ragd.search.bm25 import BM25Index, BM25Result, BM25TimeoutError
 from ragd.search.hybrid import (
     HybridSearchResult,
     SearchMode,
@@ -209,6 +209,56 @@ def test_rrf_k_parameter() -> None:
     assert score_diff_k1 > score_diff_k60
 
 
+class TestFuseRankings:
+    """Tests for the fusion engine."""
+
+    def test_rrf_matches_reference(self) -> None:
+        """Unweighted RRF reproduces the textbook formula and tie order."""
+        from ragd.search.fusion import fuse_rankings
+
+        semantic = [(f"c{i}", 1.0) for i in range(50)]
+        keyword = [(f"c{i}", 1.0) for i in range(25, 90)]
+
+        expected: dict[str, float] = {}
+        for ranking in (semantic, keyword):
+            for rank, (item_id, _) in enumerate(ranking, start=1):
+                expected[item_id] = expected.get(item_id, 0.0) + 1.0 / (60 + rank)
+        reference = sorted(expected.items(), key=lambda x: x[1], reverse=True)
+
+        assert fuse_rankings([semantic, keyword]) == pytest.approx(reference)
+        assert [i for i, _ in fuse_rankings([semantic, keyword])] == [i for i, _ in reference]
+
+    def test_weights_are_honoured(self) -> None:
+        """The heavier leg's top item wins under weighted RRF."""
+        from ragd.search.fusion import fuse_rankings
+
+        semantic = [("a", 0.9), ("b", 0.8)]
+        keyword = [("b", 9.0), ("a", 1.0)]
+
+        assert fuse_rankings([semantic, keyword], weights=[0.7, 0.3])[0][0] == "a"
+        assert fuse_rankings([semantic, keyword], weights=[0.3, 0.7])[0][0] == "b"
+
+    def test_combsum_and_combmnz(self) -> None:
+        """Score-based fusion normalises each leg before combining."""
+        from ragd.search.fusion import FusionMethod, fuse_rankings
+
+        semantic = [("a", 0.9), ("b", 0.5), ("c", 0.1)]
+        keyword = [("c", 20.0), ("b", 15.0)]
+
+        combsum = dict(fuse_rankings([semantic, keyword], method=FusionMethod.COMBSUM))
+        combmnz = dict(fuse_rankings([semantic, keyword], method=FusionMethod.COMBMNZ))
+
+        assert combsum == pytest.approx({"a": 1.0, "b": 0.5, "c": 1.0})
+        assert combmnz == pytest.approx({"a": 1.0, "b": 1.0, "c": 2.0})
+
+    def test_hybrid_search_uses_configured_method(self, make_searcher) -> None:
+        """search_tuning.fusion_method selects the fusion engine."""
+        searcher = make_searcher(fusion_method="combmnz")
+        results = searcher.search("machine learning", limit=5)
+        # One hit per leg: normalised to 1.0, scaled by the 0.7/0.3 weights
+        assert sorted(r.rrf_score for r in results) == pytest.approx([0.6, 1.4])
+
+
 # =============================================================================
 # Search Mode Tests
 # =============================================================================
@@ -496,3 +546,660 @@ class TestBM25BooleanOperators:
             # Both should find both documents (OR matches either)
             assert len(results1) >= 2
             assert len(results2) >= 2
+
+
+class TestBM25Schema:
+    """Tests for the indexed external-content schema."""
+
+    def test_deleted_chunks_leave_fts_index(self, temp_db: Path) -> None:
+        """Deleting a document removes its terms from the FTS index."""
+        with BM25Index(temp_db) as index:
+            index.add_chunks("doc1", [("doc1_chunk_0", "zebra crossing")])
+            index.add_chunks("doc2", [("doc2_chunk_0", "zebra stripes")])
+            index.delete_document("doc1")
+
+            assert [r.chunk_id for r in index.search("zebra")] == ["doc2_chunk_0"]
+            assert [r.chunk_id for r in index.search("crossing")] == []
+
+    def test_document_filter_uses_index(self, temp_db: Path) -> None:
+        """Per-document filters and deletes are index lookups."""
+        with BM25Index(temp_db) as index:
+            plans = [
+                " ".join(row[3] for row in index._conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+                for sql in (
+                    "DELETE FROM chunks WHERE document_id = 'doc1'",
+                    "SELECT c.chunk_id FROM chunks_fts "
+                    "JOIN chunks c ON c.id = chunks_fts.rowid "
+                    "WHERE chunks_fts MATCH 'x' AND c.document_id IN ('doc1')",
+                )
+            ]
+
+        assert all("idx_chunks_document" in plan for plan in plans)
+
+    def test_migrates_legacy_index(self, temp_db: Path) -> None:
+        """A self-contained FTS5 index is converted in place."""
+        import sqlite3
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute(
+            "CREATE VIRTUAL TABLE chunks_fts USING fts5("
+            "content, chunk_id UNINDEXED, document_id UNINDEXED, "
+            "tokenize='porter unicode61')"
+        )
+        conn.execute(
+            "CREATE TABLE indexed_documents (document_id TEXT PRIMARY KEY, indexed_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO chunks_fts VALUES (?, ?, ?)",
+            [("machine learning", "doc1_chunk_0", "doc1"), ("deep learning", "doc2_chunk_0", "doc2")],
+        )
+        conn.execute("INSERT INTO indexed_documents VALUES ('doc1', ''), ('doc2', '')")
+        conn.commit()
+        conn.close()
+
+        with BM25Index(temp_db) as index:
+            assert index.get_stats() == {"document_count": 2, "chunk_count": 2}
+            results = index.search("learning", document_ids=["doc2"])
+            assert [(r.chunk_id, r.document_id) for r in results] == [("doc2_chunk_0", "doc2")]
+            index.delete_document("doc1")
+            assert [r.chunk_id for r in index.search("learning")] == ["doc2_chunk_0"]
+
+        # Reopening does not migrate again
+        with BM25Index(temp_db) as index:
+            assert index.get_stats()["chunk_count"] == 1
+
+    def test_migration_indexes_rows_once(self, temp_db: Path) -> None:
+        """Sync triggers are created only after the copy and rebuild."""
+        import sqlite3
+        from unittest.mock import patch
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute(
+            "CREATE VIRTUAL TABLE chunks_fts USING fts5("
+            "content, chunk_id UNINDEXED, document_id UNINDEXED, "
+            "tokenize='porter unicode61')"
+        )
+        conn.execute("INSERT INTO chunks_fts VALUES ('machine learning', 'doc1_chunk_0', 'doc1')")
+        conn.commit()
+        conn.close()
+
+        copied: list[int] = []
+        original = BM25Index._create_triggers
+
+        def create_triggers(index: BM25Index, cursor: sqlite3.Cursor) -> None:
+            copied.append(cursor.execute("SELECT COUNT(*) FROM chunks").fetchone()[0])
+            original(index, cursor)
+
+        with (
+            patch.object(BM25Index, "_create_triggers", create_triggers),
+            BM25Index(temp_db) as index,
+        ):
+            assert [r.chunk_id for r in index.search("learning")] == ["doc1_chunk_0"]
+
+        assert copied == [1]
+
+
+class TestBM25BulkLoad:
+    """Tests for the bulk-ingest mode."""
+
+    def test_batches_commits(self, temp_db: Path) -> None:
+        """Documents become visible to other connections per batch."""
+        import sqlite3
+
+        def committed() -> int:
+            conn = sqlite3.connect(temp_db)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            finally:
+                conn.close()
+
+        with BM25Index(temp_db) as index:
+            with index.bulk_load(batch_documents=2):
+                index.add_chunks("doc1", [("doc1_chunk_0", "alpha")])
+                assert committed() == 0
+                index.add_chunks("doc2", [("doc2_chunk_0", "beta")])
+                assert committed() == 2
+                index.add_chunks("doc3", [("doc3_chunk_0", "gamma")])
+            assert committed() == 3
+            assert [r.chunk_id for r in index.search("gamma")] == ["doc3_chunk_0"]
+
+    def test_restores_settings(self, temp_db: Path) -> None:
+        """Journal mode and merge settings return to their previous values."""
+        with BM25Index(temp_db) as index:
+            with index.bulk_load():
+                assert index._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+                index.add_chunks("doc1", [("doc1_chunk_0", "alpha")])
+
+            conn = index._conn
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            config = dict(conn.execute("SELECT k, v FROM chunks_fts_config").fetchall())
+            assert config["automerge"] == BM25Index.DEFAULT_AUTOMERGE
+            assert config["crisismerge"] == BM25Index.DEFAULT_CRISISMERGE
+
+    def test_nested_load_does_not_block_searches(self, temp_db: Path) -> None:
+        """A nested bulk load does not hold the index lock while open."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with BM25Index(temp_db) as index:
+            index.add_chunks("doc1", [("doc1_chunk_0", "alpha")])
+            with (
+                index.bulk_load(),
+                index.bulk_load(),
+                ThreadPoolExecutor(max_workers=1) as pool,
+            ):
+                results = pool.submit(index.search, "alpha").result(timeout=5)
+
+        assert [r.chunk_id for r in results] == ["doc1_chunk_0"]
+
+
+# =============================================================================
+# Concurrent Retrieval Tests
+# =============================================================================
+
+
+class _SlowVectorStore:
+    """Vector store stand-in that returns one fixed result."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    def search_many(self, query_embeddings, limit, where=None):
+        self.batches = getattr(self, "batches", 0) + 1
+        return [self.search(e, limit, where) for e in query_embeddings]
+
+    def search(self, *_args, **_kwargs):
+        import time
+
+        time.sleep(self.delay)
+        return [
+            {
+                "id": "doc1_chunk_0",
+                "score": 0.9,
+                "content": "Machine learning basics.",
+                "metadata": {"document_id": "doc1", "filename": "ml.txt"},
+            }
+        ]
+
+
+class _FakeEmbedder:
+    """Embedder stand-in returning a constant vector."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def embed_single(self, _text: str) -> list[float]:
+        return [0.0, 1.0]
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return [[0.0, 1.0] for _ in texts]
+
+
+@pytest.fixture
+def make_searcher(temp_db: Path):
+    """Build a HybridSearcher over a fake vector store and a real BM25 index."""
+    from unittest.mock import patch
+
+    from ragd.config import RagdConfig
+    from ragd.search.hybrid import HybridSearcher
+
+    searchers = []
+
+    def _make(delay: float = 0.0, **tuning) -> HybridSearcher:
+        config = RagdConfig()
+        config.storage.data_dir = temp_db.parent
+        config.chroma_path.mkdir(exist_ok=True)
+        for key, value in tuning.items():
+            setattr(config.search_tuning, key, value)
+        bm25 = BM25Index(temp_db)
+        bm25.add_chunks("doc2", [("doc2_chunk_0", "Machine learning in practice.")])
+        with patch("ragd.search.hybrid.get_embedder", return_value=_FakeEmbedder()):
+            searcher = HybridSearcher(
+                config=config,
+                bm25_index=bm25,
+                vector_store=_SlowVectorStore(delay),
+            )
+        searchers.append(searcher)
+        return searcher
+
+    yield _make
+    for searcher in searchers:
+        searcher.close()
+
+    # Let timed-out legs finish so they do not count against later tests
+    import time
+
+    from ragd.search import hybrid as hybrid_module
+
+    deadline = time.monotonic() + 5
+    while hybrid_module._abandoned_legs and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestConcurrentRetrieval:
+    """Tests for concurrent semantic and keyword legs."""
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_both_legs_fused(self, make_searcher, parallel: bool) -> None:
+        """Results from both legs are fused with per-leg timings attached."""
+        searcher = make_searcher(parallel_retrieval=parallel)
+        results = searcher.search("machine learning", limit=5)
+
+        assert {r.chunk_id for r in results} == {"doc1_chunk_0", "doc2_chunk_0"}
+        timings = results[0].metadata["retrieval_timings"]
+        assert timings["semantic_ms"] >= 0
+        assert timings["keyword_ms"] >= 0
+        assert not timings["semantic_timed_out"]
+        assert not timings["keyword_timed_out"]
+
+    def test_slow_semantic_leg_falls_back_to_keyword(self, make_searcher) -> None:
+        """A semantic leg exceeding its timeout is dropped."""
+        searcher = make_searcher(delay=0.5, semantic_timeout_ms=50)
+        results = searcher.search("machine learning", limit=5)
+
+        assert [r.chunk_id for r in results] == ["doc2_chunk_0"]
+        assert results[0].metadata["retrieval_timings"]["semantic_timed_out"]
+
+    def test_timed_out_legs_do_not_fill_the_pool(
+        self, make_searcher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Searches skip the semantic leg while timed-out legs hold its threads."""
+        import time
+        from unittest.mock import patch
+
+        from ragd.search import hybrid as hybrid_module
+
+        monkeypatch.setattr(hybrid_module, "_MAX_ABANDONED_LEGS", 1)
+        searcher = make_searcher(delay=0.3, semantic_timeout_ms=20)
+        store = searcher._vector_store
+        with patch.object(store, "search", wraps=store.search) as vector_search:
+            searcher.search("machine learning", limit=5)
+            results = searcher.search("machine learning", limit=5)
+            assert vector_search.call_count == 1
+            assert [r.chunk_id for r in results] == ["doc2_chunk_0"]
+            assert results[0].metadata["retrieval_timings"]["semantic_timed_out"]
+
+            # Once the stuck leg finishes, the semantic leg runs again
+            time.sleep(0.4)
+            searcher.search("deep learning", limit=5)
+            assert vector_search.call_count == 2
+
+    def test_interrupted_keyword_leg_falls_back_to_semantic(self, make_searcher) -> None:
+        """An interrupted keyword leg contributes no results."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        searcher = make_searcher(keyword_timeout_ms=10)
+        # Hold the index so the deadline passes before the query runs
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with searcher._bm25._lock:
+                pending = pool.submit(searcher.search, "machine learning", 5)
+                time.sleep(0.1)
+            results = pending.result()
+
+        assert [r.chunk_id for r in results] == ["doc1_chunk_0"]
+        assert results[0].metadata["retrieval_timings"]["keyword_timed_out"]
+
+    def test_keyword_deadline_does_not_abort_other_searches(self, make_searcher) -> None:
+        """An expired deadline only aborts its own query."""
+        import time
+
+        searcher = make_searcher()
+        with pytest.raises(BM25TimeoutError):
+            searcher._bm25.search("machine", deadline=time.monotonic() - 1)
+
+        results = searcher._bm25.search("machine")
+        assert [r.chunk_id for r in results] == ["doc2_chunk_0"]
+
+    def test_keyword_deadline_aborts_running_statement(
+        self, make_searcher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The deadline is enforced while the statement runs, then removed."""
+        from types import SimpleNamespace
+
+        from ragd.search import bm25 as bm25_module
+
+        searcher = make_searcher()
+        clock = iter([0.0])
+        monkeypatch.setattr(bm25_module, "_PROGRESS_STEPS", 1)
+        monkeypatch.setattr(
+            bm25_module, "time", SimpleNamespace(monotonic=lambda: next(clock, 10.0))
+        )
+        with pytest.raises(BM25TimeoutError):
+            searcher._bm25.search("machine", deadline=5.0)
+
+        monkeypatch.undo()
+        assert [r.chunk_id for r in searcher._bm25.search("machine")] == ["doc2_chunk_0"]
+
+    def test_keyword_errors_propagate_without_timeout(self, make_searcher) -> None:
+        """Database errors are not mistaken for timeouts."""
+        import sqlite3
+        from unittest.mock import patch
+
+        searcher = make_searcher()
+        with (
+            patch.object(searcher._bm25, "search", side_effect=sqlite3.OperationalError("boom")),
+            pytest.raises(sqlite3.OperationalError),
+        ):
+            searcher.search("machine learning", limit=5)
+
+
+class TestDocumentScope:
+    """Tests for restricting searches to a set of documents."""
+
+    def _search(self, searcher, document_ids: list[str]):
+        from unittest.mock import patch
+
+        with (
+            patch.object(
+                searcher._vector_store, "search", wraps=searcher._vector_store.search
+            ) as vector_search,
+            patch.object(searcher._bm25, "search", wraps=searcher._bm25.search) as bm25_search,
+        ):
+            results = searcher.search("machine learning", limit=5, document_ids=document_ids)
+        return (
+            results,
+            vector_search.call_args.kwargs["where"],
+            bm25_search.call_args.kwargs["document_ids"],
+        )
+
+    def test_small_scope_is_pushed_down(self, make_searcher) -> None:
+        """Both legs are restricted to the scope."""
+        results, where, keyword_ids = self._search(make_searcher(), ["doc2"])
+
+        assert where == {"document_id": {"$in": ["doc2"]}}
+        assert keyword_ids == ["doc2"]
+        assert results
+
+    def test_large_scope_is_post_filtered(
+        self, make_searcher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Scopes too large to bind are applied to the results instead."""
+        from ragd.search import hybrid as hybrid_module
+
+        monkeypatch.setattr(hybrid_module, "_SCOPE_PUSHDOWN_MAX", 2)
+        results, where, keyword_ids = self._search(make_searcher(), ["doc2", "x", "y"])
+
+        assert where is None
+        assert keyword_ids is None
+        assert [r.chunk_id for r in results] == ["doc2_chunk_0"]
+
+
+class TestSearchMany:
+    """Tests for the batch query API."""
+
+    def test_batches_embedding_and_vector_search(self, make_searcher) -> None:
+        """All queries share one embed call and one vector store call."""
+        searcher = make_searcher()
+        results = searcher.search_many(["machine learning", "   ", "practice"], limit=5)
+
+        assert len(results) == 3
+        assert {r.chunk_id for r in results[0]} == {"doc1_chunk_0", "doc2_chunk_0"}
+        assert results[1] == []
+        assert {r.chunk_id for r in results[2]} == {"doc1_chunk_0", "doc2_chunk_0"}
+        assert searcher._embedder.batches == [["machine learning", "practice"]]
+        assert searcher._vector_store.batches == 1
+
+    def test_matches_single_search(self, make_searcher) -> None:
+        """Batched results equal per-query results."""
+        searcher = make_searcher()
+        queries = ["machine learning", "practice"]
+        batched = searcher.search_many(queries, limit=5)
+        single = [searcher.search(q, limit=5) for q in queries]
+
+        for many, one in zip(batched, single, strict=True):
+            assert [(r.chunk_id, r.rrf_score) for r in many] == [
+                (r.chunk_id, r.rrf_score) for r in one
+            ]
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [("semantic", {"doc1_chunk_0"}), ("keyword", {"doc2_chunk_0"})],
+    )
+    def test_single_leg_modes(self, make_searcher, mode: str, expected: set[str]) -> None:
+        """Semantic and keyword modes use only their own leg."""
+        searcher = make_searcher()
+        results = searcher.search_many(["machine learning", "practice"], mode=SearchMode(mode))
+        assert all({r.chunk_id for r in rs} == expected for rs in results)
+
+
+class TestQueryCache:
+    """Tests for in-memory query embedding and result caches."""
+
+    def test_lru_evicts_least_recent(self) -> None:
+        from ragd.search.cache import LRUCache
+
+        cache: LRUCache[int] = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_lru_drops_stale_generation(self) -> None:
+        from ragd.search.cache import LRUCache
+
+        cache: LRUCache[int] = LRUCache()
+        cache.put("a", 1, generation=1)
+        assert cache.get("a", generation=2) is None
+        assert len(cache) == 0
+
+    def test_repeat_search_served_from_cache(self, make_searcher) -> None:
+        """A repeated query does not touch the vector store or embedder."""
+        from unittest.mock import patch
+
+        searcher = make_searcher()
+        first = searcher.search("machine learning", limit=5)
+        first[0].metadata["mutated"] = True
+
+        with (
+            patch.object(searcher._vector_store, "search") as vector_search,
+            patch.object(searcher._bm25, "search") as bm25_search,
+        ):
+            second = searcher.search("machine learning", limit=5)
+
+        vector_search.assert_not_called()
+        bm25_search.assert_not_called()
+        assert [r.chunk_id for r in second] == [r.chunk_id for r in first]
+        assert "mutated" not in second[0].metadata
+
+    def test_different_parameters_miss(self, make_searcher) -> None:
+        """Mode, limit and filters are part of the cache key."""
+        searcher = make_searcher()
+        searcher.search("machine learning", limit=5)
+        searcher.search("machine learning", limit=3)
+        searcher.search("machine learning", limit=5, mode=SearchMode.KEYWORD)
+        searcher.search("machine learning", limit=5, filters={"tag": "x"})
+
+        assert searcher._result_cache.get_stats()["hits"] == 0
+        assert len(searcher._result_cache) == 4
+
+    def test_index_write_invalidates_results(self, make_searcher) -> None:
+        """Results cached before a write are recomputed afterwards."""
+        from ragd.storage.generation import bump_generation
+
+        searcher = make_searcher()
+        searcher.search("machine learning", limit=5)
+        bump_generation(searcher.config.chroma_path)
+        searcher.search("machine learning", limit=5)
+
+        assert searcher._result_cache.get_stats()["hits"] == 0
+
+    def test_query_embeddings_reused(self, make_searcher) -> None:
+        """Batch searches only embed queries not seen before."""
+        searcher = make_searcher()
+        searcher.search("machine learning", limit=5)
+        searcher.search_many(["machine learning", "practice", "deep nets"], limit=5)
+
+        assert searcher._embedder.batches == [["practice", "deep nets"]]
+
+    def test_disabled(self, make_searcher) -> None:
+        """A zero-size cache stores nothing."""
+        searcher = make_searcher()
+        searcher._result_cache.max_entries = 0
+        searcher.search("machine learning", limit=5)
+        assert len(searcher._result_cache) == 0
+
+
+class TestKeywordHitMetadata:
+    """Tests for metadata on keyword-only hits."""
+
+    @staticmethod
+    def _add_get(searcher) -> list[list[str]]:
+        from ragd.storage.types import VectorSearchResult
+
+        calls: list[list[str]] = []
+
+        def get(ids: list[str]):
+            calls.append(ids)
+            return [
+                VectorSearchResult(
+                    id=i,
+                    content="",
+                    score=1.0,
+                    metadata={"filename": "practice.txt", "chunk_index": 3, "page_number": 2},
+                )
+                if i == "doc2_chunk_0"
+                else None
+                for i in ids
+            ]
+
+        searcher._vector_store.get = get
+        return calls
+
+    @pytest.mark.parametrize("mode", [SearchMode.KEYWORD, SearchMode.HYBRID])
+    def test_keyword_hits_carry_metadata(self, make_searcher, mode: SearchMode) -> None:
+        """Keyword-only hits are hydrated with one batched lookup."""
+        searcher = make_searcher()
+        calls = self._add_get(searcher)
+
+        results = searcher.search("machine learning", limit=5, mode=mode)
+        hit = next(r for r in results if r.chunk_id == "doc2_chunk_0")
+
+        assert hit.document_name == "practice.txt"
+        assert hit.chunk_index == 3
+        assert hit.location is not None and hit.location.page_number == 2
+        assert calls == [["doc2_chunk_0"]]
+
+
+# =============================================================================
+# Searcher Pool Tests
+# =============================================================================
+
+
+class TestIndexGeneration:
+    """Tests for index generation counters."""
+
+    def test_unwritten_index_is_generation_zero(self, tmp_path: Path) -> None:
+        from ragd.storage.generation import read_generation
+
+        assert read_generation(tmp_path) == 0
+
+    def test_bm25_writes_bump_generation(self, temp_db: Path) -> None:
+        from ragd.storage.generation import read_generation
+
+        with BM25Index(temp_db) as index:
+            before = read_generation(temp_db.parent)
+            index.add_chunks("doc1", [("doc1_chunk_0", "Some text")])
+            added = read_generation(temp_db.parent)
+            index.delete_document("doc1")
+            deleted = read_generation(temp_db.parent)
+
+        assert before < added < deleted
+
+
+class TestSearcherPool:
+    """Tests for pooled long-lived searchers."""
+
+    @pytest.fixture
+    def pool(self):
+        from unittest.mock import MagicMock, patch
+
+        from ragd.search.hybrid import SearcherPool
+
+        with patch(
+            "ragd.search.hybrid.HybridSearcher",
+            side_effect=lambda config: MagicMock(config=config),
+        ):
+            pool = SearcherPool()
+            yield pool
+            pool.clear()
+
+    @pytest.fixture
+    def config(self, tmp_path: Path):
+        from ragd.config import RagdConfig
+
+        config = RagdConfig()
+        config.storage.data_dir = tmp_path
+        config.chroma_path.mkdir(parents=True)
+        return config
+
+    def test_reuses_searcher(self, pool, config) -> None:
+        """Repeated calls with the same config share one searcher."""
+        assert pool.get(config) is pool.get(config)
+        assert len(pool) == 1
+
+    def test_config_changes_get_separate_searchers(self, pool, config) -> None:
+        """Different configurations are pooled separately."""
+        first = pool.get(config)
+        other = config.model_copy(deep=True)
+        other.search_tuning.rrf_fetch_multiplier = 5
+        assert pool.get(other) is not first
+        assert len(pool) == 2
+
+    def test_index_write_invalidates(self, pool, config) -> None:
+        """A write to the index reopens the searcher."""
+        from ragd.storage.generation import bump_generation
+
+        first = pool.get(config)
+        bump_generation(config.chroma_path)
+        second = pool.get(config)
+
+        assert second is not first
+        assert pool.get(config) is second
+
+    def test_replaced_searcher_is_closed(self, pool, config) -> None:
+        """A searcher replaced after an index write is closed."""
+        from ragd.storage.generation import bump_generation
+
+        first = pool.get(config)
+        bump_generation(config.chroma_path)
+        pool.get(config)
+
+        first.close.assert_called_once()
+
+    def test_leased_searcher_closed_after_lease(self, pool, config) -> None:
+        """A replaced searcher stays open until its lease ends."""
+        from ragd.storage.generation import bump_generation
+
+        with pool.lease(config) as first:
+            bump_generation(config.chroma_path)
+            with pool.lease(config) as second:
+                assert second is not first
+            first.close.assert_not_called()
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+
+    def test_clear_closes_searchers(self, pool, config) -> None:
+        """Clearing the pool closes pooled searchers."""
+        searcher = pool.get(config)
+        pool.clear()
+        searcher.close.assert_called_once()
+        assert len(pool) == 0
+
+
+def test_hybrid_search_pushes_document_ids_down() -> None:
+    """The convenience function restricts retrieval, not the result list."""
+    from contextlib import nullcontext
+    from unittest.mock import MagicMock, patch
+
+    from ragd.search.hybrid import hybrid_search
+
+    searcher = MagicMock()
+    with patch("ragd.search.hybrid.lease_searcher", return_value=nullcontext(searcher)):
+        hybrid_search("query", document_ids=["doc1"])
+
+    assert searcher.search.call_args.kwargs["document_ids"] == ["doc1"]
@@ -0,0 +1,264 @@
+"""Tests for the incremental indexing manifest."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ragd.config import RagdConfig
+from ragd.ingestion.extractor import extract_text
+from ragd.ingestion.hashing import partial_file_hash
+from ragd.ingestion.manifest import IndexManifest, SourceFileState
+from ragd.ingestion.pipeline import SkipReason, index_path
+from ragd.storage.chromadb import generate_document_id
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(3):
+        path = tmp_path / "docs" / f"doc_{i}.txt"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"Document {i}. " + "Some searchable text. " * 20)
+        paths.append(path)
+    return paths
+
+
+def _record(manifest: IndexManifest, paths: list[Path]) -> None:
+    manifest.record(
+        [SourceFileState.from_path(p) for p in paths],
+        [generate_document_id(p) for p in paths],
+    )
+
+
+class TestPartialFileHash:
+    """Tests for partial_file_hash."""
+
+    def test_detects_edit_in_first_block(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.bin"
+        path.write_bytes(b"a" * 10_000)
+        before = partial_file_hash(path, block_size=1024)
+        path.write_bytes(b"b" + b"a" * 9_999)
+        assert partial_file_hash(path, block_size=1024) != before
+
+    def test_detects_edit_in_last_block(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.bin"
+        path.write_bytes(b"a" * 10_000)
+        before = partial_file_hash(path, block_size=1024)
+        path.write_bytes(b"a" * 9_999 + b"b")
+        assert partial_file_hash(path, block_size=1024) != before
+
+
+class TestIndexManifest:
+    """Tests for IndexManifest.scan and record."""
+
+    def test_unrecorded_files_are_changed(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            scan = manifest.scan(files)
+        assert scan.changed == files
+        assert set(scan.states) == set(files)
+
+    def test_recorded_files_are_unchanged(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            with patch("ragd.ingestion.manifest.partial_file_hash") as hashed:
+                scan = manifest.scan(files)
+        assert scan.unchanged == files
+        assert scan.changed == []
+        hashed.assert_not_called()
+
+    def test_modified_file_is_changed(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            files[1].write_text("Rewritten with different length.")
+            scan = manifest.scan(files)
+        assert scan.changed == [files[1]]
+        assert scan.unchanged == [files[0], files[2]]
+
+    def test_touched_file_is_changed(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            stat = files[0].stat()
+            os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert manifest.scan(files).changed == [files[0]]
+
+    def test_middle_edit_of_large_file_is_changed(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.txt"
+        path.write_bytes(b"a" * 1_000_000)
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, [path])
+            stat = path.stat()
+            # Same size, same first and last blocks, so the same partial hash
+            path.write_bytes(b"a" * 500_000 + b"b" + b"a" * 499_999)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert manifest.scan([path]).changed == [path]
+
+    def test_replaced_copy_is_unchanged(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            stat = files[0].stat()
+            copy = tmp_path / "copy.txt"
+            copy.write_bytes(files[0].read_bytes())
+            os.utime(copy, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(copy, files[0])
+            assert manifest.scan(files).unchanged == files
+
+            # The new inode is saved, so the next scan skips hashing
+            with patch("ragd.ingestion.manifest.partial_file_hash") as hashed:
+                assert manifest.scan(files).unchanged == files
+            hashed.assert_not_called()
+
+    def test_same_size_edit_is_changed(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            text = files[2].read_text()
+            files[2].write_text("X" + text[1:])
+            assert manifest.scan(files).changed == [files[2]]
+
+    def test_documents_missing_from_store_are_changed(
+        self, tmp_path: Path, files: list[Path]
+    ) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            indexed = {generate_document_id(files[0])}
+            scan = manifest.scan(files, indexed_ids=indexed)
+        assert scan.unchanged == [files[0]]
+        assert scan.changed == files[1:]
+
+    def test_forget(self, tmp_path: Path, files: list[Path]) -> None:
+        with IndexManifest(tmp_path / "manifest.db") as manifest:
+            _record(manifest, files)
+            manifest.forget([files[0]])
+            assert manifest.count() == 2
+            assert manifest.scan(files).changed == [files[0]]
+
+
+class FakeEmbedder:
+    """Deterministic embedder that avoids loading a model."""
+
+    model_name = "fake"
+    dimension = 4
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t)), 0.0, 0.0, 1.0] for t in texts]
+
+
+class FakeStore:
+    """In-memory stand-in for ChromaStore, shared across runs."""
+
+    documents: dict[str, Any] = {}
+
+    def __init__(self, persist_directory: Path) -> None:
+        pass
+
+    def find_by_content_hash(self, content_hash: str) -> Any:
+        for record in self.documents.values():
+            if record.content_hash == content_hash:
+                return record
+        return None
+
+    def list_document_ids(self) -> set[str]:
+        return set(self.documents)
+
+    def add_document(self, document_id: str, document_record: Any, **_: Any) -> None:
+        self.documents[document_id] = document_record
+
+
+class TestIncrementalIndexPath:
+    """Tests for manifest use in index_path."""
+
+    @pytest.fixture
+    def config(self, tmp_path: Path) -> RagdConfig:
+        cfg = RagdConfig()
+        cfg.storage.data_dir = tmp_path / "data"
+        cfg.chunking.min_chunk_size = 10
+        cfg.indexing.workers = 1
+        return cfg
+
+    @pytest.fixture(autouse=True)
+    def fakes(self) -> Any:
+        FakeStore.documents = {}
+        with (
+            patch("ragd.ingestion.pipeline.ChromaStore", FakeStore),
+            patch("ragd.ingestion.pipeline.get_embedder", return_value=FakeEmbedder()),
+        ):
+            yield
+
+    def test_second_run_skips_unchanged_files(
+        self, files: list[Path], config: RagdConfig
+    ) -> None:
+        directory = files[0].parent
+        first = index_path(directory, config=config)
+        assert [r.skipped for r in first] == [False, False, False]
+
+        files[1].write_text("Edited document. " + "Other searchable text. " * 20)
+        progress: list[tuple[int, int, str]] = []
+        with patch("ragd.ingestion.pipeline.extract_text", wraps=extract_text) as extract:
+            second = index_path(
+                directory,
+                config=config,
+                progress_callback=lambda c, t, f: progress.append((c, t, f)),
+            )
+
+        assert [r.path for r in second] == [str(f) for f in files]
+        assert [r.skip_reason for r in second] == [
+            SkipReason.UNCHANGED,
+            None,
+            SkipReason.UNCHANGED,
+        ]
+        assert [call.args[0] for call in extract.call_args_list] == [files[1]]
+        assert progress == [(3, 3, files[1].name), (3, 3, "")]
+
+    def test_disabled_reindexes_everything(
+        self, files: list[Path], config: RagdConfig
+    ) -> None:
+        config.indexing.incremental = False
+        index_path(files[0].parent, config=config)
+
+        results = index_path(files[0].parent, config=config)
+
+        # Files are extracted again and only caught by the content hash
+        assert [r.skip_reason for r in results] == [SkipReason.DUPLICATE_CONTENT] * 3
+
+    def test_records_duplicates_when_store_predates_manifest(
+        self, files: list[Path], config: RagdConfig
+    ) -> None:
+        config.indexing.incremental = False
+        index_path(files[0].parent, config=config)
+        config.indexing.incremental = True
+
+        # No manifest yet, so every file is caught by the content hash
+        second = index_path(files[0].parent, config=config)
+        assert [r.skip_reason for r in second] == [SkipReason.DUPLICATE_CONTENT] * 3
+
+        with patch("ragd.ingestion.pipeline.extract_text", wraps=extract_text) as extract:
+            third = index_path(files[0].parent, config=config)
+        assert [r.skip_reason for r in third] == [SkipReason.UNCHANGED] * 3
+        extract.assert_not_called()
+
+    def test_records_duplicate_under_original_document(
+        self, files: list[Path], config: RagdConfig
+    ) -> None:
+        directory = files[0].parent
+        index_path(directory, config=config)
+        copy = directory / "copy.txt"
+        copy.write_bytes(files[0].read_bytes())
+
+        def copy_result(results: list[Any]) -> Any:
+            return next(r for r in results if r.path == str(copy))
+
+        duplicate = copy_result(index_path(directory, config=config))
+        assert duplicate.skip_reason == SkipReason.DUPLICATE_CONTENT
+        assert duplicate.duplicate_id == generate_document_id(files[0])
+
+        # Unchanged while the original is indexed, re-checked once it is gone
+        third = copy_result(index_path(directory, config=config))
+        assert third.skip_reason == SkipReason.UNCHANGED
+        del FakeStore.documents[generate_document_id(files[0])]
+        with patch("ragd.ingestion.pipeline.extract_text", wraps=extract_text) as extract:
+            index_path(directory, config=config)
+        assert copy in [call.args[0] for call in extract.call_args_list]
@@ -12,9 +12,13 @@ import pytest
 from ragd.embedding.late_chunking import (
     ChunkBoundary,
     LateChunkingEmbedder,
+    assign_windows,
     check_late_chunking_available,
     create_late_chunking_embedder,
+    map_char_spans_to_tokens,
+    plan_windows,
 )
+from ragd.ingestion.chunker import SentenceChunker
 
 
 class TestChunkBoundary:
@@ -215,3 +219,121 @@ class TestLateChunkingLogic:
         assert isinstance(models, dict)
         assert "jinaai/jina-embeddings-v2-base-en" in models
         assert "jinaai/jina-embeddings-v2-small-en" in models
+
+
+class TestSlidingWindows:
+    """Tests for windowed late chunking of long documents."""
+
+    def test_short_document_single_window(self):
+        """Documents within the context use one window."""
+        assert plan_windows(100, 512, 64) == [(0, 100)]
+
+    def test_windows_cover_document_with_overlap(self):
+        """Windows overlap and the last one ends at the document end."""
+        windows = plan_windows(1000, 400, 100)
+        assert windows[0] == (0, 400)
+        assert windows[-1] == (600, 1000)
+        for (_, prev_end), (start, _) in zip(windows, windows[1:], strict=False):
+            assert start < prev_end
+        assert all(end - start == 400 for start, end in windows)
+
+    def test_chunk_assigned_to_containing_window(self):
+        """Each chunk is pooled from a window that fully contains it."""
+        windows = [(0, 400), (300, 700), (600, 1000)]
+        boundaries = [(0, 50), (450, 500), (650, 720), (950, 1000)]
+        assert assign_windows(boundaries, windows) == [0, 1, 2, 2]
+
+    def test_prefers_most_context(self):
+        """A chunk in the overlap goes to the window where it is most central."""
+        windows = [(0, 400), (300, 700)]
+        assert assign_windows([(360, 390)], windows) == [1]
+        assert assign_windows([(305, 320)], windows) == [0]
+
+    def test_embedder_window_settings(self):
+        """Window settings are stored on the embedder."""
+        embedder = LateChunkingEmbedder(window_overlap=128, window_batch_size=4)
+        assert embedder._window_overlap == 128
+        assert embedder._window_batch_size == 4
+
+
+def _scan_boundaries(offsets, spans):
+    """Reference linear-scan mapping the vectorised version must match."""
+    result = []
+    for char_start, char_end in spans:
+        start_token = end_token = None
+        for i, (tok_start, tok_end) in enumerate(offsets):
+            if tok_start == tok_end == 0:
+                continue
+            if start_token is None and tok_end > char_start:
+                start_token = i
+            if tok_start < char_end:
+                end_token = i + 1
+        result.append(
+            (0 if start_token is None else start_token,
+             len(offsets) if end_token is None else end_token)
+        )
+    return result
+
+
+class TestCharToTokenMapping:
+    """Tests for binary-search boundary mapping."""
+
+    def test_word_tokens(self):
+        """Spans map to the tokens they overlap."""
+        # "Hello world again" tokenised per word
+        offsets = [(0, 5), (6, 11), (12, 17)]
+        starts, ends = map_char_spans_to_tokens(offsets, [0, 6, 8], [5, 17, 9])
+        assert starts.tolist() == [0, 1, 1]
+        assert ends.tolist() == [1, 3, 2]
+
+    def test_special_tokens_ignored(self):
+        """(0, 0) offsets are skipped but indices stay sequence-relative."""
+        offsets = [(0, 0), (0, 5), (6, 11), (0, 0)]
+        starts, ends = map_char_spans_to_tokens(offsets, [6], [11])
+        assert (starts.tolist(), ends.tolist()) == ([2], [3])
+
+    def test_matches_linear_scan(self):
+        """Vectorised mapping agrees with a per-token scan."""
+        import random
+
+        rng = random.Random(0)
+        offsets = [(0, 0)]
+        pos = 0
+        for _ in range(300):
+            pos += rng.randint(0, 2)
+            length = rng.randint(1, 6)
+            offsets.append((pos, pos + length))
+            pos += length
+        offsets.append((0, 0))
+
+        spans = []
+        for _ in range(200):
+            a = rng.randint(0, pos + 5)
+            spans.append((a, a + rng.randint(0, 40)))
+
+        starts, ends = map_char_spans_to_tokens(
+            offsets, [a for a, _ in spans], [b for _, b in spans]
+        )
+        pairs = list(zip(starts.tolist(), ends.tolist(), strict=True))
+        assert pairs == _scan_boundaries(offsets, spans)
+
+    def test_no_tokens(self):
+        """Empty offsets fall back to the full (empty) sequence."""
+        starts, ends = map_char_spans_to_tokens([], [0], [10])
+        assert (starts.tolist(), ends.tolist()) == ([0], [0])
+
+    def test_chunker_spans_map_to_chunk_words(self):
+        """Chunk offsets select exactly the tokens of each chunk's words."""
+        import re
+
+        text = "Opening line here.\n\nSecond paragraph starts.   It continues. " * 20
+        chunks = SentenceChunker(chunk_size=30, overlap=5, min_chunk_size=5).chunk(text)
+        words = list(re.finditer(r"\S+", text))
+        offsets = [(m.start(), m.end()) for m in words]
+
+        starts, ends = map_char_spans_to_tokens(
+            offsets, [c.start_char for c in chunks], [c.end_char for c in chunks]
+        )
+        assert len(chunks) > 1
+        for chunk, start, end in zip(chunks, starts.tolist(), ends.tolist(), strict=True):
+            assert [m.group() for m in words[start:end]] == chunk.content.split()
@@ -332,6 +332,23 @@ class TestMetadataStore:
         assert "doc-002" in ids
         assert "doc-003" in ids
 
+    def test_list_data_tiers(self, store: MetadataStore) -> None:
+        """Test tiers are read without loading documents."""
+        store.set("doc-001", DocumentMetadata(ragd_data_tier="sensitive"))
+        store.set("doc-002", DocumentMetadata())
+        with store._connection() as conn:
+            conn.execute(
+                "INSERT INTO documents VALUES (?, ?, '', '')",
+                ("doc-003", json.dumps({"ragd_sensitivity": "confidential"})),
+            )
+            conn.commit()
+
+        assert store.list_data_tiers() == {
+            "doc-001": "sensitive",
+            "doc-002": "personal",
+            "doc-003": "sensitive",
+        }
+
     def test_count(self, store: MetadataStore) -> None:
         """Test counting documents."""
         assert store.count() == 0
@@ -0,0 +1,206 @@
+"""Tests for the staged parallel indexing pipeline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ragd.config import RagdConfig
+from ragd.ingestion.parallel import resolve_worker_count, run_staged_pipeline
+from ragd.ingestion.pipeline import SkipReason, index_document
+from ragd.search.bm25 import BM25Index
+
+
+class FakeEmbedder:
+    """Deterministic embedder that avoids loading a model."""
+
+    model_name = "fake"
+    dimension = 4
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t)), 0.0, 0.0, 1.0] for t in texts]
+
+
+class FakeStore:
+    """In-memory stand-in for ChromaStore."""
+
+    def __init__(self) -> None:
+        self.documents: dict[str, Any] = {}
+
+    def find_by_content_hash(self, content_hash: str) -> Any:
+        for record in self.documents.values():
+            if record.content_hash == content_hash:
+                return record
+        return None
+
+    def delete_document(self, document_id: str) -> bool:
+        return self.documents.pop(document_id, None) is not None
+
+    def add_document(self, document_id: str, document_record: Any, **_: Any) -> None:
+        self.documents[document_id] = document_record
+
+
+PARAGRAPH = (
+    "Retrieval augmented generation combines search with language models. "
+    "Documents are chunked, embedded and stored for later lookup. "
+)
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> list[Path]:
+    """Create a small corpus with one duplicate and one empty file."""
+    files = []
+    for i in range(4):
+        path = tmp_path / f"doc_{i}.txt"
+        path.write_text(f"Document number {i}. " + PARAGRAPH * 4)
+        files.append(path)
+    duplicate = tmp_path / "doc_dup.txt"
+    duplicate.write_text(files[0].read_text())
+    files.append(duplicate)
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    files.append(empty)
+    return files
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> RagdConfig:
+    """Config with a temporary data directory."""
+    cfg = RagdConfig()
+    cfg.storage.data_dir = tmp_path / "data"
+    cfg.chunking.min_chunk_size = 10
+    return cfg
+
+
+@pytest.fixture
+def fake_embedder() -> Any:
+    """Patch the embedder used by both the sequential and staged paths."""
+    embedder = FakeEmbedder()
+    with (
+        patch("ragd.ingestion.pipeline.get_embedder", return_value=embedder),
+        patch("ragd.ingestion.parallel.get_embedder", return_value=embedder),
+    ):
+        yield embedder
+
+
+def _sequential(files: list[Path], config: RagdConfig, tmp_path: Path) -> list[Any]:
+    store = FakeStore()
+    with BM25Index(tmp_path / "seq_bm25.db") as bm25:
+        return [
+            index_document(f, store=store, config=config, bm25_index=bm25)  # type: ignore[arg-type]
+            for f in files
+        ]
+
+
+class TestResolveWorkerCount:
+    """Tests for worker count resolution."""
+
+    def test_explicit_workers(self, config: RagdConfig) -> None:
+        config.indexing.workers = 3
+        assert resolve_worker_count(config, 100) == 3
+
+    def test_capped_by_file_count(self, config: RagdConfig) -> None:
+        config.indexing.workers = 8
+        assert resolve_worker_count(config, 2) == 2
+
+    def test_auto_is_at_least_one(self, config: RagdConfig) -> None:
+        config.indexing.workers = 0
+        assert resolve_worker_count(config, 1) == 1
+        assert resolve_worker_count(config, 1000) >= 1
+
+
+class TestStagedPipeline:
+    """Tests for run_staged_pipeline."""
+
+    @pytest.mark.usefixtures("fake_embedder")
+    def test_matches_sequential_results(
+        self, corpus: list[Path], config: RagdConfig, tmp_path: Path
+    ) -> None:
+        expected = _sequential(corpus, config, tmp_path)
+
+        store = FakeStore()
+        progress: list[tuple[int, int, str]] = []
+        with BM25Index(tmp_path / "bm25.db") as bm25:
+            results = run_staged_pipeline(
+                corpus,
+                store=store,  # type: ignore[arg-type]
+                config=config,
+                workers=2,
+                bm25_index=bm25,
+                progress_callback=lambda c, t, f: progress.append((c, t, f)),
+            )
+            stats = bm25.get_stats()
+
+        assert [r.path for r in results] == [str(f) for f in corpus]
+        for got, want in zip(results, expected, strict=True):
+            assert got.success == want.success
+            assert got.skipped == want.skipped
+            assert got.chunk_count == want.chunk_count
+            assert got.skip_reason == want.skip_reason
+
+        assert stats["document_count"] == 4
+        assert len(store.documents) == 4
+        assert progress[-1] == (len(corpus), len(corpus), "")
+        assert [c for c, _, _ in progress[:-1]] == list(range(1, len(corpus) + 1))
+
+    @pytest.mark.usefixtures("fake_embedder")
+    def test_duplicate_within_run_is_skipped(
+        self, corpus: list[Path], config: RagdConfig
+    ) -> None:
+        results = run_staged_pipeline(
+            corpus,
+            store=FakeStore(),  # type: ignore[arg-type]
+            config=config,
+            workers=2,
+        )
+
+        duplicate = results[4]
+        assert duplicate.skipped
+        assert duplicate.skip_reason == SkipReason.DUPLICATE_CONTENT
+        assert duplicate.duplicate_of == str(corpus[0])
+
+    def test_stage_error_is_raised(
+        self, corpus: list[Path], config: RagdConfig, fake_embedder: FakeEmbedder
+    ) -> None:
+        with (
+            patch.object(
+                fake_embedder, "embed", side_effect=RuntimeError("embedding failed")
+            ),
+            pytest.raises(RuntimeError, match="embedding failed"),
+        ):
+            run_staged_pipeline(
+                corpus,
+                store=FakeStore(),  # type: ignore[arg-type]
+                config=config,
+                workers=2,
+            )
+
+    def test_documents_share_embedding_calls(
+        self, corpus: list[Path], config: RagdConfig
+    ) -> None:
+        calls: list[int] = []
+
+        class CountingEmbedder(FakeEmbedder):
+            def embed(self, texts: list[str]) -> list[list[float]]:
+                calls.append(len(texts))
+                return super().embed(texts)
+
+        store = FakeStore()
+        with patch(
+            "ragd.ingestion.parallel.get_embedder", return_value=CountingEmbedder()
+        ):
+            results = run_staged_pipeline(
+                corpus,
+                store=store,  # type: ignore[arg-type]
+                config=config,
+                workers=2,
+            )
+
+        embedded = [r for r in results if r.success and not r.skipped]
+        assert sum(calls) == sum(r.chunk_count for r in embedded)
+        assert len(calls) <= len(embedded)
+        for record in store.documents.values():
+            assert record.chunk_count > 0
@@ -1,5 +1,7 @@
 """Tests for text normalisation module."""
 
+import re
+
 import pytest
 
 from ragd.text import (
@@ -13,6 +15,10 @@ from ragd.text.normalise import (
     source_type_from_file_type,
 )
 from ragd.text.pdf_fixes import (
+    Rule,
+    RuleEngine,
+    WordRuleEngine,
+    fix_ligature_errors,
     fix_ocr_spelling,
     fix_spaced_letters,
     fix_spurious_newlines,
@@ -212,6 +218,54 @@ def test_fix_ocr_spelling_preserves_valid() -> None:
     assert result == text
 
 
+def test_fix_ocr_spelling_preserves_whitespace() -> None:
+    """Test OCR repair keeps line breaks and spacing intact."""
+    text = "tbe  first line\nfrorn the\tsecond"
+    result = fix_ocr_spelling(text)
+    assert result == "the  first line\nfrom the\tsecond"
+
+
+def test_rule_engine_first_rule_wins() -> None:
+    """Test earlier rules take priority at the same position."""
+    engine = RuleEngine([
+        Rule("first", r"ab", "X"),
+        Rule("second", r"abc", "Y"),
+        Rule("third", r"(\d)-(\d)", r"\2-\1"),
+    ])
+    text, labels = engine.apply("abc 1-2")
+    assert text == "Xc 2-1"
+    assert labels == ["first", "third"]
+
+
+def test_rule_engine_no_match() -> None:
+    """Test engine reports no labels when nothing matches."""
+    engine = RuleEngine([Rule("upper", r"[A-Z]+", str.lower)])
+    assert engine.apply("all lower case") == ("all lower case", [])
+
+
+def test_word_rule_engine_matches_sequential_rules() -> None:
+    """Test word rules give the same result as applying each rule in turn."""
+    rules = [
+        Rule("a", r"\bteh\b", "the"),
+        Rule("b", r"\bthe\b", "THE"),
+        Rule("c", r"fi\b", "fy", ignore_case=True),
+    ]
+    text = "teh cat saw the dog, Clarifi it"
+    expected = text
+    for rule in rules:
+        flags = re.IGNORECASE if rule.ignore_case else 0
+        expected = re.sub(rule.pattern, rule.replacement, expected, flags=flags)
+
+    result, labels = WordRuleEngine(rules).apply(text)
+    assert result == expected == "THE cat saw THE dog, Clarify it"
+    assert labels == ["a", "b", "c"]
+
+
+def test_fix_ligature_errors_in_text() -> None:
+    """Test ligature fixes apply across a passage."""
+    assert fix_ligature_errors("the iinal deiinition") == "the final definition"
+
+
 # =============================================================================
 # HTML Boilerplate Tests
 # =============================================================================
@@ -7,6 +7,7 @@ from ragd.utils.paths import (
     get_file_type,
     is_supported_file,
     discover_files,
+    iter_files,
     SUPPORTED_EXTENSIONS,
 )
 
@@ -118,6 +119,57 @@ class TestDiscoverFiles:
         files = discover_files(Path("/nonexistent/path"))
         assert len(files) == 0
 
+    def test_discover_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test symlinked files and directories are not followed."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.txt").write_text("content")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "doc.txt").write_text("content")
+        (root / "link.txt").symlink_to(outside / "secret.txt")
+        (root / "linked_dir").symlink_to(outside)
+
+        assert discover_files(root) == [root / "doc.txt"]
+
+    def test_discover_ignores_directories_named_like_files(self, tmp_path: Path) -> None:
+        """Test only regular files are returned."""
+        (tmp_path / "folder.md").mkdir()
+        (tmp_path / "folder.md" / "doc.md").write_text("content")
+
+        assert discover_files(tmp_path) == [tmp_path / "folder.md" / "doc.md"]
+
+
+class TestIterFiles:
+    """Tests for the streaming iter_files walker."""
+
+    def _tree(self, root: Path) -> list[Path]:
+        expected = []
+        for i in range(5):
+            directory = root / f"dir{i}" / "nested"
+            directory.mkdir(parents=True)
+            for name in ("a.txt", "b.PDF", "c.png"):
+                (directory / name).write_text("content")
+            expected += [directory / "a.txt", directory / "b.PDF"]
+        return sorted(expected)
+
+    def test_threaded_matches_sequential(self, tmp_path: Path) -> None:
+        """Test the thread pool walk finds the same files."""
+        expected = self._tree(tmp_path)
+
+        assert sorted(iter_files(tmp_path, workers=4)) == expected
+        assert sorted(iter_files(tmp_path, workers=1)) == expected
+
+    def test_streams_lazily(self, tmp_path: Path) -> None:
+        """Test files can be consumed before the walk finishes."""
+        self._tree(tmp_path)
+
+        walker = iter_files(tmp_path, workers=4)
+        first = next(walker)
+        walker.close()
+
+        assert first.suffix in {".txt", ".PDF"}
+
 
 class TestSupportedExtensions:
     """Tests for SUPPORTED_EXTENSIONS constant."""